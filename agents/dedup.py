@@ -95,6 +95,10 @@ def dedup_agent(state: AgentState) -> dict:
     - Filters out jobs older than MAX_AGE_DAYS
     - Filters out non-US locations
     - Filters out entries with missing required fields
+
+    Duplicates are tracked only for this run. Cross-run history lives in
+    tools/job_store.py: run_once() passes the deduped jobs to mark_seen(),
+    which flags (but keeps) previously seen postings.
     """
     normalized_jobs = state.get("normalized_jobs", [])
 
@@ -111,6 +115,19 @@ def dedup_agent(state: AgentState) -> dict:
     cutoff = datetime.now(timezone.utc) - timedelta(days=MAX_AGE_DAYS)
     print(f"[Dedup] Date filter: only jobs posted after {cutoff.strftime('%Y-%m-%d %H:%M UTC')}")
 
+    # Fixed-width UTC ISO strings sort chronologically, so the common API
+    # formats can be compared as strings without building a datetime.
+    cutoff_base = cutoff.strftime("%Y-%m-%dT%H:%M:%S")
+    cutoff_by_suffix = {
+        "+0000": cutoff_base + "+0000",
+        "+00:00": cutoff_base + "+00:00",
+        "Z": cutoff_base + "Z",
+    }
+
+    # Postings repeat a small set of locations, so classify each distinct
+    # string once instead of re-running the keyword scan per job.
+    us_location_cache: dict[str, bool] = {}
+
     seen_keys = set()
     unique_jobs = []
     filtered_by_date = 0
@@ -125,29 +142,40 @@ def dedup_agent(state: AgentState) -> dict:
         # Date filter
         date_posted = job.get("date_posted", "")
         if date_posted:
-            try:
-                # Parse ISO format: 2026-02-14T13:46:00+0000
-                if date_posted.endswith("+0000"):
-                    dt = datetime.strptime(date_posted, "%Y-%m-%dT%H:%M:%S%z")
-                else:
-                    dt = datetime.fromisoformat(date_posted.replace("Z", "+00:00"))
-
-                if dt < cutoff:
+            # Fast path: "YYYY-MM-DDTHH:MM:SS" + a UTC suffix → plain string compare
+            cutoff_iso = None
+            if len(date_posted) > 19 and date_posted[10] == "T":
+                cutoff_iso = cutoff_by_suffix.get(date_posted[19:])
+
+            if cutoff_iso is not None:
+                if date_posted < cutoff_iso:
                     filtered_by_date += 1
                     continue
-            except (ValueError, TypeError):
-                pass  # If date can't be parsed, keep the job
+            else:
+                try:
+                    # fromisoformat (3.11+) accepts "+0000" and "Z" directly and is
+                    # much faster than strptime, so one parse path covers the rest.
+                    dt = datetime.fromisoformat(date_posted)
+
+                    if dt < cutoff:
+                        filtered_by_date += 1
+                        continue
+                except (ValueError, TypeError):
+                    pass  # If date can't be parsed, keep the job
 
         # US-only location filter
         raw_location = job.get("location", "")
-        if not _is_us_location(raw_location):
+        is_us = us_location_cache.get(raw_location)
+        if is_us is None:
+            is_us = us_location_cache[raw_location] = _is_us_location(raw_location)
+        if not is_us:
             filtered_by_location += 1
             continue
 
-        # Build dedup key
+        # Build dedup key (a tuple avoids formatting a new string per job)
         company = job.get("company", "").lower().strip()
         location = raw_location.lower().strip()
-        dedup_key = f"{title.lower()}|{company}|{location}"
+        dedup_key = (title.lower(), company, location)
 
         if dedup_key not in seen_keys:
             seen_keys.add(dedup_key)
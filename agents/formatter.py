@@ -23,19 +23,40 @@ STANDARD_FIELDS = {
 }
 
 
+_STANDARD_KEYS = tuple(STANDARD_FIELDS)
+_STANDARD_KEY_SET = frozenset(STANDARD_FIELDS)
+_EMPTY_TEMPLATE = dict(STANDARD_FIELDS)
+
+
 def _standardize_job(job: dict) -> dict:
     """
     Standardize a job dict to have all fields in a consistent order.
     Missing fields are set to empty strings (never None).
     """
+    standardized = _EMPTY_TEMPLATE.copy()
+    for field in _STANDARD_KEYS:
+        value = job.get(field)
+        # Missing or None keeps the default
+        if value is None:
+            continue
+        # Strip whitespace from string values
+        if value.__class__ is str:
+            value = value.strip()
+        standardized[field] = value
+    return standardized
+
+
+def _standardize_complete_job(job: dict) -> dict:
+    """
+    Fast path of _standardize_job for jobs that already carry every
+    standard field: no template copy, no .get() fallbacks.
+    """
     standardized = {}
-    for field, default in STANDARD_FIELDS.items():
-        value = job.get(field, default)
-        # Replace None with empty string
+    for field in _STANDARD_KEYS:
+        value = job[field]
         if value is None:
             value = ""
-        # Strip whitespace from string values
-        if isinstance(value, str):
+        elif value.__class__ is str:
             value = value.strip()
         standardized[field] = value
     return standardized
@@ -52,9 +73,30 @@ def formatter_agent(state: AgentState) -> dict:
     scrape_results = state.get("scrape_results", {})
     output_dir = settings.output_dir
 
+    if not final_jobs:
+        # Nothing to save — still refresh the HTML report so the dashboard
+        # shows this run's source statuses instead of stale results
+        print("\n[Formatter] No jobs to format")
+        os.makedirs(output_dir, exist_ok=True)
+        html_path = os.path.join(output_dir, "jobs.html")
+        generate_html_report([], html_path, new_keys=new_keys, scrape_results=scrape_results)
+        print(f"[Formatter]   🌐 HTML: {html_path}")
+        if errors:
+            print(f"\n⚠️  Errors encountered during scraping:")
+            for error in errors:
+                print(f"  - {error}")
+        return {
+            "final_jobs": [],
+            "errors": [],
+        }
+
     # Step 1: Standardize all job fields
     print(f"\n[Formatter] Standardizing {len(final_jobs)} jobs...")
-    standardized_jobs = [_standardize_job(job) for job in final_jobs]
+    if all(_STANDARD_KEY_SET <= job.keys() for job in final_jobs):
+        standardize = _standardize_complete_job
+    else:
+        standardize = _standardize_job
+    standardized_jobs = [standardize(job) for job in final_jobs]
 
     # Step 2: Save to JSON
     print(f"[Formatter] Saving to {output_dir}/")
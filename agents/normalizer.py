@@ -1,17 +1,46 @@
 """
 Normalizer Agent — LLM-powered normalization of extracted job data.
-Standardizes formats and validates against the Job Pydantic model.
+Standardizes formats and validates against the Job model.
 """
 
 import json
 import re
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
+from concurrent.futures import ThreadPoolExecutor
 from config.settings import settings
-from models.job import Job
+from models.job import Job, JobList
 from models.state import AgentState
 
 
+# Decodes the first JSON value at a given offset and ignores whatever follows
+_JSON_DECODER = json.JSONDecoder()
+
+# A job-type qualifier standing on its own in a title: in parentheses or
+# brackets anywhere, or last after a separator ("SWE - Contract", "SWE,
+# Part-time"). Intern/internship and part/full-time may also simply end the
+# title ("Software Engineering Intern"); contract may not, since titles like
+# "Government Contract" or "Electrical Contractor" describe the role instead.
+_QUALIFIER = r"(intern(?:ship)?|contract(?:or)?|part[\s-]?time|full[\s-]?time)"
+_TYPE_QUALIFIER_RE = re.compile(
+    rf"[(\[]\s*{_QUALIFIER}\s*[)\]]"
+    rf"|[-–—,|:/]\s*{_QUALIFIER}\s*$"
+    r"|\s(intern(?:ship)?|part[\s-]?time|full[\s-]?time)\s*$",
+    re.IGNORECASE,
+)
+
+# Job type for a matched qualifier, by its first letter
+_TYPE_BY_INITIAL = {"i": "Internship", "c": "Contract", "p": "Part-time", "f": "Full-time"}
+
+# Fields longer than this are likely scraped page noise, not a clean value
+_MAX_CLEAN_FIELD_LEN = 120
+
+# Batch packing: jobs per LLM call are limited by an estimated token budget
+# (~4 chars per token) and a hard cap, since small models lose track of long
+# arrays. FALLBACK_BATCH_SIZE is used when a packed batch comes back short.
+CHARS_PER_TOKEN = 4
+MAX_BATCH_JOBS = 10
+FALLBACK_BATCH_SIZE = 3
+
+
 NORMALIZER_SYSTEM_PROMPT = """You are a data normalizer for job listings. Your job is to clean and standardize job data.
 
 INSTRUCTIONS:
@@ -35,12 +64,178 @@ Raw job data:
 Return ONLY a JSON array of normalized job objects."""
 
 
+def _apply_defaults(job_data: dict, source_name: str) -> dict:
+    """Fill in the minimal fields every job needs (in place) and return it."""
+    if "source" not in job_data:
+        job_data["source"] = source_name
+    if "job_type" not in job_data:
+        job_data["job_type"] = ""
+    if "date_posted" not in job_data:
+        job_data["date_posted"] = None
+    return job_data
+
+
+def _infer_job_type(title: str) -> str | None:
+    """Return the job type the title states as a qualifier, or None if it doesn't."""
+    match = _TYPE_QUALIFIER_RE.search(title)
+    if match is None:
+        return None
+    qualifier = next(group for group in match.groups() if group)
+    return _TYPE_BY_INITIAL[qualifier[0].lower()]
+
+
+def _is_clean(job_data: dict) -> bool:
+    """True if title/company/location look like plain values (no markup, sane length)."""
+    for field in ("title", "company", "location"):
+        value = job_data.get(field)
+        if not isinstance(value, str) or not value.strip():
+            return False
+        if len(value) > _MAX_CLEAN_FIELD_LEN or "<" in value or ">" in value:
+            return False
+    return True
+
+
+def _pack_batches(jobs: list[dict], max_tokens: int) -> list[list[dict]]:
+    """
+    Greedily group jobs into batches whose estimated prompt size stays within
+    max_tokens (and at most MAX_BATCH_JOBS jobs). Order is preserved.
+    """
+    batches = []
+    current = []
+    current_tokens = 0
+    for job in jobs:
+        tokens = len(json.dumps(job, separators=(",", ":"), ensure_ascii=False)) // CHARS_PER_TOKEN + 1
+        if current and (current_tokens + tokens > max_tokens or len(current) >= MAX_BATCH_JOBS):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(job)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _build_prompt(batch: list[dict]) -> list:
+    """Build the chat messages asking the LLM to normalize one batch of jobs."""
+    from langchain_core.messages import SystemMessage, HumanMessage
+
+    # Compact JSON keeps the prompt token count down
+    jobs_json = json.dumps(batch, separators=(",", ":"), ensure_ascii=False)
+    return [
+        SystemMessage(content=NORMALIZER_SYSTEM_PROMPT),
+        HumanMessage(
+            content=NORMALIZER_USER_PROMPT.format(jobs_json=jobs_json)
+        ),
+    ]
+
+
+def _parse_response(response_text: str):
+    """
+    Decode the JSON value in an LLM reply (markdown fences and any text after
+    the first JSON array are ignored).
+
+    Raises:
+        json.JSONDecodeError: if the reply has no decodable JSON.
+    """
+    response_text = response_text.strip()
+
+    # Remove markdown code blocks if present
+    _, sep, rest = response_text.partition("```json")
+    if not sep:
+        _, sep, rest = response_text.partition("```")
+    if sep:
+        response_text, _, _ = rest.partition("```")
+        response_text = response_text.strip()
+
+    # Decode the first JSON array; trailing text after it is ignored
+    start = response_text.find("[")
+    if start == -1:
+        return json.loads(response_text)
+    return _JSON_DECODER.raw_decode(response_text, start)[0]
+
+
+def _normalize_batch(llm, batch: list[dict], batch_num: int, total_batches: int) -> list[dict]:
+    """
+    Send one batch of jobs to the LLM and return the normalized job dicts.
+    Falls back to the original batch if the call fails or the output is unusable.
+    """
+    print(f"[Normalizer] Processing batch {batch_num}/{total_batches} ({len(batch)} jobs)...")
+
+    try:
+        response = llm.invoke(_build_prompt(batch))
+        if isinstance(response, JobList):
+            return [job.to_dict() for job in response.jobs]
+
+        batch_normalized = _parse_response(response.content)
+
+        if isinstance(batch_normalized, list):
+            return batch_normalized
+        elif isinstance(batch_normalized, dict):
+            return [batch_normalized]
+        else:
+            # If structure is wrong, fall back to original for this batch
+            print(f"[Normalizer] Batch {batch_num} returned invalid structure, using original data.")
+            return batch
+
+    except (json.JSONDecodeError, Exception) as e:
+        # If LLM normalization fails for this batch, fall back to basic normalization
+        print(f"[Normalizer] Batch {batch_num} failed: {e}. Using basic normalization for this batch.")
+        return batch
+
+
+def _normalize_with_llm(jobs: list[dict]) -> list[dict]:
+    """Normalize jobs through the LLM in small, concurrent batches (order preserved)."""
+    # Imported here so API-only runs never pay the LangChain/OpenAI import cost
+    from langchain_openai import ChatOpenAI
+
+    # Initialize the LLM
+    llm = ChatOpenAI(
+        base_url=settings.llm_base_url,
+        api_key="lm-studio",
+        model=settings.llm_model_name,
+        temperature=0.3,  # Lower temperature for more consistent normalization
+        max_tokens=settings.llm_max_tokens,
+        timeout=120,  # 120s timeout — 8B model can be slow
+    )
+    if settings.llm_structured_output:
+        # Constrain decoding to the JobList schema — no fence/regex parsing needed
+        llm = llm.with_structured_output(JobList, method="json_schema")
+
+    # Pack as many jobs per call as the token budget allows, so the system
+    # prompt is paid once per batch rather than once per few jobs
+    batches = _pack_batches(jobs, settings.llm_max_tokens // 2)
+    total_batches = len(batches)
+    normalized = []
+
+    def run(n: int) -> list[dict]:
+        batch = batches[n]
+        result = _normalize_batch(llm, batch, n + 1, total_batches)
+        if len(result) == len(batch) or len(batch) <= FALLBACK_BATCH_SIZE:
+            return result
+        # The model dropped or merged jobs — redo this group in small batches
+        print(f"[Normalizer] Batch {n + 1} returned {len(result)}/{len(batch)} jobs, retrying in small batches...")
+        retried = []
+        for i in range(0, len(batch), FALLBACK_BATCH_SIZE):
+            retried.extend(_normalize_batch(llm, batch[i : i + FALLBACK_BATCH_SIZE], n + 1, total_batches))
+        return retried
+
+    # Batches are independent, network-bound LLM calls — keep several in flight.
+    # pool.map yields results in submission order, so output order is unchanged.
+    workers = max(1, min(settings.normalizer_concurrency, total_batches))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for batch_normalized in pool.map(run, range(total_batches)):
+            normalized.extend(batch_normalized)
+
+    return normalized
+
+
 def normalizer_agent(state: AgentState) -> dict:
     """
     Normalize extracted job data using LLM.
 
     Takes raw extracted jobs, sends them to the LLM for normalization,
-    then validates each job against the Pydantic model.
+    then validates each job against the Job model.
     """
     extracted_jobs = state.get("extracted_jobs", [])
     current_page = state.get("current_page", {})
@@ -56,16 +251,11 @@ def normalizer_agent(state: AgentState) -> dict:
     if settings.skip_normalization:
         print(f"[Normalizer] ⏭️  Skipping normalization (requested by user)")
         # Just validate structure and pass through
-        validated_jobs = []
         for job_data in extracted_jobs:
-            # Ensure minimal fields
-            job_data.setdefault("source", source_name)
-            job_data.setdefault("job_type", "")
-            job_data.setdefault("date_posted", None)
-            validated_jobs.append(job_data)
-        
+            _apply_defaults(job_data, source_name)
+
         return {
-            "normalized_jobs": validated_jobs,
+            "normalized_jobs": extracted_jobs,
             "errors": [],
         }
 
@@ -76,92 +266,43 @@ def normalizer_agent(state: AgentState) -> dict:
     if page_type == "api":
         print(f"[Normalizer] ⏭️  Skipping LLM normalization for API source: {source_name}")
         # Just validate structure and pass through
-        validated_jobs = []
         for job_data in extracted_jobs:
-            # Ensure minimal fields
-            job_data.setdefault("source", source_name)
-            job_data.setdefault("job_type", "")
-            job_data.setdefault("date_posted", None)
-            validated_jobs.append(job_data)
-        
+            _apply_defaults(job_data, source_name)
+
         return {
-            "normalized_jobs": validated_jobs,
+            "normalized_jobs": extracted_jobs,
             "errors": [],
         }
 
     print(f"[Normalizer] Normalizing {len(extracted_jobs)} jobs from {source_name}...")
 
-    # Initialize the LLM
-    llm = ChatOpenAI(
-        base_url=settings.llm_base_url,
-        api_key="lm-studio",
-        model=settings.llm_model_name,
-        temperature=0.3,  # Lower temperature for more consistent normalization
-        max_tokens=settings.llm_max_tokens,
-        timeout=120,  # 120s timeout — 8B model can be slow
-    )
-
-    # Process jobs in batches to avoid hitting context limits
-    BATCH_SIZE = 3
-    total_jobs = len(extracted_jobs)
+    # Jobs whose title already states the type and whose fields are clean
+    # don't need the LLM — pass them straight through
     normalized_raw_all = []
-    
-    for i in range(0, total_jobs, BATCH_SIZE):
-        batch = extracted_jobs[i : i + BATCH_SIZE]
-        print(f"[Normalizer] Processing batch {i//BATCH_SIZE + 1}/{(total_jobs + BATCH_SIZE - 1)//BATCH_SIZE} ({len(batch)} jobs)...")
-
-        # Build the prompt for this batch
-        jobs_json = json.dumps(batch, indent=2)
-        messages = [
-            SystemMessage(content=NORMALIZER_SYSTEM_PROMPT),
-            HumanMessage(
-                content=NORMALIZER_USER_PROMPT.format(jobs_json=jobs_json)
-            ),
-        ]
+    llm_jobs = []
+    for job_data in extracted_jobs:
+        job_type = _infer_job_type(job_data.get("title") or "") if _is_clean(job_data) else None
+        if job_type:
+            # A type the parser already extracted wins over the title's
+            if not job_data.get("job_type"):
+                job_data["job_type"] = job_type
+            normalized_raw_all.append(job_data)
+        else:
+            llm_jobs.append(job_data)
+    if normalized_raw_all:
+        print(f"[Normalizer] {len(normalized_raw_all)} jobs already clean, {len(llm_jobs)} sent to LLM")
 
-        try:
-            response = llm.invoke(messages)
-            response_text = response.content.strip()
-
-            # Parse the response
-            # Remove markdown code blocks if present
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[-1].split("```")[0].strip()
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0].strip()
-
-            # Find JSON array
-            match = re.search(r"\[.*\]", response_text, re.DOTALL)
-            if match:
-                response_text = match.group(0)
-
-            batch_normalized = json.loads(response_text)
-
-            if isinstance(batch_normalized, list):
-                normalized_raw_all.extend(batch_normalized)
-            elif isinstance(batch_normalized, dict):
-                normalized_raw_all.append(batch_normalized)
-            else:
-                # If structure is wrong, fall back to original for this batch
-                print(f"[Normalizer] Batch {i//BATCH_SIZE + 1} returned invalid structure, using original data.")
-                normalized_raw_all.extend(batch)
-
-        except (json.JSONDecodeError, Exception) as e:
-            # If LLM normalization fails for this batch, fall back to basic normalization
-            print(f"[Normalizer] Batch {i//BATCH_SIZE + 1} failed: {e}. Using basic normalization for this batch.")
-            normalized_raw_all.extend(batch)
-
-    # Validate each job against the Pydantic model
+    if llm_jobs:
+        normalized_raw_all.extend(_normalize_with_llm(llm_jobs))
+
+    # Validate each job against the Job model
     validated_jobs = []
     for job_data in normalized_raw_all:
         try:
-            # Ensure source is set
-            job_data.setdefault("source", source_name)
-            job_data.setdefault("job_type", "")
-            job_data.setdefault("date_posted", None)
+            _apply_defaults(job_data, source_name)
 
-            job = Job(**job_data)
-            validated_jobs.append(job.model_dump())
+            job = Job.from_dict(job_data)
+            validated_jobs.append(job.to_dict())
         except Exception as e:
             print(f"[Normalizer] Validation failed for job: {e}")
             # Still include the raw data
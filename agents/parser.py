@@ -4,13 +4,15 @@ Uses Qwen3 8B via LM Studio to identify and extract job postings.
 """
 
 import json
-import re
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import SystemMessage, HumanMessage
 from config.settings import settings
+from models.job import JobList
 from models.state import AgentState
 
 
+# Decodes the first JSON value at a given offset and ignores whatever follows
+_JSON_DECODER = json.JSONDecoder()
+
+
 PARSER_SYSTEM_PROMPT = """You are a job listing extractor. Your job is to extract job postings from the provided text content of a career/jobs page.
 
 IMPORTANT INSTRUCTIONS:
@@ -46,19 +48,22 @@ def _parse_llm_response(response_text: str) -> list[dict]:
     text = response_text.strip()
 
     # Remove markdown code blocks if present
-    if "```json" in text:
-        text = text.split("```json")[-1].split("```")[0].strip()
-    elif "```" in text:
-        text = text.split("```")[1].split("```")[0].strip()
+    _, sep, rest = text.partition("```json")
+    if not sep:
+        _, sep, rest = text.partition("```")
+    if sep:
+        text, _, _ = rest.partition("```")
+        text = text.strip()
 
-    # Try to find a JSON array in the response
-    # Look for content between [ and ]
-    match = re.search(r"\[.*\]", text, re.DOTALL)
-    if match:
-        text = match.group(0)
+    # Decode the first JSON array in the response; trailing text or a
+    # second array after it is ignored
+    start = text.find("[")
 
     try:
-        result = json.loads(text)
+        if start == -1:
+            result = json.loads(text)
+        else:
+            result, _ = _JSON_DECODER.raw_decode(text, start)
         if isinstance(result, list):
             return result
         elif isinstance(result, dict):
@@ -103,6 +108,10 @@ def parser_agent(state: AgentState) -> dict:
 
     print(f"[Parser] Sending {len(cleaned_text)} chars to LLM for extraction...")
 
+    # Imported here so API-only runs never pay the LangChain/OpenAI import cost
+    from langchain_openai import ChatOpenAI
+    from langchain_core.messages import SystemMessage, HumanMessage
+
     # Initialize the LLM (points to LM Studio)
     llm = ChatOpenAI(
         base_url=settings.llm_base_url,
@@ -112,6 +121,9 @@ def parser_agent(state: AgentState) -> dict:
         max_tokens=settings.llm_max_tokens,
         timeout=120,  # 120s timeout — 8B model can be slow
     )
+    if settings.llm_structured_output:
+        # Constrain decoding to the JobList schema — no fence/regex parsing needed
+        llm = llm.with_structured_output(JobList, method="json_schema")
 
     # Build the prompt
     messages = [
@@ -132,12 +144,16 @@ def parser_agent(state: AgentState) -> dict:
     for attempt in range(max_attempts):
         try:
             response = llm.invoke(messages)
-            response_text = response.content
 
-            print(f"[Parser] LLM raw response ({len(response_text)} chars):")
-            print(f"[Parser]   >>> {response_text[:500]}")
+            if isinstance(response, JobList):
+                extracted_jobs = [job.to_dict() for job in response.jobs]
+            else:
+                response_text = response.content
+
+                print(f"[Parser] LLM raw response ({len(response_text)} chars):")
+                print(f"[Parser]   >>> {response_text[:500]}")
 
-            extracted_jobs = _parse_llm_response(response_text)
+                extracted_jobs = _parse_llm_response(response_text)
 
             if extracted_jobs:
                 print(f"[Parser] Extracted {len(extracted_jobs)} jobs")
@@ -157,7 +173,7 @@ def parser_agent(state: AgentState) -> dict:
     # Add source info to each job
     for job in extracted_jobs:
         job["source"] = source_name
-        if not job.get("url") and source_url:
+        if source_url and not job.get("url"):
             job["url"] = source_url
 
     return {
@@ -3,611 +3,522 @@ Scraper Agent — fetches job data from career pages.
 Supports two modes:
   1. API mode — fetches structured JSON from known API endpoints
   2. HTML mode — fetches raw HTML and extracts text (fallback)
+
+API providers are table-driven: PROVIDERS maps a marker in the API URL to a
+ProviderSpec describing how to request one page, parse it, and find the next.
 """
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
+from urllib.parse import urlparse, urlsplit
 from tools.web_scraper import fetch_page
-from tools.text_extractor import extract_text, extract_job_links
+from tools.text_extractor import extract_text_and_links
 from tools.api_fetcher import fetch_jobs_from_api, fetch_jobs_from_api_post, parse_github_careers_api, parse_amazon_jobs_api, parse_eightfold_jobs_api, parse_workday_jobs_api, parse_lever_jobs_api, parse_greenhouse_jobs_api, parse_oracle_hcm_jobs_api, parse_phenom_jobs_api, parse_goldmansachs_jobs_api, parse_epam_jobs_api, fetch_apple_jobs, parse_apple_jobs_api, fetch_servicenow_jobs
 from models.state import AgentState
 
 
-def scraper_agent(state: AgentState) -> dict:
-    """
-    Scrape the current page. Uses API if available, otherwise falls back to HTML scraping.
-    """
-    current_page = state.get("current_page", {})
-    url = current_page.get("url", "")
-    name = current_page.get("name", "Unknown")
-    page_type = current_page.get("type", "career_page")
-    api_url = current_page.get("api_url", "")
-    keywords = current_page.get("keywords", "")
-
-    if not url and not api_url:
-        return {
-            "raw_html": "",
-            "cleaned_text": "",
-            "extracted_jobs": [],
-            "errors": [f"No URL found for page: {name}"],
-        }
-
-    # ── API Mode ─────────────────────────────────────────────────
-    if page_type == "api" and api_url:
-        print(f"[Scraper] 🔌 {name} (API)")
-
-        # Detect which API type we're dealing with
-        is_amazon = "amazon.jobs" in api_url
-        is_eightfold = "pcsx/search" in api_url
-        is_workday = "myworkdayjobs.com" in api_url
-        is_lever = "api.lever.co" in api_url
-        is_greenhouse = "boards-api.greenhouse.io" in api_url
-        is_oracle_hcm = "oraclecloud.com" in api_url
-        is_phenom = "/widgets" in api_url
-        is_goldman_sachs = "api-higher.gs.com" in api_url
-        is_epam = "careers.epam.com" in api_url
-        is_apple = "jobs.apple.com" in api_url
-        is_servicenow = "careers.servicenow.com" in api_url
-
-        # Fetch all pages from the API
-        all_jobs = []
-
-        if is_amazon:
-            # Amazon uses offset-based pagination
-            offset = 0
-            limit = 10
-
-            while True:
-                params = {
-                    "offset": offset,
-                    "result_limit": limit,
-                    "sort": "recent",
-                    "category[]": "software-development",
-                    "country[]": "USA",
-                }
-
-                result = fetch_jobs_from_api(api_url, params=params)
-
-                if not result["success"]:
-                    print(f"[Scraper] API failed: {result['error']}")
-                    return {
-                        "raw_html": "",
-                        "cleaned_text": "",
-                        "extracted_jobs": [],
-                        "errors": [f"API fetch failed for {name}: {result['error']}"],
-                    }
-
-                data = result["data"]
-                total_hits = data.get("hits", 0)
-
-                # Parse jobs from this page
-                page_jobs = parse_amazon_jobs_api(data, name)
-                all_jobs.extend(page_jobs)
-
-
-
-                # Check if we have all jobs
-                if len(all_jobs) >= total_hits or len(page_jobs) == 0:
-                    break
-
-                if offset >= 500:
-                    # Safety limit
-                    break
-
-                offset += limit
-
-        elif is_eightfold:
-            # Eightfold (pcsx/search) uses start-based pagination with domain param
-            # Used by: Microsoft, Ford, and other Eightfold-powered career sites
-            start = 0
-            page_size = 20
-
-            # Use domain from config, or extract from API URL as fallback
-            eightfold_domain = current_page.get("domain", "")
-            if not eightfold_domain:
-                from urllib.parse import urlparse
-                parsed = urlparse(api_url)
-                eightfold_domain = parsed.hostname or ""
-
-            # Extract base URL for job links
-            from urllib.parse import urlparse as _urlparse
-            _parsed = _urlparse(api_url)
-            base_job_url = f"{_parsed.scheme}://{_parsed.hostname}"
-
-            while True:
-                params = {
-                    "domain": eightfold_domain,
-                    "query": keywords or "Software Engineer",
-                    "location": "United States",
-                    "start": start,
-                    "sort_by": "timestamp",
-                    "filter_include_remote": "1",
-                }
-
-                result = fetch_jobs_from_api(api_url, params=params)
-
-                if not result["success"]:
-                    print(f"[Scraper] API failed: {result['error']}")
-                    return {
-                        "raw_html": "",
-                        "cleaned_text": "",
-                        "extracted_jobs": [],
-                        "errors": [f"API fetch failed for {name}: {result['error']}"],
-                    }
-
-                data = result["data"]
-                total_count = data.get("data", {}).get("total", 0)
-                positions = data.get("data", {}).get("positions", [])
+log = logging.getLogger("Scraper")
 
-                # Parse jobs from this page
-                page_jobs = parse_eightfold_jobs_api(data, name, base_job_url)
-                all_jobs.extend(page_jobs)
+# Max concurrent page requests per API board (keeps us clear of rate limits)
+MAX_PAGE_WORKERS = 5
 
+# Safety limit on how deep we page into any one board
+MAX_OFFSET = 500
 
 
-                # Check if we have all jobs (handle APIs that return total=0)
-                if len(positions) == 0:
-                    break
-
-                if total_count > 0 and len(all_jobs) >= total_count:
-                    break
-
-                if start >= 500:
-                    # Safety limit
-                    break
-
-                start += len(positions)
-
-        elif is_workday:
-            # Workday uses POST with JSON body and offset-based pagination
-            offset = 0
-            limit = 20
-            # Extract base URL for building job links (e.g. https://geico.wd1.myworkdayjobs.com/External)
-            base_url = api_url.rsplit("/wday/", 1)[0] + "/" + api_url.split("/wday/cxs/")[1].split("/jobs")[0].split("/", 1)[1]
-
-            while True:
-                body = {
-                    "limit": limit,
-                    "offset": offset,
-                    "searchText": keywords or "",
-                }
-
-                result = fetch_jobs_from_api_post(api_url, json_body=body)
-
-                if not result["success"]:
-                    print(f"[Scraper] API failed: {result['error']}")
-                    return {
-                        "raw_html": "",
-                        "cleaned_text": "",
-                        "extracted_jobs": [],
-                        "errors": [f"API fetch failed for {name}: {result['error']}"],
-                    }
-
-                data = result["data"]
-                total_count = data.get("total", 0)
-
-                # Parse jobs from this page
-                page_jobs = parse_workday_jobs_api(data, name, base_url)
-                all_jobs.extend(page_jobs)
-
-
-
-                # Check if we have all jobs
-                if len(all_jobs) >= total_count or len(page_jobs) == 0:
-                    break
-
-                if offset >= 500:
-                    # Safety limit
-                    break
-
-                offset += limit
+@dataclass(frozen=True)
+class ProviderSpec:
+    """
+    How to page through one career-site API.
 
-        elif is_lever:
-            # Lever uses skip-based pagination
-            skip = 0
-            limit = 100
+    Every callable receives ctx, a dict with the page config ("page"), "api_url",
+    "name", "keywords", plus whatever the provider's prepare() adds.
 
-            while True:
-                params = {"skip": skip, "limit": limit, "mode": "json"}
+    Pagination is either:
+      - remaining(data, ctx): all cursors after the first, known from the first
+        response's total — fetched concurrently, or
+      - next_cursor(cursor, data, page_jobs, all_jobs): the next cursor, or None
+        when done — fetched one page at a time.
+    """
 
-                result = fetch_jobs_from_api(api_url, params=params)
+    fetch: Callable[[dict, int], dict]
+    parse: Callable[[dict, dict], list[dict]]
+    first_cursor: int = 0
+    remaining: Callable[[dict, dict], range] | None = None
+    next_cursor: Callable[[int, dict, list, list], int | None] | None = None
+    prepare: Callable[[dict], dict] | None = None
+    error_label: str = "API fetch failed"
+
+
+def _base_url(api_url: str) -> str:
+    """scheme://host of an API URL (used to build job links)."""
+    parsed = urlparse(api_url)
+    return f"{parsed.scheme}://{parsed.hostname}"
+
+
+def _until_total(step: int, total_of: Callable[[dict], int]):
+    """next_cursor for boards that report a total (0 = unknown) and stop at MAX_OFFSET jobs."""
+    def next_cursor(cursor, data, page_jobs, all_jobs):
+        total_count = total_of(data)
+        if len(page_jobs) == 0 or (total_count > 0 and len(all_jobs) >= total_count):
+            return None
+        if len(all_jobs) >= MAX_OFFSET:
+            return None
+        return cursor + step
+    return next_cursor
+
+
+# ── Amazon — offset-based pagination ───────────────────────────
+_AMAZON_LIMIT = 10
+
+AMAZON = ProviderSpec(
+    fetch=lambda ctx, offset: fetch_jobs_from_api(ctx["api_url"], params={
+        "offset": offset,
+        "result_limit": _AMAZON_LIMIT,
+        "sort": "recent",
+        "category[]": "software-development",
+        "country[]": "USA",
+    }),
+    parse=lambda data, ctx: parse_amazon_jobs_api(data, ctx["name"]),
+    remaining=lambda data, ctx: range(_AMAZON_LIMIT, min(data.get("hits", 0), MAX_OFFSET + 1), _AMAZON_LIMIT),
+)
+
+
+# ── Eightfold (pcsx/search) — start-based pagination with domain param ──
+# Used by: Microsoft, Ford, and other Eightfold-powered career sites
+def _eightfold_prepare(ctx: dict) -> dict:
+    # Use domain from config, or the API host as fallback
+    domain = ctx["page"].get("domain", "") or urlparse(ctx["api_url"]).hostname or ""
+    return {"domain": domain, "base_url": _base_url(ctx["api_url"])}
+
+
+def _eightfold_next(start, data, page_jobs, all_jobs):
+    # Handle APIs that return total=0
+    positions = data.get("data", {}).get("positions", [])
+    total_count = data.get("data", {}).get("total", 0)
+    if len(positions) == 0:
+        return None
+    if total_count > 0 and len(all_jobs) >= total_count:
+        return None
+    if start >= MAX_OFFSET:
+        return None
+    return start + len(positions)
+
+
+EIGHTFOLD = ProviderSpec(
+    prepare=_eightfold_prepare,
+    fetch=lambda ctx, start: fetch_jobs_from_api(ctx["api_url"], params={
+        "domain": ctx["domain"],
+        "query": ctx["keywords"] or "Software Engineer",
+        "location": "United States",
+        "start": start,
+        "sort_by": "timestamp",
+        "filter_include_remote": "1",
+    }),
+    parse=lambda data, ctx: parse_eightfold_jobs_api(data, ctx["name"], ctx["base_url"]),
+    next_cursor=_eightfold_next,
+)
+
+
+# ── Workday — POST with JSON body, offset-based pagination ─────
+# Workday only reports the total on the first page.
+_WORKDAY_LIMIT = 20
+
+
+@lru_cache(maxsize=64)
+def _workday_base_url(api_url: str) -> str:
+    """Base URL for building job links (e.g. https://geico.wd1.myworkdayjobs.com/External)."""
+    # .../wday/cxs/<tenant>/<site>/jobs → .../<site>
+    parts = urlsplit(api_url)
+    prefix, _, rest = parts.path.partition("/wday/cxs/")
+    site = rest.partition("/jobs")[0].partition("/")[2]
+    return f"{parts.scheme}://{parts.netloc}{prefix}/{site}"
+
+
+def _workday_prepare(ctx: dict) -> dict:
+    return {
+        "base_url": _workday_base_url(ctx["api_url"]),
+        # Only "offset" changes between pages
+        "base_body": {"limit": _WORKDAY_LIMIT, "searchText": ctx["keywords"] or ""},
+    }
 
-                if not result["success"]:
-                    print(f"[Scraper] API failed: {result['error']}")
-                    return {
-                        "raw_html": "",
-                        "cleaned_text": "",
-                        "extracted_jobs": [],
-                        "errors": [f"API fetch failed for {name}: {result['error']}"],
-                    }
 
-                data = result["data"]
-                # Lever returns a flat list
-                if not isinstance(data, list):
-                    data = []
+WORKDAY = ProviderSpec(
+    prepare=_workday_prepare,
+    fetch=lambda ctx, offset: fetch_jobs_from_api_post(ctx["api_url"], json_body={**ctx["base_body"], "offset": offset}),
+    parse=lambda data, ctx: parse_workday_jobs_api(data, ctx["name"], ctx["base_url"]),
+    remaining=lambda data, ctx: range(_WORKDAY_LIMIT, min(data.get("total", 0), MAX_OFFSET + 1), _WORKDAY_LIMIT),
+)
 
-                page_jobs = parse_lever_jobs_api(data, name)
-                all_jobs.extend(page_jobs)
 
+# ── Lever — skip-based pagination (returns a flat list) ────────
+_LEVER_LIMIT = 100
 
 
-                if len(page_jobs) < limit:
-                    break
+def _lever_next(skip, data, page_jobs, all_jobs):
+    if len(page_jobs) < _LEVER_LIMIT or skip >= MAX_OFFSET:
+        return None
+    return skip + _LEVER_LIMIT
 
-                if skip >= 500:
-                    # Safety limit
-                    break
 
-                skip += limit
+LEVER = ProviderSpec(
+    fetch=lambda ctx, skip: fetch_jobs_from_api(ctx["api_url"], params={"skip": skip, "limit": _LEVER_LIMIT, "mode": "json"}),
+    parse=lambda data, ctx: parse_lever_jobs_api(data if isinstance(data, list) else [], ctx["name"]),
+    next_cursor=_lever_next,
+)
 
-        elif is_greenhouse:
-            # Greenhouse uses page-based pagination
-            page_num = 1
 
-            while True:
-                params = {"page": page_num}
+# ── Greenhouse — page-based pagination ─────────────────────────
+def _greenhouse_next(page_num, data, page_jobs, all_jobs):
+    if len(page_jobs) == 0 or page_num >= 10:
+        return None
+    return page_num + 1
 
-                result = fetch_jobs_from_api(api_url, params=params)
 
-                if not result["success"]:
-                    print(f"[Scraper] API failed: {result['error']}")
-                    return {
-                        "raw_html": "",
-                        "cleaned_text": "",
-                        "extracted_jobs": [],
-                        "errors": [f"API fetch failed for {name}: {result['error']}"],
-                    }
+GREENHOUSE = ProviderSpec(
+    first_cursor=1,
+    fetch=lambda ctx, page_num: fetch_jobs_from_api(ctx["api_url"], params={"page": page_num}),
+    parse=lambda data, ctx: parse_greenhouse_jobs_api(data, ctx["name"]),
+    next_cursor=_greenhouse_next,
+)
 
-                data = result["data"]
-                total_count = data.get("meta", {}).get("total", 0)
 
-                page_jobs = parse_greenhouse_jobs_api(data, name)
-                all_jobs.extend(page_jobs)
+# ── Oracle Cloud HCM — offset-based pagination with finder params ──
+_ORACLE_LIMIT = 25
 
 
+def _oracle_prepare(ctx: dict) -> dict:
+    # siteNumber from config (defaults to CX_1001)
+    return {
+        "base_url": _base_url(ctx["api_url"]),
+        "site_number": ctx["page"].get("site_number", "CX_1001"),
+    }
 
-                if len(page_jobs) == 0:
-                    break
 
-                if page_num >= 10:
-                    # Safety limit
-                    break
+def _oracle_total(data: dict) -> int:
+    items = data.get("items", [])
+    return items[0].get("TotalJobsCount", 0) if items else 0
 
-                page_num += 1
 
-        elif is_oracle_hcm:
-            # Oracle Cloud HCM uses offset-based pagination with finder params
-            offset = 0
-            limit = 25
+ORACLE_HCM = ProviderSpec(
+    prepare=_oracle_prepare,
+    fetch=lambda ctx, offset: fetch_jobs_from_api(ctx["api_url"], params={
+        "onlyData": "true",
+        "expand": "requisitionList.secondaryLocations,flexFieldsFacet.values",
+        "finder": f"findReqs;siteNumber={ctx['site_number']},facetsList=LOCATIONS;WORK_LOCATIONS;WORKPLACE_TYPES;TITLES;CATEGORIES;ORGANIZATIONS;UNPOSTING_DATE,limit={_ORACLE_LIMIT},offset={offset},keyword={ctx['keywords'] or 'software engineer'},sortBy=POSTING_DATES_DESC",
+    }),
+    parse=lambda data, ctx: parse_oracle_hcm_jobs_api(data, ctx["name"], ctx["base_url"], ctx["site_number"]),
+    remaining=lambda data, ctx: range(_ORACLE_LIMIT, min(_oracle_total(data), MAX_OFFSET + 1), _ORACLE_LIMIT),
+)
 
-            # Extract base URL for building job links
-            from urllib.parse import urlparse as _oracle_parse
-            _op = _oracle_parse(api_url)
-            oracle_base_url = f"{_op.scheme}://{_op.hostname}"
 
-            # Get siteNumber from config (defaults to CX_1001)
-            site_number = current_page.get("site_number", "CX_1001")
+# ── Phenom People (used by Adobe) — POST with refineSearch body ──
+_PHENOM_PAGE_SIZE = 20
 
-            while True:
-                params = {
-                    "onlyData": "true",
-                    "expand": "requisitionList.secondaryLocations,flexFieldsFacet.values",
-                    "finder": f"findReqs;siteNumber={site_number},facetsList=LOCATIONS;WORK_LOCATIONS;WORKPLACE_TYPES;TITLES;CATEGORIES;ORGANIZATIONS;UNPOSTING_DATE,limit={limit},offset={offset},keyword={keywords or 'software engineer'},sortBy=POSTING_DATES_DESC",
-                }
 
-                result = fetch_jobs_from_api(api_url, params=params)
-
-                if not result["success"]:
-                    print(f"[Scraper] API failed: {result['error']}")
-                    return {
-                        "raw_html": "",
-                        "cleaned_text": "",
-                        "extracted_jobs": [],
-                        "errors": [f"API fetch failed for {name}: {result['error']}"],
-                    }
-
-                data = result["data"]
-                items = data.get("items", [])
-                total_count = items[0].get("TotalJobsCount", 0) if items else 0
-
-                page_jobs = parse_oracle_hcm_jobs_api(data, name, oracle_base_url, site_number)
-
-                all_jobs.extend(page_jobs)
-
-
-
-                if len(page_jobs) == 0 or len(all_jobs) >= total_count:
-                    break
-
-                if offset >= 500:
-                    # Safety limit
-                    break
-
-                offset += limit
-
-        elif is_phenom:
-            # Phenom People (used by Adobe) — POST with refineSearch body
-            from_offset = 0
-            page_size = 20
-
-            from urllib.parse import urlparse as _phenom_parse
-            _pp = _phenom_parse(api_url)
-            base_url = f"{_pp.scheme}://{_pp.hostname}"
-
-            # Read country filter from config or default to US
-            country_filter = current_page.get("country", "United States of America")
-
-            while True:
-                body = {
-                    "lang": "en_us",
-                    "deviceType": "desktop",
-                    "country": "us",
-                    "pageName": "search-results",
-                    "ddoKey": "refineSearch",
-                    "sortBy": "",
-                    "from": from_offset,
-                    "jobs": True,
-                    "counts": True,
-                    "all_fields": ["category", "country", "state", "city", "type", "subtype"],
-                    "size": page_size,
-                    "clear498": False,
-                    "jdsource": "facets",
-                    "is498": True,
-                    "keywords": keywords or "Software Engineer",
-                    "global": True,
-                    "selected_fields": {
-                        "country": [country_filter]
-                    },
-                    "locationData": {},
-                }
+def _phenom_prepare(ctx: dict) -> dict:
+    base_url = _base_url(ctx["api_url"])
+    return {
+        "base_url": base_url,
+        # Country filter from config, default to US
+        "country": ctx["page"].get("country", "United States of America"),
+        "headers": {
+            "Referer": ctx["page"].get("url", base_url),
+            "Origin": base_url,
+        },
+    }
 
-                result = fetch_jobs_from_api_post(
-                    api_url, json_body=body,
-                    headers={
-                        "Referer": current_page.get("url", base_url),
-                        "Origin": base_url,
-                    }
-                )
-
-                if not result["success"]:
-                    print(f"[Scraper] API failed: {result['error']}")
-                    return {
-                        "raw_html": "",
-                        "cleaned_text": "",
-                        "extracted_jobs": [],
-                        "errors": [f"API fetch failed for {name}: {result['error']}"],
-                    }
-
-                data = result["data"]
-                total_hits = data.get("refineSearch", {}).get("totalHits", 0)
-
-                page_jobs = parse_phenom_jobs_api(data, name, base_url)
-                all_jobs.extend(page_jobs)
-
-
-
-                if len(page_jobs) == 0 or len(all_jobs) >= total_hits:
-                    break
-
-                if from_offset >= 500:
-                    # Safety limit
-                    break
-
-                from_offset += page_size
-
-        elif is_goldman_sachs:
-            # Goldman Sachs — GraphQL API with page-based pagination
-            page_num = 0
-            page_size = 20
-
-            while True:
-                body = {
-                    "operationName": "GetRoles",
-                    "variables": {
-                        "searchQueryInput": {
-                            "page": {"pageSize": page_size, "pageNumber": page_num},
-                            "sort": {"sortStrategy": "POSTED_DATE", "sortOrder": "DESC"},
-                            "filters": [],
-                            "experiences": ["EARLY_CAREER", "PROFESSIONAL"],
-                            "searchTerm": keywords or "Software Engineer",
-                        }
-                    },
-                    "query": "query GetRoles($searchQueryInput: RoleSearchQueryInput!) { roleSearch(searchQueryInput: $searchQueryInput) { totalCount items { roleId corporateTitle jobTitle jobFunction locations { primary state country city __typename } status division skills jobType { code description __typename } externalSource { sourceId __typename } __typename } __typename } }",
-                }
 
-                result = fetch_jobs_from_api_post(
-                    api_url, json_body=body,
-                    headers={
-                        "Origin": "https://higher.gs.com",
-                        "Referer": "https://higher.gs.com/",
-                    }
-                )
-
-                if not result["success"]:
-                    print(f"[Scraper] API failed: {result['error']}")
-                    return {
-                        "raw_html": "",
-                        "cleaned_text": "",
-                        "extracted_jobs": [],
-                        "errors": [f"API fetch failed for {name}: {result['error']}"],
-                    }
-
-                data = result["data"]
-                total_count = data.get("data", {}).get("roleSearch", {}).get("totalCount", 0)
-
-                page_jobs = parse_goldmansachs_jobs_api(data, name)
-                all_jobs.extend(page_jobs)
-
-
-
-                if len(page_jobs) == 0 or (total_count > 0 and len(all_jobs) >= total_count):
-                    break
-
-                if len(all_jobs) >= 500:
-                    # Safety limit
-                    break
-
-                page_num += 1
-
-        elif is_epam:
-            # EPAM Anywhere — custom REST API with x-anywhere-tenant header
-            from_offset = 0
-            page_size = 20
-
-            epam_headers = {
-                "x-anywhere-tenant": "anywhere",
-            }
-
-            while True:
-                params = {
-                    "q": keywords or "Software Engineer",
-                    "facets": "country=4000602900000005338",
-                    "from": from_offset,
-                    "size": page_size,
-                    "lang": "en",
-                    "websiteLocale": "en-us",
-                    "sortBy": "relevance;relocation=asc",
+PHENOM = ProviderSpec(
+    prepare=_phenom_prepare,
+    fetch=lambda ctx, from_offset: fetch_jobs_from_api_post(
+        ctx["api_url"],
+        json_body={
+            "lang": "en_us",
+            "deviceType": "desktop",
+            "country": "us",
+            "pageName": "search-results",
+            "ddoKey": "refineSearch",
+            "sortBy": "",
+            "from": from_offset,
+            "jobs": True,
+            "counts": True,
+            "all_fields": ["category", "country", "state", "city", "type", "subtype"],
+            "size": _PHENOM_PAGE_SIZE,
+            "clear498": False,
+            "jdsource": "facets",
+            "is498": True,
+            "keywords": ctx["keywords"] or "Software Engineer",
+            "global": True,
+            "selected_fields": {
+                "country": [ctx["country"]]
+            },
+            "locationData": {},
+        },
+        headers=ctx["headers"],
+    ),
+    parse=lambda data, ctx: parse_phenom_jobs_api(data, ctx["name"], ctx["base_url"]),
+    remaining=lambda data, ctx: range(
+        _PHENOM_PAGE_SIZE,
+        min(data.get("refineSearch", {}).get("totalHits", 0), MAX_OFFSET + 1),
+        _PHENOM_PAGE_SIZE,
+    ),
+)
+
+
+# ── Goldman Sachs — GraphQL API with page-based pagination ─────
+_GS_PAGE_SIZE = 20
+_GS_QUERY = "query GetRoles($searchQueryInput: RoleSearchQueryInput!) { roleSearch(searchQueryInput: $searchQueryInput) { totalCount items { roleId corporateTitle jobTitle jobFunction locations { primary state country city __typename } status division skills jobType { code description __typename } externalSource { sourceId __typename } __typename } __typename } }"
+
+GOLDMAN_SACHS = ProviderSpec(
+    fetch=lambda ctx, page_num: fetch_jobs_from_api_post(
+        ctx["api_url"],
+        json_body={
+            "operationName": "GetRoles",
+            "variables": {
+                "searchQueryInput": {
+                    "page": {"pageSize": _GS_PAGE_SIZE, "pageNumber": page_num},
+                    "sort": {"sortStrategy": "POSTED_DATE", "sortOrder": "DESC"},
+                    "filters": [],
+                    "experiences": ["EARLY_CAREER", "PROFESSIONAL"],
+                    "searchTerm": ctx["keywords"] or "Software Engineer",
                 }
+            },
+            "query": _GS_QUERY,
+        },
+        headers={
+            "Origin": "https://higher.gs.com",
+            "Referer": "https://higher.gs.com/",
+        },
+    ),
+    parse=lambda data, ctx: parse_goldmansachs_jobs_api(data, ctx["name"]),
+    next_cursor=_until_total(1, lambda data: data.get("data", {}).get("roleSearch", {}).get("totalCount", 0)),
+)
+
+
+# ── EPAM Anywhere — custom REST API with x-anywhere-tenant header ──
+_EPAM_PAGE_SIZE = 20
+
+
+def _epam_next(from_offset, data, page_jobs, all_jobs):
+    total_count = data.get("data", {}).get("total", 0)
+    if len(page_jobs) == 0 or (total_count > 0 and len(all_jobs) >= total_count):
+        return None
+    if from_offset >= MAX_OFFSET:
+        return None
+    return from_offset + _EPAM_PAGE_SIZE
+
+
+EPAM = ProviderSpec(
+    fetch=lambda ctx, from_offset: fetch_jobs_from_api(
+        ctx["api_url"],
+        params={
+            "q": ctx["keywords"] or "Software Engineer",
+            "facets": "country=4000602900000005338",
+            "from": from_offset,
+            "size": _EPAM_PAGE_SIZE,
+            "lang": "en",
+            "websiteLocale": "en-us",
+            "sortBy": "relevance;relocation=asc",
+        },
+        headers={"x-anywhere-tenant": "anywhere"},
+    ),
+    parse=lambda data, ctx: parse_epam_jobs_api(data, ctx["name"]),
+    next_cursor=_epam_next,
+)
+
+
+# ── Apple — custom API with CSRF token flow ────────────────────
+APPLE = ProviderSpec(
+    first_cursor=1,
+    fetch=lambda ctx, page_num: fetch_apple_jobs(keywords=ctx["keywords"] or "Software Engineer", page=page_num),
+    parse=lambda data, ctx: parse_apple_jobs_api(data, ctx["name"]),
+    next_cursor=_until_total(1, lambda data: data.get("res", data).get("totalRecords", 0)),
+)
+
+
+# ── ServiceNow — SSR HTML scraping with page-based pagination ──
+SERVICENOW = ProviderSpec(
+    first_cursor=1,
+    fetch=lambda ctx, page_num: fetch_servicenow_jobs(keywords=ctx["keywords"] or "Software Engineer", page=page_num, page_size=20),
+    parse=lambda data, ctx: data.get("jobs", []),
+    next_cursor=_until_total(1, lambda data: data.get("total", 0)),
+    error_label="Fetch failed",
+)
+
+
+# ── GitHub-style page-based pagination (default) ───────────────
+_GITHUB_LIMIT = 50
+
+
+def _github_prepare(ctx: dict) -> dict:
+    # Only "page" changes between pages
+    base_params = {"limit": _GITHUB_LIMIT, "sortBy": "posted_date", "descending": "true"}
+    if ctx["keywords"]:
+        base_params["keywords"] = ctx["keywords"]
+    return {"base_params": base_params}
+
+
+def _github_fetch(ctx: dict, page_num: int) -> dict:
+    return fetch_jobs_from_api(ctx["api_url"], params={**ctx["base_params"], "page": page_num})
+
+
+GITHUB = ProviderSpec(
+    first_cursor=1,
+    prepare=_github_prepare,
+    fetch=_github_fetch,
+    parse=lambda data, ctx: parse_github_careers_api(data, ctx["name"]),
+    # Enough pages to cover the reported total, up to a 10-page safety limit
+    remaining=lambda data, ctx: range(2, min(-(-data.get("totalCount", 0) // _GITHUB_LIMIT), 10) + 1),
+)
+
+
+# API URL marker → provider, checked in order; GITHUB is the fallback
+PROVIDERS = (
+    ("amazon.jobs", AMAZON),
+    ("pcsx/search", EIGHTFOLD),
+    ("myworkdayjobs.com", WORKDAY),
+    ("api.lever.co", LEVER),
+    ("boards-api.greenhouse.io", GREENHOUSE),
+    ("oraclecloud.com", ORACLE_HCM),
+    ("/widgets", PHENOM),
+    ("api-higher.gs.com", GOLDMAN_SACHS),
+    ("careers.epam.com", EPAM),
+    ("jobs.apple.com", APPLE),
+    ("careers.servicenow.com", SERVICENOW),
+)
+
+
+@lru_cache(maxsize=256)
+def _provider_for(api_url: str) -> ProviderSpec:
+    """Pick the ProviderSpec whose marker appears in the API URL."""
+    return next((spec for marker, spec in PROVIDERS if marker in api_url), GITHUB)
+
+
+def _fetch_all_pages(fetch, first_cursor, remaining_cursors):
+    """
+    Fetch the first page, then all remaining pages concurrently.
 
-                result = fetch_jobs_from_api(api_url, params=params, headers=epam_headers)
-
-                if not result["success"]:
-                    print(f"[Scraper] API failed: {result['error']}")
-                    return {
-                        "raw_html": "",
-                        "cleaned_text": "",
-                        "extracted_jobs": [],
-                        "errors": [f"API fetch failed for {name}: {result['error']}"],
-                    }
-
-                data = result["data"]
-                total_count = data.get("data", {}).get("total", 0)
-
-                page_jobs = parse_epam_jobs_api(data, name)
-                all_jobs.extend(page_jobs)
-
-
-
-                if len(page_jobs) == 0 or (total_count > 0 and len(all_jobs) >= total_count):
-                    break
-
-                if from_offset >= 500:
-                    # Safety limit
-                    break
-
-                from_offset += page_size
-
-        elif is_apple:
-            # Apple — custom API with CSRF token flow
-            page_num = 1
-
-            while True:
-                result = fetch_apple_jobs(keywords=keywords or "Software Engineer", page=page_num)
-
-                if not result["success"]:
-                    print(f"[Scraper] API failed: {result['error']}")
-                    return {
-                        "raw_html": "",
-                        "cleaned_text": "",
-                        "extracted_jobs": [],
-                        "errors": [f"API fetch failed for {name}: {result['error']}"],
-                    }
-
-                data = result["data"]
-                res = data.get("res", data)
-                total_count = res.get("totalRecords", 0)
-
-                page_jobs = parse_apple_jobs_api(data, name)
-                all_jobs.extend(page_jobs)
-
-
-
-                if len(page_jobs) == 0 or (total_count > 0 and len(all_jobs) >= total_count):
-                    break
-
-                if len(all_jobs) >= 500:
-                    # Safety limit
-                    break
-
-                page_num += 1
-
-        elif is_servicenow:
-            # ServiceNow — SSR HTML scraping with page-based pagination
-            page_num = 1
-            page_size = 20
-
-            while True:
-                result = fetch_servicenow_jobs(keywords=keywords or "Software Engineer", page=page_num, page_size=page_size)
-
-                if not result["success"]:
-                    print(f"[Scraper] API failed: {result['error']}")
-                    return {
-                        "raw_html": "",
-                        "cleaned_text": "",
-                        "extracted_jobs": [],
-                        "errors": [f"Fetch failed for {name}: {result['error']}"],
-                    }
-
-                data = result["data"]
-                total_count = data.get("total", 0)
-                page_jobs = data.get("jobs", [])
-                all_jobs.extend(page_jobs)
-
+    The first response reports the board's total, so remaining_cursors(data)
+    can list every other page cursor up front. Yields fetch results in page
+    order and stops after the first failure.
+    """
+    first = fetch(first_cursor)
+    yield first
+    if not first["success"]:
+        return
+
+    cursors = list(remaining_cursors(first["data"]))
+    if not cursors:
+        return
+    with ThreadPoolExecutor(max_workers=min(MAX_PAGE_WORKERS, len(cursors))) as pool:
+        for result in pool.map(fetch, cursors):
+            yield result
+            if not result["success"]:
+                return
+
+
+def _fetch_sequential_pages(fetch, first_cursor, parse, next_cursor, all_jobs: list) -> str:
+    """
+    Fetch pages one at a time, asking next_cursor for the following cursor,
+    and append their jobs to all_jobs (the same list next_cursor inspects).
 
+    Stops after the first failure, or when a page repeats the previous one
+    (some boards keep returning their last page for any offset past the end).
 
-                if len(page_jobs) == 0 or (total_count > 0 and len(all_jobs) >= total_count):
-                    break
+    Returns:
+        The error message of the failed fetch, or "" on success.
+    """
+    prev_ids = None
+    cursor = first_cursor
+    while cursor is not None:
+        result = fetch(cursor)
+        if not result["success"]:
+            return result["error"]
+        page_jobs = parse(result["data"])
+        # URL and title together — some providers' rows have no URL, and an
+        # all-empty page of URLs must not look like a repeat
+        page_ids = tuple((job.get("url", ""), job.get("title", "")) for job in page_jobs)
+        if page_jobs and page_ids == prev_ids:
+            break
+        prev_ids = page_ids
+        all_jobs.extend(page_jobs)
+        cursor = next_cursor(cursor, result["data"], page_jobs, all_jobs)
+    return ""
+
+
+def paginate(spec: ProviderSpec, ctx: dict) -> tuple[list[dict], str]:
+    """
+    Fetch every page of a provider's API.
 
-                if len(all_jobs) >= 500:
-                    # Safety limit
-                    break
+    Returns:
+        (jobs, error) — error is "" on success; on failure jobs is empty.
+    """
+    if spec.prepare:
+        ctx.update(spec.prepare(ctx))
 
-                page_num += 1
+    def fetch(cursor):
+        return spec.fetch(ctx, cursor)
 
-        else:
-            # GitHub-style page-based pagination
-            page_num = 1
-            limit = 50
+    def parse(data):
+        return spec.parse(data, ctx)
 
-            while True:
-                params = {
-                    "page": page_num,
-                    "limit": limit,
-                    "sortBy": "posted_date",
-                    "descending": "true",
-                }
-                if keywords:
-                    params["keywords"] = keywords
+    # Pages are appended to a single list as they arrive — sequential
+    # providers fill it in place, so jobs are never copied into a second list
+    all_jobs = []
+    if spec.remaining:
+        for result in _fetch_all_pages(fetch, spec.first_cursor, lambda data: spec.remaining(data, ctx)):
+            if not result["success"]:
+                return [], result["error"]
+            all_jobs.extend(parse(result["data"]))
+    else:
+        error = _fetch_sequential_pages(fetch, spec.first_cursor, parse, spec.next_cursor, all_jobs)
+        if error:
+            return [], error
 
-                result = fetch_jobs_from_api(api_url, params=params)
+    return all_jobs, ""
 
-                if not result["success"]:
-                    print(f"[Scraper] API failed: {result['error']}")
-                    return {
-                        "raw_html": "",
-                        "cleaned_text": "",
-                        "extracted_jobs": [],
-                        "errors": [f"API fetch failed for {name}: {result['error']}"],
-                    }
 
-                data = result["data"]
-                total_count = data.get("totalCount", 0)
+def _error_result(message: str) -> dict:
+    """State update for a page that could not be scraped."""
+    return {
+        "raw_html": "",
+        "cleaned_text": "",
+        "extracted_jobs": [],
+        "errors": [message],
+    }
 
-                # Parse jobs from this page
-                page_jobs = parse_github_careers_api(data, name)
-                all_jobs.extend(page_jobs)
 
+def scraper_agent(state: AgentState) -> dict:
+    """
+    Scrape the current page. Uses API if available, otherwise falls back to HTML scraping.
+    """
+    current_page = state.get("current_page", {})
+    url = current_page.get("url", "")
+    name = current_page.get("name", "Unknown")
+    page_type = current_page.get("type", "career_page")
+    api_url = current_page.get("api_url", "")
+    keywords = current_page.get("keywords", "")
 
+    if not url and not api_url:
+        return _error_result(f"No URL found for page: {name}")
 
-                # Check if we have all jobs
-                if len(all_jobs) >= total_count or len(page_jobs) == 0:
-                    break
+    # ── API Mode ─────────────────────────────────────────────────
+    if page_type == "api" and api_url:
+        log.info("🔌 %s (API)", name)
 
-                if page_num >= 10:
-                    # Safety limit
-                    break
+        spec = _provider_for(api_url)
+        ctx = {"page": current_page, "api_url": api_url, "name": name, "keywords": keywords}
+        all_jobs, error = paginate(spec, ctx)
 
-                page_num += 1
+        if error:
+            log.warning("API failed: %s", error)
+            return _error_result(f"{spec.error_label} for {name}: {error}")
 
-        print(f"[Scraper] ✅ {name}: {len(all_jobs)} jobs")
+        log.info("✅ %s: %d jobs", name, len(all_jobs))
 
         # In API mode, we skip the parser (no LLM needed!) and go straight
         # to normalizer. We put the parsed jobs directly into extracted_jobs.
@@ -621,11 +532,11 @@ def scraper_agent(state: AgentState) -> dict:
     # ── HTML Scrape Mode ─────────────────────────────────────────
     # ── Browser Mode (Playwright) ────────────────────────────────
     if page_type == "browser":
-        print(f"[Scraper] 🌐 {name} (Browser)")
+        log.info("🌐 %s (Browser)", name)
         from tools.browser_scraper import scrape_with_browser
 
         all_jobs = scrape_with_browser(url, name)
-        print(f"[Scraper] ✅ {name}: {len(all_jobs)} jobs")
+        log.info("✅ %s: %d jobs", name, len(all_jobs))
 
         return {
             "raw_html": "",
@@ -635,27 +546,19 @@ def scraper_agent(state: AgentState) -> dict:
         }
 
     # ── HTML Scrape Mode ─────────────────────────────────────────
-    print(f"[Scraper] 📄 {name} (HTML)")
+    log.info("📄 %s (HTML)", name)
 
     result = fetch_page(url)
 
     if not result["success"]:
-        print(f"[Scraper] ❌ {name}: {result['error']}")
-        return {
-            "raw_html": "",
-            "cleaned_text": "",
-            "errors": [f"Scraper failed for {name}: {result['error']}"],
-        }
+        log.warning("❌ %s: %s", name, result["error"])
+        return _error_result(f"Scraper failed for {name}: {result['error']}")
 
     raw_html = result["html"]
 
 
-    # Extract clean text
-    cleaned_text = extract_text(raw_html)
-
-
-    # Extract job-related links for additional context
-    job_links = extract_job_links(raw_html, url)
+    # Extract clean text, plus job-related links for additional context
+    cleaned_text, job_links = extract_text_and_links(raw_html, url)
     if job_links:
         links_text = "\n\nJob-related links found on this page:\n"
         for link in job_links[:20]:
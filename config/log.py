@@ -0,0 +1,46 @@
+"""
+Logging setup — routes log records through a queue to a background writer.
+
+Workers hand records to a QueueHandler (a cheap, non-blocking put) and a
+single QueueListener thread does the actual terminal writes, so one slow
+stdout write never stalls the other concurrent scrapers.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+from config.settings import settings
+
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def setup_logging(level: str = None) -> None:
+    """
+    Configure the root logger once (later calls are no-ops).
+
+    Args:
+        level: Log level name (defaults to settings.log_level / LOG_LEVEL).
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    # Same "[Agent] message" shape as the print() output elsewhere
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("[%(name)s] %(message)s"))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel((level or settings.log_level).upper())
+    # httpx logs every request at INFO — far too chatty with paginated APIs
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    # Flush whatever is still queued before the interpreter exits
+    atexit.register(_listener.stop)
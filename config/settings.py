@@ -30,6 +30,12 @@ class Settings:
     llm_max_tokens: int = field(
         default_factory=lambda: int(os.getenv("LLM_MAX_TOKENS") or "2048")
     )
+    llm_structured_output: bool = field(
+        default_factory=lambda: (os.getenv("LLM_STRUCTURED_OUTPUT") or "false").lower() == "true"
+    )
+    normalizer_concurrency: int = field(
+        default_factory=lambda: int(os.getenv("NORMALIZER_CONCURRENCY") or "4")
+    )
 
     # Scraping Configuration
     request_timeout: int = field(
@@ -38,16 +44,33 @@ class Settings:
     max_retries: int = field(
         default_factory=lambda: int(os.getenv("MAX_RETRIES") or "3")
     )
+    # Seconds a cached API response is reused without asking the server
+    # (0 = always revalidate with If-None-Match / If-Modified-Since)
+    api_cache_ttl: int = field(
+        default_factory=lambda: int(os.getenv("API_CACHE_TTL") or "0")
+    )
+    # Seconds a fetched career page is reused without refetching (0 = off)
+    page_cache_ttl: int = field(
+        default_factory=lambda: int(os.getenv("PAGE_CACHE_TTL") or "0")
+    )
 
     # Paths
     output_dir: str = field(
         default_factory=lambda: os.getenv("OUTPUT_DIR") or "output"
     )
 
+    # Logging
+    log_level: str = field(
+        default_factory=lambda: os.getenv("LOG_LEVEL") or "INFO"
+    )
+
     # Feature Flags
     skip_normalization: bool = field(
         default_factory=lambda: (os.getenv("SKIP_NORMALIZATION") or "false").lower() == "true"
     )
+    api_cache: bool = field(
+        default_factory=lambda: (os.getenv("API_CACHE") or "true").lower() == "true"
+    )
 
     # Email / SMTP Configuration
     smtp_host: str = field(
@@ -2,14 +2,16 @@
 LangGraph Workflow — defines the agent graph with state transitions.
 
 Graph structure:
-    planner → scraper → parser → normalizer → [loop?] → dedup → formatter
+    planner → scrape_all → dedup → formatter
 
-The graph loops back from normalizer to scraper when there are more pages
-to process, and proceeds to dedup once all pages are done.
+scrape_all runs the scraper → parser → normalizer pipeline for every page
+in the plan concurrently (pages are independent and I/O-bound), then merges
+the normalized jobs before dedup.
 """
 
-from langgraph.graph import StateGraph, END
-from models.state import AgentState
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from models.state import AgentState, initial_state
 from agents.planner import planner_agent
 from agents.scraper import scraper_agent
 from agents.parser import parser_agent
@@ -18,88 +20,108 @@ from agents.dedup import dedup_agent
 from agents.formatter import formatter_agent
 
 
-def should_continue(state: AgentState) -> str:
+# Max pages scraped at the same time (browser pages always run one at a time)
+MAX_SCRAPE_WORKERS = 5
+
+
+def process_page(page: dict) -> tuple[list[dict], list[str]]:
     """
-    Conditional edge: decide whether to process the next page or move to dedup.
+    Run the full scrape → parse → normalize pipeline for a single page.
 
     Returns:
-        'scraper' if more pages remain, 'dedup' if all pages are done.
+        (normalized_jobs, errors) for this page.
     """
-    scraping_plan = state.get("scraping_plan", [])
-    current_index = state.get("current_page_index", 0)
-
-    if current_index < len(scraping_plan) - 1:
-        return "scraper"
-    else:
-        return "dedup"
-
-
-def advance_to_next_page(state: AgentState) -> dict:
+    # Minimal state for this single page
+    state: dict = initial_state([page], scraping_plan=[page], current_page=page)
+
+    # Each stage returns only its own errors — collect them rather than let a
+    # later stage's (often empty) list replace an earlier failure
+    errors: list[str] = []
+    for agent in (scraper_agent, parser_agent, normalizer_agent):
+        result = agent(state)
+        errors.extend(result.pop("errors", []))
+        state.update(result)
+    return state.get("normalized_jobs", []), errors
+
+
+def _process_page_safe(page: dict) -> tuple[list[dict], list[str]]:
+    """process_page, but a failing page is reported as an error instead of raising."""
+    try:
+        return process_page(page)
+    except Exception as e:
+        name = page.get("name", "Unknown")
+        print(f"[Workflow] ❌ {name} failed: {e}")
+        return [], [f"{name}: {e}"]
+
+
+def scrape_all_pages(state: AgentState) -> dict:
     """
-    Transition node: advance to the next page in the scraping plan.
-    Updates the current_page_index and current_page.
+    Scrape, parse, and normalize every page in the scraping plan.
+
+    Non-browser pages run concurrently in a thread pool; browser pages run
+    serially afterwards to keep memory usage bounded. Results are merged in
+    plan order.
     """
     scraping_plan = state.get("scraping_plan", [])
-    current_index = state.get("current_page_index", 0)
-    next_index = current_index + 1
-
-    if next_index < len(scraping_plan):
-        print(f"\n[Workflow] Moving to page {next_index + 1}/{len(scraping_plan)}")
-        return {
-            "current_page_index": next_index,
-            "current_page": scraping_plan[next_index],
-            # Reset per-page state so the next page starts fresh
-            "extracted_jobs": [],
-            "raw_html": "",
-            "cleaned_text": "",
-        }
-
-    return {}
-
-
-def build_workflow() -> StateGraph:
+    browser_pages = [i for i, p in enumerate(scraping_plan) if p.get("type") == "browser"]
+    other_pages = [i for i, p in enumerate(scraping_plan) if p.get("type") != "browser"]
+
+    # (jobs, errors) per plan index, so pages can finish in any order
+    results: list[tuple[list[dict], list[str]]] = [([], [])] * len(scraping_plan)
+
+    if other_pages:
+        print(f"\n[Workflow] Scraping {len(other_pages)} pages concurrently...")
+        workers = max(1, min(MAX_SCRAPE_WORKERS, len(other_pages)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pages = [scraping_plan[i] for i in other_pages]
+            for i, result in zip(other_pages, pool.map(_process_page_safe, pages)):
+                results[i] = result
+
+    for i in browser_pages:
+        page = scraping_plan[i]
+        print(f"\n[Workflow] Scraping {page.get('name', 'Unknown')} (browser)...")
+        results[i] = _process_page_safe(page)
+
+    all_normalized: list[dict] = []
+    all_errors: list[str] = []
+    for jobs, errs in results:
+        all_normalized.extend(jobs)
+        all_errors.extend(errs)
+
+    return {
+        "normalized_jobs": all_normalized,
+        "errors": all_errors,
+    }
+
+
+def build_workflow() -> "StateGraph":
     """
     Build and compile the LangGraph workflow.
 
     Returns:
         Compiled StateGraph ready to invoke.
     """
+    # Imported here: LangGraph takes ~0.5s to import, and run.py only needs
+    # process_page from this module
+    from langgraph.graph import StateGraph, END
+
     # Create the graph
     workflow = StateGraph(AgentState)
 
     # Add nodes (each agent is a node in the graph)
     workflow.add_node("planner", planner_agent)
-    workflow.add_node("scraper", scraper_agent)
-    workflow.add_node("parser", parser_agent)
-    workflow.add_node("normalizer", normalizer_agent)
-    workflow.add_node("advance", advance_to_next_page)
+    workflow.add_node("scrape_all", scrape_all_pages)
     workflow.add_node("dedup", dedup_agent)
     workflow.add_node("formatter", formatter_agent)
 
     # Define edges (execution flow)
     workflow.set_entry_point("planner")
 
-    # Planner → Scraper
-    workflow.add_edge("planner", "scraper")
-
-    # Scraper → Parser
-    workflow.add_edge("scraper", "parser")
+    # Planner → Scrape all pages (scraper → parser → normalizer per page)
+    workflow.add_edge("planner", "scrape_all")
 
-    # Parser → Normalizer
-    workflow.add_edge("parser", "normalizer")
-
-    # Normalizer → conditional: more pages? → advance → scraper  OR  → dedup
-    workflow.add_conditional_edges(
-        "normalizer",
-        should_continue,
-        {
-            "scraper": "advance",
-            "dedup": "dedup",
-        },
-    )
-
-    # Advance → Scraper (loop back)
-    workflow.add_edge("advance", "scraper")
+    # Scrape all → Dedup
+    workflow.add_edge("scrape_all", "dedup")
 
     # Dedup → Formatter
     workflow.add_edge("dedup", "formatter")
@@ -111,5 +133,14 @@ def build_workflow() -> StateGraph:
     return workflow.compile()
 
 
-# Pre-built graph instance
-graph = build_workflow()
+@lru_cache(maxsize=1)
+def get_graph():
+    """Return the compiled workflow, building it on first use only."""
+    return build_workflow()
+
+
+def __getattr__(name: str):
+    # `graph` is compiled lazily on first access and then reused
+    if name == "graph":
+        return get_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,23 +2,70 @@
 Job data model — represents a single job posting.
 """
 
-from datetime import datetime
-from typing import Optional
+from dataclasses import dataclass, field, fields, MISSING
+from typing import Annotated, Optional
 from pydantic import BaseModel, Field
+from pydantic.json_schema import SkipJsonSchema
 
 
-class Job(BaseModel):
+# A plain slotted dataclass — no per-instance validators or __dict__. The
+# Annotated descriptions are only read by pydantic when Job is embedded in
+# JobList (the structured-output schema sent to the LLM).
+@dataclass(slots=True)
+class Job:
     """Represents a single job posting extracted from a career page."""
 
-    title: str = Field(description="Job title")
-    company: str = Field(description="Company name")
-    location: str = Field(default="", description="Job location (city, state, remote, etc.)")
-    url: str = Field(default="", description="Direct URL to the job posting")
-    description: str = Field(default="", description="Brief job description or summary")
-    date_posted: Optional[str] = Field(default=None, description="Date the job was posted")
-    source: str = Field(default="", description="Source career page name")
-    job_type: str = Field(default="", description="Full-time, Part-time, Contract, etc.")
+    title: Annotated[str, Field(description="Job title")]
+    company: Annotated[str, Field(description="Company name")]
+    location: Annotated[str, Field(description="Job location (city, state, remote, etc.)")] = ""
+    url: Annotated[str, Field(description="Direct URL to the job posting")] = ""
+    description: Annotated[str, Field(description="Brief job description or summary")] = ""
+    date_posted: Annotated[Optional[str], Field(description="Date the job was posted")] = None
+    source: Annotated[str, Field(description="Source career page name")] = ""
+    job_type: Annotated[str, Field(description="Full-time, Part-time, Contract, etc.")] = ""
+
+    # Filled in by the first dedup_key() call
+    _dedup_key: SkipJsonSchema[str] = field(default="", init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Job":
+        """
+        Build a Job from a raw dict with minimal coercion: unknown keys are
+        dropped, strings are stripped, and missing optional fields get their
+        defaults.
+
+        Raises:
+            ValueError: if a required field is missing or a field has the wrong type.
+        """
+        values = {}
+        for f in _JOB_FIELDS:
+            value = data.get(f.name)
+            if value is None:
+                if f.default is MISSING:
+                    raise ValueError(f"missing required field '{f.name}'")
+                values[f.name] = f.default
+            elif isinstance(value, str):
+                values[f.name] = value.strip()
+            else:
+                raise ValueError(f"field '{f.name}' must be a string, got {type(value).__name__}")
+        return cls(**values)
+
+    def to_dict(self) -> dict:
+        """Return the job as a plain dict (field order preserved)."""
+        return {f.name: getattr(self, f.name) for f in _JOB_FIELDS}
 
     def dedup_key(self) -> str:
-        """Generate a deduplication key based on core fields."""
-        return f"{self.title.lower().strip()}|{self.company.lower().strip()}|{self.location.lower().strip()}"
+        """Return the deduplication key (title|company|location, lowercased)."""
+        if not self._dedup_key:
+            self._dedup_key = f"{self.title.lower().strip()}|{self.company.lower().strip()}|{self.location.lower().strip()}"
+        return self._dedup_key
+
+
+# Public (constructor) fields — excludes the cached _dedup_key
+_JOB_FIELDS = tuple(f for f in fields(Job) if f.init)
+
+
+class JobList(BaseModel):
+    """Wrapper schema for structured LLM output (a list of jobs)."""
+
+    jobs: list[Job] = Field(default_factory=list, description="Extracted job postings")
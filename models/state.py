@@ -51,3 +51,25 @@ class AgentState(TypedDict):
 
     # Accumulated errors during processing
     errors: Annotated[list[str], merge_lists]
+
+
+def initial_state(career_pages: list[dict], **values) -> AgentState:
+    """
+    Return a fresh state with every field set (new empty lists each call, so
+    separate runs and pages never share a mutable list). values override the
+    defaults, e.g. initial_state([page], scraping_plan=[page], current_page=page).
+    """
+    state: AgentState = {
+        "career_pages": career_pages,
+        "scraping_plan": [],
+        "current_page_index": 0,
+        "current_page": {},
+        "raw_html": "",
+        "cleaned_text": "",
+        "extracted_jobs": [],
+        "normalized_jobs": [],
+        "final_jobs": [],
+        "errors": [],
+    }
+    state.update(values)
+    return state
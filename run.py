@@ -12,58 +12,73 @@ import time
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config.settings import settings
+from config.log import setup_logging
 from tools.file_handler import load_career_pages
-from tools.job_store import init_db, mark_seen, get_seen_count
-from tools.notifier import send_email_notification
-from graph.workflow import graph
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from tools.job_store import JobStore, mark_seen
+from tools.notifier import SMTPPool, send_email_notification
+from graph.workflow import process_page
+from models.state import initial_state
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import threading
 
 
+# LLM server probe timeouts (seconds): an unreachable host fails fast on
+# connect, a busy server still gets a few seconds to answer
+LLM_PROBE_TIMEOUT = 5
+LLM_PROBE_CONNECT_TIMEOUT = 2
+
+
+def _start_llm_probe() -> Future:
+    """
+    Query the LLM server's /models endpoint on a background thread.
+    Returns a Future resolving to the httpx response (or raising its error),
+    so the probe overlaps with config loading instead of blocking startup.
+    """
+    future: Future = Future()
+
+    def probe():
+        try:
+            import httpx
+            future.set_result(httpx.get(
+                f"{settings.llm_base_url}/models",
+                timeout=httpx.Timeout(LLM_PROBE_TIMEOUT, connect=LLM_PROBE_CONNECT_TIMEOUT),
+                headers={"Authorization": "Bearer lm-studio"},
+            ))
+        except Exception as e:
+            future.set_exception(e)
+
+    # Daemon thread: an unanswered probe never delays interpreter exit
+    threading.Thread(target=probe, daemon=True).start()
+    return future
+
+
 def _scrape_one_company(page: dict) -> tuple[list[dict], list[str], str]:
     """
     Run the full scrape→parse→normalize pipeline for a single company.
     Returns (normalized_jobs, errors, error_msg).
     """
-    from agents.scraper import scraper_agent
-    from agents.parser import parser_agent
-    from agents.normalizer import normalizer_agent
-
     name = page.get("name", "Unknown")
 
-    # Minimal state for this single company
-    state: dict = {
-        "career_pages": [page],
-        "scraping_plan": [page],
-        "current_page_index": 0,
-        "current_page": page,
-        "raw_html": "",
-        "cleaned_text": "",
-        "extracted_jobs": [],
-        "normalized_jobs": [],
-        "final_jobs": [],
-        "errors": [],
-    }
-
     try:
-        state.update(scraper_agent(state))
-        state.update(parser_agent(state))
-        state.update(normalizer_agent(state))
-        errs = state.get("errors", [])
+        jobs, errs = process_page(page)
         # Surface the first error message for display if any
         err_msg = errs[0].split(": ", 1)[-1] if errs else ""
-        return state.get("normalized_jobs", []), errs, err_msg
+        return jobs, errs, err_msg
     except Exception as e:
         print(f"[Parallel] ❌ {name} failed: {e}")
         return [], [f"{name}: {e}"], str(e)
 
 
-def run_once(career_pages: list[dict], db_path: str = None) -> tuple[list[dict], list[str], dict, set]:
+def run_once(
+    career_pages: list[dict], db_path: str = None, store: JobStore = None
+) -> tuple[list[dict], list[str], dict, set]:
     """
     Run one scraping cycle.
     Phase 1: API scrapers in parallel (batched, max 5 workers).
     Phase 2: Browser scrapers serially (one at a time — RAM-safe for EC2).
     Phase 3: HTML/LLM scrapers (max 3 workers).
+    Seen jobs are recorded through store if given (reusing its connection),
+    otherwise in the database at db_path.
     Returns (final_jobs, errors, scrape_results, new_keys).
     """
     from agents.planner import planner_agent
@@ -71,18 +86,7 @@ def run_once(career_pages: list[dict], db_path: str = None) -> tuple[list[dict],
     from agents.formatter import formatter_agent
 
     # Run planner to get ordered/filtered scraping plan
-    plan_state: dict = {
-        "career_pages": career_pages,
-        "scraping_plan": [],
-        "current_page_index": 0,
-        "current_page": {},
-        "raw_html": "",
-        "cleaned_text": "",
-        "extracted_jobs": [],
-        "normalized_jobs": [],
-        "final_jobs": [],
-        "errors": [],
-    }
+    plan_state: dict = initial_state(career_pages)
     plan_state.update(planner_agent(plan_state))
     scraping_plan = plan_state.get("scraping_plan", [])
 
@@ -206,8 +210,8 @@ def run_once(career_pages: list[dict], db_path: str = None) -> tuple[list[dict],
     # Mark jobs as seen in the DB and get which ones are new
     new_keys: set = set()
     deduped_jobs = final_state.get("final_jobs", [])
-    if db_path and deduped_jobs:
-        new_keys = mark_seen(deduped_jobs, db_path)
+    if deduped_jobs and (store or db_path):
+        new_keys = store.mark_seen(deduped_jobs) if store else mark_seen(deduped_jobs, db_path)
         print(f"\n🆕 {len(new_keys)} new jobs (not previously seen)")
 
     # Pass new_keys and scrape_results to formatter for the HTML report
@@ -251,6 +255,11 @@ Examples:
         action="store_true",
         help="Skip LLM-based normalization (faster, but less consistent data)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-download API responses (disable the ETag/TTL response cache)",
+    )
     parser.add_argument(
         "--schedule",
         type=int,
@@ -266,12 +275,19 @@ Examples:
     )
 
     args = parser.parse_args()
+    setup_logging()
+
+    # Start probing the LLM server right away; the result is only awaited
+    # if some page actually needs the LLM
+    llm_probe = _start_llm_probe()
 
     # Update settings
     if args.output_dir:
         settings.output_dir = args.output_dir
     if args.skip_normalization:
         settings.skip_normalization = True
+    if args.no_cache:
+        settings.api_cache = False
 
     # Load career pages
     config_path = args.config
@@ -307,24 +323,22 @@ Examples:
     print("=" * 60)
     print()
 
-    # Check LLM connectivity before starting
+    # Check LLM connectivity before starting — only pages that aren't API-mode
+    # need the LLM, so API-only runs don't wait on the probe at all
     has_html_pages = any(p.get("type") != "api" for p in career_pages)
-    print("🔌 Checking LLM connectivity...", end=" ")
-    try:
-        import httpx
-        resp = httpx.get(
-            f"{settings.llm_base_url}/models",
-            timeout=10,
-            headers={"Authorization": "Bearer lm-studio"},
-        )
-        if resp.status_code == 200:
-            models = resp.json().get("data", [])
-            model_names = [m.get("id", "unknown") for m in models]
-            print(f"✅ Connected! Available models: {', '.join(model_names)}")
-        else:
-            print(f"⚠️  Server responded with HTTP {resp.status_code}")
-    except Exception as e:
-        if has_html_pages:
+    if not has_html_pages:
+        print("🔌 All pages are API-mode — skipping LLM connectivity check")
+    else:
+        print("🔌 Checking LLM connectivity...", end=" ")
+        try:
+            resp = llm_probe.result()
+            if resp.status_code == 200:
+                models = resp.json().get("data", [])
+                model_names = [m.get("id", "unknown") for m in models]
+                print(f"✅ Connected! Available models: {', '.join(model_names)}")
+            else:
+                print(f"⚠️  Server responded with HTTP {resp.status_code}")
+        except Exception as e:
             print(f"❌ Cannot reach LM Studio at {settings.llm_base_url}")
             print(f"   Error: {e}")
             print(f"\n   Please check:")
@@ -333,24 +347,32 @@ Examples:
             print(f"   3. The IP in .env is correct (currently: {settings.llm_base_url})")
             print(f"   4. No firewall is blocking port 1234")
             sys.exit(1)
-        else:
-            print(f"⚠️  LLM not reachable, but all pages are API-mode — continuing without LLM")
     print()
 
     # ── Scheduled mode ───────────────────────────────────────
     if args.schedule:
         interval = args.schedule
 
-        # Initialize job store
-        init_db(settings.db_path)
-        seen = get_seen_count(settings.db_path)
+        # Initialize job store (one connection for the scheduler's lifetime)
+        store = JobStore(settings.db_path)
+        store.init()
+        seen = store.seen_count()
         print(f"📦 Job store initialized: {seen} previously seen jobs")
         print(f"⏰ Starting scheduler — running every {interval} minutes")
         print(f"   Press Ctrl+C to stop.\n")
 
+        # One SMTP session reused across cycles (redialled if the server drops it)
+        smtp_pool = None
+        if notify_email:
+            smtp_pool = SMTPPool(settings.smtp_host, settings.smtp_port, settings.smtp_user, settings.smtp_password)
+
+        # Cycles start on a fixed cadence (measured from each cycle's start),
+        # so a slow scrape doesn't push every later run back
         cycle = 0
+        next_run = time.monotonic()
         while True:
             cycle += 1
+            next_run += interval * 60
             from datetime import datetime, timezone
             now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
             print(f"\n{'─' * 60}")
@@ -358,7 +380,7 @@ Examples:
             print(f"{'─' * 60}\n")
 
             try:
-                final_jobs, errors, _statuses, new_keys = run_once(career_pages, db_path=settings.db_path)
+                final_jobs, errors, _statuses, new_keys = run_once(career_pages, store=store)
 
                 if final_jobs:
                     # new_keys already populated by run_once via mark_seen
@@ -368,14 +390,7 @@ Examples:
                     print(f"\n📊 Results: {len(final_jobs)} total, {len(new_jobs)} new")
 
                     if new_jobs and notify_email:
-                        send_email_notification(
-                            new_jobs,
-                            recipient=notify_email,
-                            smtp_host=settings.smtp_host,
-                            smtp_port=settings.smtp_port,
-                            smtp_user=settings.smtp_user,
-                            smtp_password=settings.smtp_password,
-                        )
+                        send_email_notification(new_jobs, recipient=notify_email, pool=smtp_pool)
                     elif new_jobs:
                         print(f"📋 New jobs (no email configured):")
                         for job in new_jobs[:10]:
@@ -397,10 +412,17 @@ Examples:
             except Exception as e:
                 print(f"❌ Cycle #{cycle} failed: {e}")
 
-            print(f"\n💤 Sleeping {interval} minutes until next run...")
+            # If the cycle overran the interval, start the next one right away
+            wait = max(0.0, next_run - time.monotonic())
+            if wait == 0:
+                next_run = time.monotonic()
+            print(f"\n💤 Sleeping {wait / 60:.1f} minutes until next run...")
             try:
-                time.sleep(interval * 60)
+                time.sleep(wait)
             except KeyboardInterrupt:
+                if smtp_pool:
+                    smtp_pool.close()
+                store.close()
                 print("\n\n⛔ Scheduler stopped.")
                 sys.exit(0)
 
@@ -21,6 +21,7 @@ from socketserver import ThreadingMixIn
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config.settings import settings
+from config.log import setup_logging
 from tools.file_handler import load_career_pages
 from tools.job_store import init_db, get_seen_count
 
@@ -332,6 +333,7 @@ def main():
     )
 
     args = parser.parse_args()
+    setup_logging()
 
     # Pass config path to handler
     JobScoutHandler.config_path = args.config
@@ -0,0 +1,51 @@
+"""
+Tests for agents/dedup.py — date filtering and duplicate removal.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from agents.dedup import dedup_agent
+
+
+def _job(title="SWE", company="Acme", location="New York, NY", date_posted=""):
+    return {"title": title, "company": company, "location": location, "date_posted": date_posted}
+
+
+def _titles(result):
+    return [j["title"] for j in result["final_jobs"]]
+
+
+# ── Date filter ─────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("fmt", [
+    "%Y-%m-%dT%H:%M:%S+0000",
+    "%Y-%m-%dT%H:%M:%S+00:00",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S.123Z",
+    "%Y-%m-%dT%H:%M:%S-05:00",
+])
+def test_date_filter_handles_all_iso_variants(fmt):
+    """Old jobs are dropped and recent ones kept regardless of the UTC suffix style."""
+    now = datetime.now(timezone.utc)
+    jobs = [
+        _job("Old", date_posted=(now - timedelta(days=5)).strftime(fmt)),
+        _job("Recent", date_posted=(now - timedelta(hours=2)).strftime(fmt)),
+    ]
+    assert _titles(dedup_agent({"normalized_jobs": jobs})) == ["Recent"]
+
+
+def test_unparseable_and_missing_dates_are_kept():
+    jobs = [_job("Garbage", date_posted="Posted recently"), _job("Blank")]
+    assert _titles(dedup_agent({"normalized_jobs": jobs})) == ["Garbage", "Blank"]
+
+
+# ── Dedup ───────────────────────────────────────────────────────────────────
+
+def test_duplicates_are_case_insensitive():
+    jobs = [_job("Software Engineer"), _job("software engineer", "ACME", "new york, ny")]
+    assert _titles(dedup_agent({"normalized_jobs": jobs})) == ["Software Engineer"]
+
+
+def test_non_us_locations_are_filtered():
+    jobs = [_job("A", location="London, United Kingdom"), _job("B", location="Austin, TX")]
+    assert _titles(dedup_agent({"normalized_jobs": jobs})) == ["B"]
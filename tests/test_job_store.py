@@ -4,7 +4,7 @@ Tests for tools/job_store.py — focusing on the session-based "new jobs" detect
 import os
 import tempfile
 import pytest
-from tools.job_store import init_db, mark_seen, get_new_jobs, get_seen_count, _make_dedup_key
+from tools.job_store import JobStore, init_db, mark_seen, get_new_jobs, get_seen_count, _make_dedup_key
 
 
 @pytest.fixture
@@ -107,3 +107,14 @@ def test_get_seen_count_tracks_insertions(tmp_db):
     assert get_seen_count(tmp_db) == 2
     mark_seen([_job("A"), _job("C")], tmp_db)  # A is a dupe, C is new
     assert get_seen_count(tmp_db) == 3  # A + B + C
+
+
+# ── JobStore (one connection reused across cycles) ──────────────────────────
+
+def test_job_store_reuses_connection_across_cycles(tmp_path):
+    with JobStore(str(tmp_path / "store.db")) as store:
+        store.init()
+        assert store.mark_seen([_job("Engineer")]) == {_make_dedup_key(_job("Engineer"))}
+        assert store.mark_seen([_job("Engineer"), _job("Analyst")]) == {_make_dedup_key(_job("Analyst"))}
+        assert store.get_new([_job("Engineer"), _job("Director")]) == [_job("Director")]
+        assert store.seen_count() == 2
@@ -0,0 +1,42 @@
+"""
+Tests for agents/normalizer.py — the title-based job type fast path.
+"""
+import pytest
+from agents.normalizer import _infer_job_type, normalizer_agent
+
+
+@pytest.mark.parametrize("title", [
+    "Contract Manager",
+    "Senior Contract Specialist",
+    "Government Contract Compliance Analyst",
+    "Contractor Relations Lead",
+    "Electrical Contractor",
+    "Intern Program Manager",
+    "Internal Tools Engineer",
+])
+def test_type_words_inside_the_role_are_not_qualifiers(title):
+    assert _infer_job_type(title) is None
+
+
+@pytest.mark.parametrize("title, job_type", [
+    ("Data Analyst (Contract)", "Contract"),
+    ("Backend Engineer - Contractor", "Contract"),
+    ("Software Engineer - Intern", "Internship"),
+    ("Software Engineering Intern", "Internship"),
+    ("Summer Internship", "Internship"),
+    ("QA Engineer, Part-time", "Part-time"),
+    ("Recruiter [Full-Time]", "Full-time"),
+])
+def test_standalone_qualifiers_are_recognised(title, job_type):
+    assert _infer_job_type(title) == job_type
+
+
+def test_parser_job_type_is_not_overwritten():
+    state = {
+        "extracted_jobs": [
+            {"title": "Data Analyst (Contract)", "company": "Acme", "location": "Remote", "job_type": "Full-time"},
+        ],
+        "current_page": {"name": "Acme", "type": "career_page"},
+    }
+    jobs = normalizer_agent(state)["normalized_jobs"]
+    assert jobs[0]["job_type"] == "Full-time"
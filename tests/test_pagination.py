@@ -0,0 +1,28 @@
+"""
+Tests for agents/scraper.py — sequential pagination's repeated-page guard.
+"""
+from agents.scraper import _fetch_sequential_pages
+
+
+def _run(pages):
+    """Paginate over pages (lists of job dicts) until they run out."""
+    all_jobs = []
+    error = _fetch_sequential_pages(
+        fetch=lambda n: {"success": True, "data": pages[n]},
+        first_cursor=0,
+        parse=lambda data: data,
+        next_cursor=lambda n, data, page_jobs, jobs: n + 1 if n + 1 < len(pages) else None,
+        all_jobs=all_jobs,
+    )
+    assert error == ""
+    return [job["title"] for job in all_jobs]
+
+
+def test_repeated_page_stops_pagination():
+    page = [{"title": "A", "url": "u/a"}, {"title": "B", "url": "u/b"}]
+    assert _run([page, list(page), [{"title": "C", "url": "u/c"}]]) == ["A", "B"]
+
+
+def test_pages_without_urls_are_not_treated_as_repeats():
+    pages = [[{"title": "A", "url": ""}], [{"title": "B", "url": ""}], [{"title": "C", "url": ""}]]
+    assert _run(pages) == ["A", "B", "C"]
@@ -0,0 +1,36 @@
+"""
+Tests for graph/workflow.py — per-page pipeline error handling and merge order.
+"""
+from unittest.mock import patch
+
+from graph import workflow
+
+
+def test_scraper_error_survives_process_page():
+    """A fetch failure is still reported after the parser and normalizer run."""
+    page = {"name": "Acme", "url": "https://acme.example/careers", "type": "career_page"}
+    failed = {"success": False, "html": "", "status_code": 0, "error": "Timeout after 30s", "url": page["url"]}
+
+    with patch("agents.scraper.fetch_page", return_value=failed):
+        jobs, errors = workflow.process_page(page)
+
+    assert jobs == []
+    assert errors and "Timeout after 30s" in errors[0]
+
+
+def test_scrape_all_pages_merges_in_plan_order():
+    """Browser pages run last but their results keep their place in the plan."""
+    plan = [
+        {"name": "A", "type": "api"},
+        {"name": "B", "type": "browser"},
+        {"name": "C", "type": "career_page"},
+    ]
+
+    def fake_process(page):
+        return [{"title": page["name"]}], [f"{page['name']}: note"]
+
+    with patch.object(workflow, "process_page", side_effect=fake_process):
+        result = workflow.scrape_all_pages({"scraping_plan": plan})
+
+    assert [j["title"] for j in result["normalized_jobs"]] == ["A", "B", "C"]
+    assert result["errors"] == ["A: note", "B: note", "C: note"]
@@ -3,24 +3,272 @@ API Fetcher Tool — fetches job data from career site APIs.
 Handles JSON API responses that return structured job data directly.
 """
 
+import atexit
+import importlib.util
+import json
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
+
 import httpx
 from config.settings import settings
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional — fall back to the stdlib codec
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Parser regexes, compiled once rather than looked up per job
+_GH_LOCATION_RE = re.compile(r"Locations?\s+(?:In this role you can work from\s+)?(.+?)(?:\s+Overview|\s+About)")
+_GH_SECTION_RE = re.compile(r"\s(Responsibilities|Qualifications|Requirements|About the role)")
+_WD_DAYS_AGO_RE = re.compile(r"(\d+)\+?\s*Days?")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_SN_TOTAL_RE = re.compile(r"of\s*(\d+)")
+
+# Job-link prefixes for boards with a fixed host (job paths/ids are appended)
+_GITHUB_JOB_URL = "https://www.github.careers/careers-home/jobs/"
+_AMAZON_JOB_URL = "https://www.amazon.jobs"
+_GOLDMAN_JOB_URL = "https://higher.gs.com/roles/"
+_EPAM_JOB_URL = "https://careers.epam.com"
+_APPLE_JOB_URL = "https://jobs.apple.com/en-us/details/"
+_SERVICENOW_JOB_URL = "https://careers.servicenow.com"
+
+# Month names and 3-letter abbreviations (lowercase) → month number
+_MONTH_NAMES = (
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+)
+_MONTHS = {name: i for i, name in enumerate(_MONTH_NAMES, 1)}
+_MONTHS.update({name[:3]: i for i, name in enumerate(_MONTH_NAMES, 1)})
+
+
+def _month_day_year_to_iso(text: str) -> str:
+    """
+    Convert "February 13, 2026" or "Feb 13, 2026" to "2026-02-13T00:00:00+0000".
+
+    Hand-rolled for this one format: strptime is slow (regex + locale lookup)
+    and this runs for every posting.
 
-# Known API patterns for popular career platforms
-# Maps page type to API URL template
-API_PATTERNS = {
-    "github": {
-        "base_url": "https://www.github.careers/api/jobs",
-        "params_builder": lambda keywords, page, limit: {
-            "keywords": keywords,
-            "page": page,
-            "limit": limit,
-            "sortBy": "posted_date",
-            "descending": "true",
-        },
-    },
-}
+    Raises:
+        ValueError: if text isn't a valid date in that format.
+    """
+    month, _, rest = text.strip().partition(" ")
+    day, _, year = rest.partition(", ")
+    month_num = _MONTHS.get(month.lower())
+    if month_num is None:
+        raise ValueError(f"unrecognized date: {text!r}")
+    dt = datetime(int(year), month_num, int(day))  # Validates day-of-month
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T00:00:00+0000"
+
+
+def _iso_utc(dt: datetime) -> str:
+    """Format dt as "YYYY-MM-DDTHH:MM:SS+0000" (isoformat is ~2x faster than strftime)."""
+    return dt.isoformat(timespec="seconds")[:19] + "+0000"
+
+
+# Shared keep-alive connection pool for all API calls. Paginated providers hit
+# the same host many times per run, so reusing connections skips a TCP+TLS
+# handshake on every page. httpx.Client is safe to share across threads.
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared API client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                # Up to 5 boards x MAX_PAGE_WORKERS pages are in flight at once;
+                # keep enough idle connections that none is dropped between bursts
+                transport = httpx.HTTPTransport(
+                    verify=False,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60),
+                    # Multiplex concurrent pages to the same host over one
+                    # connection when the h2 package is installed
+                    http2=_HTTP2,
+                    # Re-attempt failed connects (refused / connect timeout)
+                    retries=settings.max_retries,
+                )
+                _client = httpx.Client(
+                    transport=transport,
+                    follow_redirects=True,
+                    # Exclude brotli to avoid decompressobj reuse bug
+                    headers={"Accept-Encoding": "gzip, deflate"},
+                )
+    return _client
+
+
+def close_client() -> None:
+    """Close the shared API clients (registered to run at interpreter exit)."""
+    global _client, _apple_session
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+        if _apple_session is not None:
+            _apple_session[0].close()
+            _apple_session = None
+
+
+atexit.register(close_client)
+
+
+# Pages of one board are fetched concurrently, and several boards can share a
+# host — cap in-flight requests per host so the fan-out doesn't trip rate
+# limits. A 429 or transient 5xx is retried (up to settings.max_retries
+# attempts) after the server's Retry-After, or a jittered exponential backoff
+# when it doesn't send one.
+MAX_REQUESTS_PER_HOST = 4
+MAX_RETRY_WAIT = 30
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+
+def _host_slot(host: str) -> threading.BoundedSemaphore:
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST)
+    return slot
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a RETRY_STATUSES response."""
+    try:
+        delay = float(resp.headers.get("Retry-After", ""))
+    except ValueError:
+        # Missing or an HTTP date — back off exponentially, jittered so the
+        # pages that failed together don't all retry in the same instant
+        delay = 2 ** attempt * random.uniform(0.5, 1.5)
+    return min(max(delay, 0), MAX_RETRY_WAIT)
+
+
+def _send(method: str, url: str, **kwargs) -> httpx.Response:
+    """Send a request on the shared client, limited per host and retried on RETRY_STATUSES."""
+    slot = _host_slot(urlparse(url).netloc)
+    attempts = max(1, settings.max_retries)
+    for attempt in range(attempts):
+        with slot:
+            resp = _get_client().request(method, url, **kwargs)
+        if resp.status_code not in RETRY_STATUSES or attempt == attempts - 1:
+            return resp
+        time.sleep(_retry_delay(resp, attempt))
+    return resp
+
+
+# Parsed GET responses keyed by (url, params), kept for the life of the process
+# (scheduled and server runs re-fetch the same pages every cycle). Each entry is
+# (fetched_at, etag, last_modified, data): within settings.api_cache_ttl the data
+# is reused outright; after that the request is made conditional, and a 304
+# reuses the already-parsed data instead of downloading and decoding it again.
+# POST responses (Workday search pages) have no validators, so they are only
+# cached for the TTL. Eviction is least-recently-used.
+_response_cache: dict[tuple[str, str], tuple[float, str, str, object]] = {}
+_response_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0}
+MAX_CACHED_RESPONSES = 1000
+
+# Entries with a validator are also saved to settings.output_dir, so one-shot
+# CLI runs can send If-None-Match on their first request too. Loaded entries
+# are always revalidated (their TTL clock doesn't survive the process).
+CACHE_FILENAME = ".api_cache.json"
+_cache_path: str | None = None
+
+
+def _cache_key(api_url: str, params: dict | None, method: str = "GET") -> tuple[str, str]:
+    # GET keys are the bare URL (the format saved to disk); other methods are prefixed
+    url = api_url if method == "GET" else f"{method} {api_url}"
+    return url, json.dumps(params or {}, sort_keys=True, default=str)
+
+
+def _get_cached(key: tuple[str, str]) -> tuple | None:
+    """Return the cache entry for key (marking it most recently used), or None."""
+    with _response_cache_lock:
+        entry = _response_cache.pop(key, None)
+        if entry is None:
+            _cache_stats["misses"] += 1
+            return None
+        _response_cache[key] = entry
+        _cache_stats["hits"] += 1
+        return entry
+
+
+def _store_response(key: tuple[str, str], resp: httpx.Response, data, previous: tuple = None) -> None:
+    """Remember a response's parsed body and validators (a 304 may omit them — keep the old ones)."""
+    etag = resp.headers.get("ETag", "") or (previous[1] if previous else "")
+    last_modified = resp.headers.get("Last-Modified", "") or (previous[2] if previous else "")
+    if not etag and not last_modified and settings.api_cache_ttl <= 0:
+        return  # Nothing to revalidate with and no TTL — not worth keeping
+    with _response_cache_lock:
+        _response_cache.pop(key, None)
+        if len(_response_cache) >= MAX_CACHED_RESPONSES:
+            # Drop the least recently used entry (hits are moved to the end)
+            del _response_cache[next(iter(_response_cache))]
+        _response_cache[key] = (time.monotonic(), etag, last_modified, data)
+
+
+def clear_response_cache() -> None:
+    """Forget all cached API responses."""
+    with _response_cache_lock:
+        _response_cache.clear()
+
+
+def response_cache_stats() -> dict:
+    """Return cache lookups so far: {"hits", "misses", "size"}."""
+    with _response_cache_lock:
+        return {**_cache_stats, "size": len(_response_cache)}
+
+
+def _load_response_cache() -> None:
+    """Load the entries saved by a previous run (once per process)."""
+    global _cache_path
+    with _response_cache_lock:
+        if _cache_path is not None:
+            return
+        _cache_path = os.path.join(settings.output_dir, CACHE_FILENAME)
+        try:
+            with open(_cache_path, "rb") as f:
+                entries = _json_loads(f.read())
+        except (OSError, ValueError):
+            return  # No cache yet, or unreadable — start empty
+        for url, params, etag, last_modified, data in entries[-MAX_CACHED_RESPONSES:]:
+            _response_cache.setdefault((url, params), (float("-inf"), etag, last_modified, data))
+
+
+def save_response_cache() -> None:
+    """Write cached responses that can be revalidated (registered to run at exit)."""
+    if _cache_path is None:
+        return  # Cache was never used this run
+    with _response_cache_lock:
+        entries = [
+            [url, params, etag, last_modified, data]
+            for (url, params), (_, etag, last_modified, data) in _response_cache.items()
+            if etag or last_modified
+        ]
+    try:
+        os.makedirs(os.path.dirname(_cache_path) or ".", exist_ok=True)
+        with open(_cache_path, "wb") as f:
+            f.write(_json_dumps(entries))
+    except (OSError, TypeError) as e:
+        print(f"[API] Could not save response cache: {e}")
+
+
+atexit.register(save_response_cache)
 
 
 def fetch_jobs_from_api(
@@ -49,32 +297,50 @@ def fetch_jobs_from_api(
     default_headers = {
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) Chrome/120.0.0.0",
         "Accept": "application/json",
-        "Accept-Encoding": "gzip, deflate",  # Exclude brotli to avoid decompressobj reuse bug
     }
     if headers:
         default_headers.update(headers)
 
+    key = cached = None
+    if settings.api_cache:
+        if _cache_path is None:
+            _load_response_cache()
+        key = _cache_key(api_url, params)
+        cached = _get_cached(key)
+        if cached:
+            fetched_at, etag, last_modified, data = cached
+            if time.monotonic() - fetched_at < settings.api_cache_ttl:
+                return {"success": True, "data": data, "error": ""}
+            # Ask the server to skip the body if nothing changed
+            if etag:
+                default_headers["If-None-Match"] = etag
+            if last_modified:
+                default_headers["If-Modified-Since"] = last_modified
+
     try:
-        with httpx.Client(
-            timeout=timeout,
-            verify=False,
-            follow_redirects=True,
-            headers=default_headers,
-        ) as client:
-            resp = client.get(api_url, params=params or {})
-
-            if resp.status_code == 200:
-                return {
-                    "success": True,
-                    "data": resp.json(),
-                    "error": "",
-                }
-            else:
-                return {
-                    "success": False,
-                    "data": {},
-                    "error": f"API returned HTTP {resp.status_code}",
-                }
+        resp = _send(
+            "GET", api_url, params=params or {}, headers=default_headers, timeout=timeout
+        )
+
+        if resp.status_code == 304 and cached:
+            _store_response(key, resp, cached[3], previous=cached)
+            return {"success": True, "data": cached[3], "error": ""}
+
+        if resp.status_code == 200:
+            data = _json_loads(resp.content)
+            if key:
+                _store_response(key, resp, data)
+            return {
+                "success": True,
+                "data": data,
+                "error": "",
+            }
+        else:
+            return {
+                "success": False,
+                "data": {},
+                "error": f"API returned HTTP {resp.status_code}",
+            }
 
     except Exception as e:
         return {
@@ -104,27 +370,33 @@ def fetch_jobs_from_api_post(
     if headers:
         default_headers.update(headers)
 
+    key = None
+    if settings.api_cache and settings.api_cache_ttl > 0:
+        key = _cache_key(api_url, json_body, method="POST")
+        cached = _get_cached(key)
+        if cached and time.monotonic() - cached[0] < settings.api_cache_ttl:
+            return {"success": True, "data": cached[3], "error": ""}
+
     try:
-        with httpx.Client(
-            timeout=timeout,
-            verify=False,
-            follow_redirects=True,
-            headers=default_headers,
-        ) as client:
-            resp = client.post(api_url, json=json_body or {})
-
-            if resp.status_code == 200:
-                return {
-                    "success": True,
-                    "data": resp.json(),
-                    "error": "",
-                }
-            else:
-                return {
-                    "success": False,
-                    "data": {},
-                    "error": f"API returned HTTP {resp.status_code}",
-                }
+        resp = _send(
+            "POST", api_url, json=json_body or {}, headers=default_headers, timeout=timeout
+        )
+
+        if resp.status_code == 200:
+            data = _json_loads(resp.content)
+            if key:
+                _store_response(key, resp, data)
+            return {
+                "success": True,
+                "data": data,
+                "error": "",
+            }
+        else:
+            return {
+                "success": False,
+                "data": {},
+                "error": f"API returned HTTP {resp.status_code}",
+            }
 
     except Exception as e:
         return {
@@ -171,25 +443,24 @@ def parse_github_careers_api(api_response: dict, source_name: str) -> list[dict]
                 location = "Remote"
             elif "Locations" in desc:
                 # Try to extract location from description
-                import re
-                loc_match = re.search(r"Locations?\s+(?:In this role you can work from\s+)?(.+?)(?:\s+Overview|\s+About)", desc)
+                loc_match = _GH_LOCATION_RE.search(desc)
                 if loc_match:
                     location = loc_match.group(1).strip()
 
         # Build job URL
         slug = data.get("slug", "")
-        job_url = f"https://www.github.careers/careers-home/jobs/{slug}" if slug else ""
+        job_url = _GITHUB_JOB_URL + slug if slug else ""
 
         # Truncate description
         description = data.get("description", "")
-        # Extract just the overview/summary part
-        if "Overview" in description:
-            overview_start = description.index("Overview") + len("Overview")
+        # Extract just the overview/summary part (one scan finds and locates it)
+        overview_pos = description.find("Overview")
+        if overview_pos != -1:
+            overview_start = overview_pos + len("Overview")
             # Find the next section header (Responsibilities, Qualifications, etc.)
-            import re
-            next_section = re.search(r"\s(Responsibilities|Qualifications|Requirements|About the role)", description[overview_start:])
+            next_section = _GH_SECTION_RE.search(description, overview_start)
             if next_section:
-                description = description[overview_start:overview_start + next_section.start()].strip()
+                description = description[overview_start:next_section.start()].strip()
             else:
                 description = description[overview_start:overview_start + 300].strip()
         else:
@@ -225,44 +496,43 @@ def parse_amazon_jobs_api(api_response: dict, source_name: str) -> list[dict]:
     raw_jobs = api_response.get("jobs", [])
 
     for raw_job in raw_jobs:
-        # Filter to USA only (API may return international results)
-        country_code = raw_job.get("country_code", "")
-        if country_code != "USA":
+        # Filter to USA only (API may return international results) — before
+        # reading anything else
+        get = raw_job.get
+        if get("country_code") != "USA":
             continue
 
         # Build location
-        city = raw_job.get("city", "")
-        state = raw_job.get("state", "")
+        city = get("city", "")
+        state = get("state", "")
         location = f"{city}, {state}" if city and state else city or state or "Not specified"
 
         # Build job URL
-        job_path = raw_job.get("job_path", "")
-        job_url = f"https://www.amazon.jobs{job_path}" if job_path else ""
+        job_path = get("job_path", "")
+        job_url = _AMAZON_JOB_URL + job_path if job_path else ""
 
         # Use short description
-        description = raw_job.get("description_short", "")
+        description = get("description_short", "")
         if not description:
-            description = raw_job.get("description", "")[:300]
+            description = get("description", "")[:300]
 
         # Parse posted date (format: "February 13, 2026")
-        date_posted = raw_job.get("posted_date", "")
+        date_posted = get("posted_date", "")
         if date_posted:
             try:
-                from datetime import datetime
-                dt = datetime.strptime(date_posted, "%B %d, %Y")
-                date_posted = dt.strftime("%Y-%m-%dT00:00:00+0000")
+                date_posted = _month_day_year_to_iso(date_posted)
             except (ValueError, TypeError):
                 date_posted = ""
 
         jobs.append({
-            "title": raw_job.get("title", "Unknown"),
+            "title": get("title", "Unknown"),
             "company": "Amazon",
             "location": location,
             "url": job_url,
             "description": description,
             "date_posted": date_posted,
             "source": source_name,
-            "job_type": raw_job.get("job_schedule_type", "Full-time").capitalize(),
+            "job_type": get("job_schedule_type", "Full-time").capitalize(),
         })
 
     return jobs
@@ -304,9 +574,8 @@ def parse_eightfold_jobs_api(api_response: dict, source_name: str, base_url: str
         posted_ts = raw_job.get("postedTs")
         if posted_ts:
             try:
-                from datetime import datetime, timezone
                 dt = datetime.fromtimestamp(posted_ts, tz=timezone.utc)
-                date_posted = dt.strftime("%Y-%m-%dT%H:%M:%S+0000")
+                date_posted = _iso_utc(dt)
             except (ValueError, TypeError, OSError):
                 pass
 
@@ -347,44 +616,52 @@ def parse_workday_jobs_api(api_response: dict, source_name: str, base_url: str)
 
     raw_jobs = api_response.get("jobPostings", [])
 
+    # "Posted N Days Ago" is relative to now — read the clock once per page,
+    # and convert each distinct postedOn text once (a page repeats a handful)
+    now = datetime.now(timezone.utc)
+    date_by_posted_on: dict[str, str] = {}
+
+    # Derive company name from source_name (e.g. "Geico Careers" -> "Geico")
+    company = source_name.replace(" Careers", "").replace(" Jobs", "")
+
     for raw_job in raw_jobs:
+        get = raw_job.get
+
         # Build location
-        location = raw_job.get("locationsText", "Not specified")
+        location = get("locationsText", "Not specified")
 
         # Build job URL from external path
-        external_path = raw_job.get("externalPath", "")
+        external_path = get("externalPath", "")
         job_url = f"{base_url}{external_path}" if external_path else ""
 
         # Parse posted date text (e.g., "Posted 4 Days Ago", "Posted Today", "Posted 30+ Days Ago")
-        date_posted = ""
-        posted_on = raw_job.get("postedOn", "")
-        if posted_on:
+        posted_on = get("postedOn", "")
+        date_posted = date_by_posted_on.get(posted_on)
+        if date_posted is None:
+            date_posted = ""
             try:
-                from datetime import datetime, timedelta, timezone
-                import re
-                days_match = re.search(r"(\d+)\+?\s*Days?", posted_on)
+                days_match = _WD_DAYS_AGO_RE.search(posted_on)
                 if "Today" in posted_on:
-                    dt = datetime.now(timezone.utc)
-                    date_posted = dt.strftime("%Y-%m-%dT%H:%M:%S+0000")
+                    dt = now
+                    date_posted = _iso_utc(dt)
                 elif "Yesterday" in posted_on:
-                    dt = datetime.now(timezone.utc) - timedelta(days=1)
-                    date_posted = dt.strftime("%Y-%m-%dT%H:%M:%S+0000")
+                    dt = now - timedelta(days=1)
+                    date_posted = _iso_utc(dt)
                 elif days_match:
                     days_ago = int(days_match.group(1))
-                    dt = datetime.now(timezone.utc) - timedelta(days=days_ago)
-                    date_posted = dt.strftime("%Y-%m-%dT%H:%M:%S+0000")
+                    dt = now - timedelta(days=days_ago)
+                    date_posted = _iso_utc(dt)
             except (ValueError, TypeError):
                 pass
+            date_by_posted_on[posted_on] = date_posted
 
-        # Derive company name from source_name (e.g. "Geico Careers" -> "Geico")
-        company = source_name.replace(" Careers", "").replace(" Jobs", "")
-
+        bullet_fields = get("bulletFields")
         jobs.append({
-            "title": raw_job.get("title", "Unknown"),
+            "title": get("title", "Unknown"),
             "company": company,
             "location": location,
             "url": job_url,
-            "description": raw_job.get("bulletFields", [""])[0] if raw_job.get("bulletFields") else "",
+            "description": bullet_fields[0] if bullet_fields else "",
             "date_posted": date_posted,
             "source": source_name,
             "job_type": "Full-time",
@@ -425,9 +702,8 @@ def parse_lever_jobs_api(api_response: list, source_name: str) -> list[dict]:
         created_at = raw_job.get("createdAt")
         if created_at:
             try:
-                from datetime import datetime, timezone
                 dt = datetime.fromtimestamp(created_at / 1000, tz=timezone.utc)
-                date_posted = dt.strftime("%Y-%m-%dT%H:%M:%S+0000")
+                date_posted = _iso_utc(dt)
             except (ValueError, TypeError, OSError):
                 pass
 
@@ -472,6 +748,7 @@ def parse_greenhouse_jobs_api(api_response: dict, source_name: str) -> list[dict
     jobs = []
 
     raw_jobs = api_response.get("jobs", [])
+    now = datetime.now(timezone.utc)
 
     for raw_job in raw_jobs:
         # Build location
@@ -487,11 +764,10 @@ def parse_greenhouse_jobs_api(api_response: dict, source_name: str) -> list[dict
         updated_at = raw_job.get("updated_at", "")
         if updated_at:
             try:
-                from datetime import datetime, timedelta, timezone as _tz
                 dt = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
                 # Only use if updated within the last 60 days
-                if (datetime.now(_tz.utc) - dt).days <= 60:
-                    date_posted = dt.strftime("%Y-%m-%dT%H:%M:%S+0000")
+                if (now - dt).days <= 60:
+                    date_posted = _iso_utc(dt)
             except (ValueError, TypeError):
                 pass
 
@@ -545,6 +821,9 @@ def parse_oracle_hcm_jobs_api(api_response: dict, source_name: str, base_url: st
     search_item = items[0]
     raw_jobs = search_item.get("requisitionList", [])
 
+    # Same for every job on the board — only the id is appended
+    job_url_prefix = f"{base_url}/hcmUI/CandidateExperience/en/sites/{site_number}/job/"
+
     for raw_job in raw_jobs:
         # Filter to US jobs only
         country = raw_job.get("PrimaryLocationCountry", "")
@@ -556,16 +835,15 @@ def parse_oracle_hcm_jobs_api(api_response: dict, source_name: str, base_url: st
 
         # Build job URL
         job_id = raw_job.get("Id", "")
-        job_url = f"{base_url}/hcmUI/CandidateExperience/en/sites/{site_number}/job/{job_id}" if job_id and base_url else ""
+        job_url = f"{job_url_prefix}{job_id}" if job_id and base_url else ""
 
         # Parse posted date (format: "2026-02-24")
         date_posted = ""
         posted_date = raw_job.get("PostedDate", "")
         if posted_date:
             try:
-                from datetime import datetime
-                dt = datetime.strptime(posted_date, "%Y-%m-%d")
-                date_posted = dt.strftime("%Y-%m-%dT00:00:00+0000")
+                dt = datetime.fromisoformat(posted_date)
+                date_posted = _iso_utc(dt)
             except (ValueError, TypeError):
                 date_posted = ""
 
@@ -679,7 +957,7 @@ def parse_goldmansachs_jobs_api(api_response: dict, source_name: str) -> list[di
 
         # Build job URL from externalSource.sourceId
         source_id = item.get("externalSource", {}).get("sourceId", "")
-        job_url = f"https://higher.gs.com/roles/{source_id}" if source_id else ""
+        job_url = f"{_GOLDMAN_JOB_URL}{source_id}" if source_id else ""
 
         # Build description
         desc_parts = []
@@ -749,13 +1027,12 @@ def parse_epam_jobs_api(api_response: dict, source_name: str) -> list[dict]:
         # Build job URL from seo.url
         seo = raw_job.get("seo", {})
         relative_url = seo.get("url", "")
-        job_url = f"https://careers.epam.com{relative_url}" if relative_url else ""
+        job_url = _EPAM_JOB_URL + relative_url if relative_url else ""
 
         # Description
         description = raw_job.get("description", "")
         # Strip HTML tags from description
-        import re
-        description = re.sub(r"<[^>]+>", "", description).strip()
+        description = _HTML_TAG_RE.sub("", description).strip()
 
         # Extract other metadata
         seniority = raw_job.get("seniority", "")
@@ -778,13 +1055,27 @@ def parse_epam_jobs_api(api_response: dict, source_name: str) -> list[dict]:
     return jobs
 
 
-def fetch_apple_jobs(keywords: str = "Software Engineer", page: int = 1) -> dict:
+# Apple's session cookies and CSRF token stay valid across search pages, so
+# one session (client, token) is set up per process and reused for every page.
+_apple_session: tuple[httpx.Client, str] | None = None
+
+
+def _get_apple_session(refresh: bool = False) -> tuple[httpx.Client, str]:
     """
-    Fetch jobs from Apple's career API. Handles the CSRF token flow.
+    Return the (client, csrf_token) for Apple's search API, starting a new
+    session on first use or when refresh is set.
 
-    Apple requires: visit page → GET /api/v1/CSRFToken → POST /api/v1/search
+    Raises:
+        RuntimeError: if Apple doesn't hand out a CSRF token.
     """
-    try:
+    global _apple_session
+    with _client_lock:
+        if _apple_session is not None and not refresh:
+            return _apple_session
+        if _apple_session is not None:
+            _apple_session[0].close()
+            _apple_session = None
+
         client = httpx.Client(
             timeout=15,
             follow_redirects=True,
@@ -803,8 +1094,21 @@ def fetch_apple_jobs(keywords: str = "Software Engineer", page: int = 1) -> dict
 
         if not csrf_token:
             client.close()
-            return {"success": False, "data": {}, "error": "Failed to get CSRF token"}
+            raise RuntimeError("Failed to get CSRF token")
+
+        _apple_session = (client, csrf_token)
+        return _apple_session
+
+
+def fetch_apple_jobs(keywords: str = "Software Engineer", page: int = 1) -> dict:
+    """
+    Fetch jobs from Apple's career API. Handles the CSRF token flow.
 
+    Apple requires: visit page → GET /api/v1/CSRFToken → POST /api/v1/search
+    The first two steps run once per session (see _get_apple_session); a
+    rejected token starts a fresh session and the search is retried once.
+    """
+    try:
         # Step 3: Search
         body = {
             "query": keywords,
@@ -819,21 +1123,24 @@ def fetch_apple_jobs(keywords: str = "Software Engineer", page: int = 1) -> dict
                 "mediumDate": "MMM D, YYYY",
             },
         }
-        resp = client.post(
-            "https://jobs.apple.com/api/v1/search",
-            json=body,
-            headers={
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "x-apple-csrf-token": csrf_token,
-                "browserlocale": "en-us",
-                "locale": "en_US",
-            },
-        )
-        client.close()
+        for refresh in (False, True):
+            client, csrf_token = _get_apple_session(refresh=refresh)
+            resp = client.post(
+                "https://jobs.apple.com/api/v1/search",
+                json=body,
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                    "x-apple-csrf-token": csrf_token,
+                    "browserlocale": "en-us",
+                    "locale": "en_US",
+                },
+            )
+            if resp.status_code not in (401, 403):
+                break
 
         if resp.status_code == 200:
-            return {"success": True, "data": resp.json(), "error": ""}
+            return {"success": True, "data": _json_loads(resp.content), "error": ""}
         else:
             return {"success": False, "data": {}, "error": f"API returned HTTP {resp.status_code}"}
 
@@ -876,7 +1183,7 @@ def parse_apple_jobs_api(api_response: dict, source_name: str) -> list[dict]:
         # Build job URL
         job_id = raw_job.get("id", "")
         slug = raw_job.get("transformedPostingTitle", "")
-        job_url = f"https://jobs.apple.com/en-us/details/{job_id}/{slug}" if job_id else ""
+        job_url = f"{_APPLE_JOB_URL}{job_id}/{slug}" if job_id else ""
 
         # Description
         description = raw_job.get("jobSummary", "")
@@ -886,9 +1193,7 @@ def parse_apple_jobs_api(api_response: dict, source_name: str) -> list[dict]:
         date_posted = ""
         if raw_date:
             try:
-                from datetime import datetime as _dt, timezone as _tz
-                dt = _dt.strptime(raw_date, "%b %d, %Y").replace(tzinfo=_tz.utc)
-                date_posted = dt.strftime("%Y-%m-%dT%H:%M:%S+0000")
+                date_posted = _month_day_year_to_iso(raw_date)
             except (ValueError, TypeError):
                 date_posted = raw_date  # Fallback to raw if format changed
 
@@ -917,9 +1222,9 @@ def fetch_servicenow_jobs(keywords: str = "Software Engineer", page: int = 1, pa
     ServiceNow uses server-side rendered HTML with no JSON API.
     Jobs are in .job-listing container with a[href] links.
     """
-    import re
     try:
         from bs4 import BeautifulSoup
+        from tools.text_extractor import HTML_PARSER
     except ImportError:
         return {"success": False, "data": {"jobs": [], "total": 0}, "error": "beautifulsoup4 not installed"}
 
@@ -936,19 +1241,19 @@ def fetch_servicenow_jobs(keywords: str = "Software Engineer", page: int = 1, pa
             "Accept": "text/html,application/xhtml+xml",
         }
 
-        resp = httpx.get(url, params=params, headers=headers, timeout=15, follow_redirects=True, verify=False)
+        resp = _send("GET", url, params=params, headers=headers, timeout=15)
 
         if resp.status_code != 200:
             return {"success": False, "data": {"jobs": [], "total": 0}, "error": f"HTTP {resp.status_code}"}
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.text, HTML_PARSER)
 
         # Extract total count from "Displaying 1 to 20 of 430 matching jobs"
         total = 0
         total_el = soup.select_one("[class*=total], [class*=count], [class*=result]")
         if total_el:
             text = total_el.get_text(strip=True)
-            m = re.search(r"of\s*(\d+)", text)
+            m = _SN_TOTAL_RE.search(text)
             if m:
                 total = int(m.group(1))
 
@@ -967,7 +1272,7 @@ def fetch_servicenow_jobs(keywords: str = "Software Engineer", page: int = 1, pa
                 if title.lower() in ("save", "saved"):
                     continue
 
-                job_url = f"https://careers.servicenow.com{href}" if href.startswith("/") else href
+                job_url = _SERVICENOW_JOB_URL + href if href.startswith("/") else href
 
                 # Try to find location - in ul.job-meta inside the card-body grandparent
                 location = "Not specified"
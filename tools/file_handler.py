@@ -3,12 +3,39 @@ File Handler Tool — loads configs, saves results to JSON and CSV.
 """
 
 import csv
+from collections import Counter
 import json
 import os
 from datetime import datetime
+from operator import itemgetter
 
 import yaml
 
+try:
+    # LibYAML's C parser — same safe semantics, much faster than the Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+
+    def _dump_json(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+except ImportError:  # orjson is optional — fall back to the stdlib encoder
+
+    def _dump_json(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+
+# Write buffer for CSV output (1 MB)
+CSV_BUFFER_SIZE = 1 << 20
+
+
+# Parsed career page lists keyed by path: (mtime_ns, size, pages). The server
+# reloads the config on every scrape; the YAML is only re-parsed after an edit.
+_pages_cache: dict[str, tuple[int, int, list[dict]]] = {}
+
 
 def load_career_pages(yaml_path: str) -> list[dict]:
     """
@@ -20,8 +47,18 @@ def load_career_pages(yaml_path: str) -> list[dict]:
     Returns:
         List of career page dicts with keys: name, url, type.
     """
+    st = os.stat(yaml_path)
+    cached = _pages_cache.get(yaml_path)
+    if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+        cached = _pages_cache[yaml_path] = (st.st_mtime_ns, st.st_size, _read_career_pages(yaml_path))
+    # Fresh dicts each call, so callers can't alter the cached copy
+    return [dict(page) for page in cached[2]]
+
+
+def _read_career_pages(yaml_path: str) -> list[dict]:
+    """Parse and validate the career pages in a YAML file (uncached)."""
     with open(yaml_path, "r") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
 
     pages = data.get("career_pages", [])
 
@@ -70,12 +107,30 @@ def save_to_json(jobs: list[dict], output_dir: str, filename: str = None) -> str
 
     filepath = os.path.join(output_dir, filename)
 
-    with open(filepath, "w") as f:
-        json.dump(jobs, f, indent=2, default=str)
+    # Encode once (orjson when available) and write the whole document in a
+    # single call — json.dump would issue one small write per encoded chunk
+    payload = _dump_json(jobs)
+    with open(filepath, "wb") as f:
+        f.write(payload)
 
     return filepath
 
 
+def _csv_rows(jobs: list[dict], fieldnames: list[str]):
+    """Yield one tuple per job in fieldnames order ("" for missing keys)."""
+    # itemgetter fetches every column in one C call; jobs normally share the
+    # same keys, so the per-key fallback only runs for the odd incomplete row
+    getter = itemgetter(*fieldnames)
+    single = len(fieldnames) == 1
+    for job in jobs:
+        try:
+            row = getter(job)
+        except KeyError:
+            yield tuple(job.get(key, "") for key in fieldnames)
+            continue
+        yield (row,) if single else row
+
+
 def save_to_csv(jobs: list[dict], output_dir: str, filename: str = None) -> str:
     """
     Save job listings to a CSV file.
@@ -102,10 +157,12 @@ def save_to_csv(jobs: list[dict], output_dir: str, filename: str = None) -> str:
     else:
         fieldnames = list(jobs[0].keys())
 
-    with open(filepath, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerows(jobs)
+    # Plain csv.writer with tuples skips DictWriter's per-row key checks;
+    # the large buffer keeps the number of write syscalls low
+    with open(filepath, "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(_csv_rows(jobs, fieldnames))
 
     return filepath
 
@@ -123,17 +180,9 @@ def generate_summary(jobs: list[dict]) -> str:
     if not jobs:
         return "No jobs found."
 
-    # Count by company
-    companies = {}
-    for job in jobs:
-        company = job.get("company", "Unknown")
-        companies[company] = companies.get(company, 0) + 1
-
-    # Count by location
-    locations = {}
-    for job in jobs:
-        location = job.get("location", "Unknown")
-        locations[location] = locations.get(location, 0) + 1
+    # Count by company and location
+    companies = Counter(job.get("company", "Unknown") for job in jobs)
+    locations = Counter(job.get("location", "Unknown") for job in jobs)
 
     lines = [
         f"{'=' * 50}",
@@ -143,12 +192,12 @@ def generate_summary(jobs: list[dict]) -> str:
         f"",
         f"  By Company:",
     ]
-    for company, count in sorted(companies.items(), key=lambda x: -x[1]):
+    for company, count in companies.most_common():
         lines.append(f"    - {company}: {count}")
 
     lines.append(f"")
     lines.append(f"  By Location:")
-    for location, count in sorted(locations.items(), key=lambda x: -x[1]):
+    for location, count in locations.most_common():
         lines.append(f"    - {location}: {count}")
 
     lines.append(f"{'=' * 50}")
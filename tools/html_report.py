@@ -2,7 +2,40 @@
 HTML Report Generator — creates a beautiful static HTML page for job listings.
 """
 
+import time
+from bisect import bisect_right
+from collections import defaultdict
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import accumulate
+
+from tools.job_store import _make_dedup_key
+
+
+# Write buffer for the report file (1 MB)
+HTML_BUFFER_SIZE = 1 << 20
+
+# Toolbar age filters in seconds: 1h, 3h, 6h, 24h, 48h
+_AGE_THRESHOLDS = (3600, 10800, 21600, 86400, 172800)
+
+
+@lru_cache(maxsize=4096)
+def _date_to_ts(date_str: str) -> float:
+    """
+    Convert a job's date_posted ("...+0000", "...Z", or date-only "2026-03-11")
+    to a Unix timestamp. Date-only strings are treated as midnight UTC.
+    Returns 0 if unparseable.
+
+    fromisoformat (3.11+) handles all of these without strptime's per-call
+    format parsing, and many jobs share a posting date, so results are cached.
+    """
+    try:
+        dt = datetime.fromisoformat(date_str)
+    except (ValueError, TypeError):
+        return 0
+    if len(date_str) == 10:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
 
 
 def generate_html_report(jobs: list[dict], output_path: str, new_keys: set = None, scrape_results: dict = None) -> str:
@@ -39,7 +72,7 @@ def generate_html_report(jobs: list[dict], output_path: str, new_keys: set = Non
         error_count = sum(1 for s in scrape_results.values() if s.get("state") == "error")
         
         # Build inner rows for the collapsible table
-        table_rows = ""
+        row_parts = []
         for comp_name, s in sorted(scrape_results.items(), key=lambda x: x[0].lower()):
             ctype = s.get("type", "api").upper()[:3]  # API, BRO, HTM
             cstate = s.get("state", "done")
@@ -58,12 +91,13 @@ def generate_html_report(jobs: list[dict], output_path: str, new_keys: set = Non
                 status_cell = f'<span class="sr-status sr-warn">⚠️ {cstate}</span>'
                 row_class = "sr-row"
             
-            table_rows += f"""
+            row_parts.append(f"""
             <tr class="{row_class}">
               <td class="sr-name">{_esc(comp_name)}</td>
               <td><span class="sr-type sr-type-{s.get('type','api')}">{ctype}</span></td>
               <td class="sr-status-cell">{status_cell}</td>
-            </tr>"""
+            </tr>""")
+        table_rows = "".join(row_parts)
         
         # Error summary in the header
         error_pill = f' <span class="banner-error-pill">{error_count} errors</span>' if has_errors else ''
@@ -92,39 +126,23 @@ def generate_html_report(jobs: list[dict], output_path: str, new_keys: set = Non
     else:
         new_banner_html = ""
     
-    import time
     now_ts = time.time()
-    
-    count_1h = 0
-    count_3h = 0
-    count_6h = 0
-    count_24h = 0
-    count_48h = 0
-    
+
+    # Jobs per age bucket: bucket i holds ages in [threshold i-1, threshold i),
+    # the last one everything older than 2 days
+    bucket_counts = [0] * (len(_AGE_THRESHOLDS) + 1)
+
     count_no_date = 0
 
+    # Jobs grouped by company, filled in the same pass
+    companies = defaultdict(list)
+
     for job in jobs:
+        companies[job.get("company", "Unknown")].append(job)
+
         # Standardize date to timestamp
         date_str = job.get("date_posted")
-        ts = 0
-        if date_str:
-            try:
-                # Handle ISO datetime with +0000 suffix (most API sources)
-                if date_str.endswith("+0000"):
-                    dt = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S%z")
-                    ts = dt.timestamp()
-                # Handle date-only strings like "2026-03-11" (Phenom/Adobe)
-                elif len(date_str) == 10 and date_str[4] == "-":
-                    dt = datetime.strptime(date_str, "%Y-%m-%d")
-                    # Treat as midnight UTC
-                    dt = dt.replace(tzinfo=timezone.utc)
-                    ts = dt.timestamp()
-                else:
-                    dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                    ts = dt.timestamp()
-            except (ValueError, TypeError):
-                pass
-        
+        ts = _date_to_ts(date_str) if date_str else 0
         job["_ts"] = ts
 
         # Only count jobs with a valid date in time-based filters
@@ -132,21 +150,17 @@ def generate_html_report(jobs: list[dict], output_path: str, new_keys: set = Non
             count_no_date += 1
             continue
 
-        age = now_ts - ts
-        
-        if age < 3600: count_1h += 1
-        if age < 10800: count_3h += 1
-        if age < 21600: count_6h += 1
-        if age < 86400: count_24h += 1
-        if age < 172800: count_48h += 1
-
-    # Group jobs by company
-    companies = {}
-    for job in jobs:
-        company = job.get("company", "Unknown")
-        if company not in companies:
-            companies[company] = []
-        companies[company].append(job)
+        bucket_counts[bisect_right(_AGE_THRESHOLDS, now_ts - ts)] += 1
+
+    # "Posted within N hours" counts are cumulative over the buckets
+    count_1h, count_3h, count_6h, count_24h, count_48h = accumulate(bucket_counts[:-1])
+
+    # (company_jobs, escaped name, CSS-safe id) per company, in display order —
+    # shared by the sidebar and the card sections
+    company_sections = []
+    for company, company_jobs in sorted(companies.items()):
+        esc_company = _esc(company)
+        company_sections.append((company_jobs, esc_company, esc_company.replace(" ", "-").lower()))
 
     # Build Toolbar HTML (Date Filters)
     toolbar_html = f"""
@@ -188,7 +202,9 @@ def generate_html_report(jobs: list[dict], output_path: str, new_keys: set = Non
           <span class="badgish new-badgish">{new_count}</span>
         </button>"""
 
-    sidebar_html = f"""
+    # Fragments are collected in lists and joined once — repeated += on a
+    # growing string copies it every time
+    sidebar_parts = [f"""
     <div class="sidebar" id="main-sidebar">
       <button class="sidebar-close" onclick="toggleSidebar()">✕ Close Filters</button>
       <div class="filter-group">
@@ -201,1057 +217,1069 @@ def generate_html_report(jobs: list[dict], output_path: str, new_keys: set = Non
           <span>All Companies</span>
           <span class="badgish">{len(jobs)}</span>
         </button>
-    """
-    for company, company_jobs in sorted(companies.items()):
-        safe_comp = _esc(company).replace(" ", "-").lower()
-        sidebar_html += f"""
+    """]
+    for company_jobs, esc_company, safe_comp in company_sections:
+        sidebar_parts.append(f"""
         <button class="filter-btn comp-filter" onclick="filterCompany('{safe_comp}', this)">
-          <span>{_esc(company)}</span>
+          <span>{esc_company}</span>
           <span class="badgish">{len(company_jobs)}</span>
         </button>
-        """
-    sidebar_html += "</div></div>"
+        """)
+    sidebar_parts.append("</div></div>")
+    sidebar_html = "".join(sidebar_parts)
 
     # Build job cards HTML
-    job_cards_html = '<div class="content-area">'
-    for company, company_jobs in sorted(companies.items()):
-        safe_comp = _esc(company).replace(" ", "-").lower()
-        job_cards_html += f'<div id="section-{safe_comp}" class="company-section" data-comp="{safe_comp}">\n'
-        job_cards_html += f'  <h2 class="company-name">{_esc(company)} <span class="badge">{len(company_jobs)}</span></h2>\n'
-        job_cards_html += f'  <div class="job-grid">\n'
+    card_parts = ['<div class="content-area">']
+    for company_jobs, esc_company, safe_comp in company_sections:
+        card_parts.append(
+            f'<div id="section-{safe_comp}" class="company-section" data-comp="{safe_comp}">\n'
+            f'  <h2 class="company-name">{esc_company} <span class="badge">{len(company_jobs)}</span></h2>\n'
+            f'  <div class="job-grid">\n'
+        )
 
         for job in company_jobs:
             title = _esc(job.get("title", ""))
             location = _esc(job.get("location", ""))
             job_type = _esc(job.get("job_type", ""))
-            url = job.get("url", "")
-            description = _esc(job.get("description", ""))
+            url = _esc_attr(job.get("url", ""))
             date_posted = job.get("date_posted", "")
             source = _esc(job.get("source", ""))
             ts = job.get("_ts", 0)
 
-            # Format date for display (Local Time)
-            date_display = ""
-            if date_posted:
-                try:
-                    if date_posted.endswith("+0000"):
-                        dt = datetime.strptime(date_posted, "%Y-%m-%dT%H:%M:%S%z")
-                    elif len(date_posted) == 10 and date_posted[4] == "-":
-                        # Date-only (e.g. "2026-03-11" from Phenom/Adobe)
-                        from datetime import timezone as _tz
-                        dt = datetime.strptime(date_posted, "%Y-%m-%d").replace(tzinfo=_tz.utc)
-                    else:
-                        dt = datetime.fromisoformat(date_posted.replace("Z", "+00:00"))
-
-                    # Convert to local system time (EST for user)
-                    dt_local = dt.astimezone()
-                    date_display = dt_local.strftime("%b %d, %I:%M %p")
-                except (ValueError, TypeError):
-                    date_display = date_posted
-            else:
-                date_display = "Date unknown"
+            # The browser formats the date (data-iso) in the viewer's timezone
+            location_html = f'<span class="meta-item">📍 {location}</span>' if location else ''
+            date_html = f'<span class="meta-item job-date" data-iso="{date_posted}"></span>' if date_posted else ''
+            type_html = f'<span class="tag">{job_type}</span>' if job_type else ''
+            source_html = f'<span class="tag source-tag">{source}</span>' if source else ''
 
-            # Truncate description for card
-            desc_short = description[:160] + "..." if len(description) > 160 else description
-            
             card_href = f'href="{url}" ' if url else ''
             card_target = 'target="_blank" ' if url else ''
 
             # Check if this job is new
-            job_dedup_key = f"{job.get('title','').lower().strip()}|{job.get('company','').lower().strip()}|{job.get('location','').lower().strip()}"
-            is_new = job_dedup_key in new_keys
+            is_new = _make_dedup_key(job) in new_keys
             new_badge = '<span class="new-badge">New</span>' if is_new else ''
 
             new_attr = 'data-new="1"' if is_new else 'data-new="0"'
-            job_cards_html += f"""    <a {card_href}{card_target}class="job-card" data-ts="{ts}" {new_attr}>
+            card_parts.append(f"""    <a {card_href}{card_target}class="job-card" data-ts="{ts}" {new_attr}>
       <div class="job-header">
         <h3 class="job-title">{title}{new_badge}</h3>
       </div>
       <div class="job-meta">
-        {f'<span class="meta-item">📍 {location}</span>' if location else ''}
-        {f'<span class="meta-item job-date" data-iso="{date_posted}"></span>' if date_posted else ''}
+        {location_html}
+        {date_html}
       </div>
       <div class="job-tags">
-         {f'<span class="tag">{job_type}</span>' if job_type else ''}
-         {f'<span class="tag source-tag">{source}</span>' if source else ''}
+         {type_html}
+         {source_html}
       </div>
     </a>
-"""
-        job_cards_html += '  </div>\n</div>\n'
-    job_cards_html += '</div>'
+""")
+        card_parts.append('  </div>\n</div>\n')
+    card_parts.append('</div>')
 
     # Summary stats
     companies_count = len(companies)
 
-    html = f"""<!DOCTYPE html>
+    page_head = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
   <title>Job Scout — {timestamp_str}</title>
   <style>
-    :root {{
-      --bg-dark: #111111;
-      --bg-panel: #1a1a1a;
-      --bg-panel2: #1f1f1f;
-      --border: #2e2e2e;
-      --accent: #f97316;
-      --accent-2: #fb923c;
-      --accent-hover: #ea580c;
-      --accent-glow: rgba(249, 115, 22, 0.22);
-      --text-main: #ffffff;
-      --text-muted: #c0c0cc;
-      --card-bg: rgba(255,255,255,0.035);
-      --card-bg-hover: rgba(249, 115, 22, 0.07);
-      --card-border-hover: rgba(249, 115, 22, 0.45);
-      --tag-bg: rgba(249, 115, 22, 0.12);
-      --tag-color: #fdba74;
-      --filter-btn-bg: rgba(255,255,255,0.05);
-      --filter-btn-hover: rgba(249, 115, 22, 0.1);
-      --toolbar-btn-hover: rgba(249, 115, 22, 0.1);
-      --source-tag-bg: rgba(249, 115, 22, 0.13);
-      --source-tag-color: #fb923c;
-    }}
+"""
 
-    [data-theme="light"] {{
-      --bg-dark: #f5f5f5;
-      --bg-panel: #ffffff;
-      --bg-panel2: #fafafa;
-      --border: #e5e5e5;
-      --accent: #ea580c;
-      --accent-2: #f97316;
-      --accent-hover: #c2410c;
-      --accent-glow: rgba(234, 88, 12, 0.15);
-      --text-main: #111111;
-      --text-muted: #555555;
-      --card-bg: #ffffff;
-      --card-bg-hover: #fff7ed;
-      --card-border-hover: #fdba74;
-      --tag-bg: #fff7ed;
-      --tag-color: #c2410c;
-      --filter-btn-bg: #f5f5f5;
-      --filter-btn-hover: #fff7ed;
-      --toolbar-btn-hover: #fff7ed;
-      --source-tag-bg: rgba(249,115,22,0.1);
-      --source-tag-color: #ea580c;
-    }}
+    page_body = f"""  </style>
+</head>
+<body>
 
-    * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+  <header class="header">
+    <div class="brand">
+      <button class="hamburger" id="hamburger-btn" onclick="toggleSidebar()" title="Filters">☰</button>
+      <h1>🔍 <span>Job Scout</span></h1>
+      <div class="subtitle" id="scrape-time" data-iso="{timestamp_iso}">Scraped on {timestamp_str}</div>
+    </div>
+    <div class="stats">
+      <div class="stat">
+        <span class="stat-val" id="header-job-count">{total_jobs}</span>
+        <span class="stat-lbl">Jobs</span>
+      </div>
+      <div class="stat">
+        <span class="stat-val" id="header-company-count">{companies_count}</span>
+        <span class="stat-lbl">Companies</span>
+      </div>
+      <button class="theme-toggle" id="theme-toggle" onclick="toggleTheme()" title="Toggle theme">🌙</button>
+      <button class="refresh-btn" id="refresh-btn" onclick="startRefresh()">
+        🔄 Refresh
+      </button>
+    </div>
+  </header>
+  
+  {new_banner_html}
+  {toolbar_html}
 
-    body {{
-      font-family: -apple-system, BlinkMacSystemFont, 'Inter', 'Segoe UI', Roboto, sans-serif;
-      background: var(--bg-dark);
-      color: var(--text-main);
-      height: 100vh;
-      display: flex;
-      flex-direction: column;
-      overflow: hidden;
-    }}
+  <div class="sidebar-backdrop" id="sidebar-backdrop" onclick="toggleSidebar()"></div>
 
-    /* Header */
-    .header {{
-      background: var(--bg-panel);
-      padding: 1rem 2rem;
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      flex-shrink: 0;
-      z-index: 10;
-    }}
+  <div id="scraping-banner" style="display:none; background:linear-gradient(135deg,#f97316,#ea580c); color:#fff; padding:0.55rem 2rem; font-size:0.88rem; font-weight:600; display:none; align-items:center; gap:0.6rem; flex-shrink:0;">
+    <span style="display:inline-block;width:12px;height:12px;border:2px solid rgba(255,255,255,0.4);border-top-color:#fff;border-radius:50%;animation:spin 0.7s linear infinite;"></span>
+    Scraping in progress — new jobs will appear when complete.
+  </div>
 
-    .brand {{
-      display: flex;
-      align-items: center;
-      gap: 0.8rem;
-    }}
+  <div class="main-container">
+    {sidebar_html}
+    """
 
-    .brand h1 {{ font-size: 1.25rem; font-weight: 700; color: #fff; }}
-    .brand span {{ color: var(--accent); }}
-    .subtitle {{ color: var(--text-muted); font-size: 0.85rem; margin-top: 2px; }}
+    # The job cards go between page_head and page_tail
+    page_tail = f"""
+  </div>
 
-    .stats {{ display: flex; gap: 1.5rem; align-items: center; }}
-    .stat {{ display: flex; flex-direction: column; align-items: flex-end; }}
-    .stat-val {{ font-size: 1.1rem; font-weight: 700; color: var(--text-main); line-height: 1; }}
-    .stat-lbl {{ font-size: 0.7rem; color: var(--text-muted); text-transform: uppercase; margin-top: 4px; }}
+  <script>
+    // State
+    let currentState = {{
+        company: 'all',
+        hours: 0, // 0 = all time
+        searchQuery: '',
+        newOnly: false,
+    }};
 
-    /* Theme Toggle */
-    .theme-toggle {{
-      background: var(--filter-btn-bg);
-      border: 1px solid var(--border);
-      color: var(--text-muted);
-      width: 36px; height: 36px;
-      border-radius: 8px;
-      cursor: pointer;
-      font-size: 1.1rem;
-      display: flex; align-items: center; justify-content: center;
-      transition: all 0.2s;
+    let searchTimer = null;
+    function handleSearch(value) {{
+        clearTimeout(searchTimer);
+        searchTimer = setTimeout(() => {{
+            currentState.searchQuery = value.toLowerCase().trim();
+            const clearBtn = document.getElementById('search-clear');
+            if (clearBtn) clearBtn.style.display = value.length > 0 ? 'block' : 'none';
+            applyFilters();
+        }}, 150);
     }}
-    .theme-toggle:hover {{ background: var(--filter-btn-hover); color: var(--text-main); }}
 
-    /* Refresh Button */
-    .refresh-btn {{
-      background: linear-gradient(135deg, var(--accent), var(--accent-hover));
-      color: #fff; border: none;
-      padding: 0.5rem 1.2rem;
-      border-radius: 8px; font-size: 0.85rem;
-      cursor: pointer; font-weight: 600;
-      transition: all 0.25s;
-      display: none; /* Hidden until server detected */
-      align-items: center; gap: 6px;
-    }}
-    .refresh-btn:hover {{ transform: translateY(-1px); box-shadow: 0 4px 15px var(--accent-glow); }}
-    .refresh-btn:disabled {{ opacity: 0.6; cursor: not-allowed; transform: none; box-shadow: none; }}
-    .refresh-btn .spinner {{
-      display: inline-block; width: 14px; height: 14px;
-      border: 2px solid rgba(255,255,255,0.3);
-      border-top-color: #fff; border-radius: 50%;
-      animation: spin 0.7s linear infinite;
+    function clearSearch() {{
+        const input = document.getElementById('search-box');
+        if (input) input.value = '';
+        currentState.searchQuery = '';
+        const clearBtn = document.getElementById('search-clear');
+        if (clearBtn) clearBtn.style.display = 'none';
+        applyFilters();
     }}
-    @keyframes spin {{ to {{ transform: rotate(360deg); }} }}
 
-    /* New-jobs Banner */
-    .new-banner {{
-      background: linear-gradient(135deg, var(--accent), var(--accent-hover));
-      color: #fff;
-      padding: 0 2rem;
-      display: flex;
-      flex-direction: column;
-      font-size: 0.9rem;
-      font-weight: 600;
-      letter-spacing: 0.01em;
-      flex-shrink: 0;
-      animation: slideDown 0.4s ease;
+    function filterNew(btn) {{
+        const isActive = !btn.classList.contains('active');
+        btn.classList.toggle('active', isActive);
+        currentState.newOnly = isActive;
+
+        // Apply/remove the disabled-filters class to body
+        document.body.classList.toggle('new-mode-active', isActive);
+
+        if (isActive) {{
+            // Reset company & time filter visuals
+            currentState.company = 'all';
+            currentState.hours = 0;
+            currentState.searchQuery = '';
+            document.querySelectorAll('.comp-filter').forEach(b => b.classList.remove('active'));
+            const allCompBtn = document.querySelector('.comp-filter');
+            if (allCompBtn) allCompBtn.classList.add('active');
+            document.querySelectorAll('.time-filter').forEach(b => b.classList.remove('active'));
+            const allTimeBtn = document.querySelector('.time-filter');
+            if (allTimeBtn) allTimeBtn.classList.add('active');
+            const searchBox = document.getElementById('search-box');
+            if (searchBox) searchBox.value = '';
+            const clearBtn = document.getElementById('search-clear');
+            if (clearBtn) clearBtn.style.display = 'none';
+        }}
+        applyFilters();
     }}
-    .banner-top {{
-      display: flex;
-      align-items: center;
-      justify-content: space-between;
-      padding: 0.65rem 0;
+
+    function _deactivateNewTab() {{
+        const newBtn = document.getElementById('new-tab-btn');
+        if (newBtn && newBtn.classList.contains('active')) {{
+            newBtn.classList.remove('active');
+            currentState.newOnly = false;
+            document.body.classList.remove('new-mode-active');
+        }}
     }}
-    .banner-left {{
-      display: flex;
-      align-items: center;
-      gap: 0.6rem;
+
+    function filterCompany(companyId, btn) {{
+        _deactivateNewTab();
+        // Update active class
+        document.querySelectorAll('.comp-filter').forEach(b => b.classList.remove('active'));
+        btn.classList.add('active');
+        
+        currentState.company = companyId;
+        applyFilters();
     }}
-    @keyframes slideDown {{
-      from {{ transform: translateY(-100%); opacity: 0; }}
-      to   {{ transform: translateY(0);    opacity: 1; }}
+    
+    function filterTime(hours, btn) {{
+        _deactivateNewTab();
+        document.querySelectorAll('.time-filter').forEach(b => b.classList.remove('active'));
+        btn.classList.add('active');
+        
+        currentState.hours = hours;
+        applyFilters();
     }}
-    .banner-toggle {{
-      background: rgba(255,255,255,0.2);
-      border: none; color: #fff;
-      width: 22px; height: 22px;
-      border-radius: 50%; cursor: pointer;
-      font-size: 0.65rem; font-weight: 700;
-      display: flex; align-items: center; justify-content: center;
-      transition: background 0.2s, transform 0.25s;
-      flex-shrink: 0;
-    }}
-    .banner-toggle:hover {{ background: rgba(255,255,255,0.35); }}
-    .banner-toggle.open {{ transform: rotate(90deg); }}
-    .banner-close {{
-      background: rgba(255,255,255,0.2);
-      border: none; color: #fff;
-      width: 24px; height: 24px;
-      border-radius: 50%; cursor: pointer;
-      font-size: 0.8rem; font-weight: 700;
-      display: flex; align-items: center; justify-content: center;
-      transition: background 0.2s;
-      flex-shrink: 0;
-    }}
-    .banner-close:hover {{ background: rgba(255,255,255,0.35); }}
-    .banner-error-pill {{
-      background: rgba(0,0,0,0.25);
-      color: #ffd4d4;
-      font-size: 0.75rem;
-      padding: 2px 8px;
-      border-radius: 99px;
-      font-weight: 700;
-      margin-left: 4px;
-    }}
-
-    /* Banner details (collapsible table) */
-    .banner-details {{
-      border-top: 1px solid rgba(255,255,255,0.15);
-      padding: 0.75rem 0 0.85rem;
-      overflow-x: auto;
-    }}
-    .scrape-results-table {{
-      border-collapse: collapse;
-      width: 100%;
-      font-size: 0.8rem;
-      font-weight: 400;
-    }}
-    .scrape-results-table th {{
-      text-align: left;
-      color: rgba(255,255,255,0.65);
-      font-size: 0.7rem;
-      text-transform: uppercase;
-      letter-spacing: 0.05em;
-      padding: 0 0.6rem 0.4rem;
-    }}
-    .sr-row td {{ padding: 0.25rem 0.6rem; }}
-    .sr-row-error td {{ background: rgba(0,0,0,0.15); border-radius: 4px; }}
-    .sr-name {{ color: rgba(255,255,255,0.9); font-weight: 500; white-space: nowrap; }}
-    .sr-type {{
-      font-size: 0.68rem; font-weight: 700;
-      padding: 1px 5px; border-radius: 3px;
-      background: rgba(255,255,255,0.18);
-      color: #fff;
-    }}
-    .sr-type-browser {{ background: rgba(200,150,255,0.3); color: #e0b0ff; }}
-    .sr-type-html {{ background: rgba(255,220,100,0.3); color: #ffe080; }}
-    .sr-status-cell {{ white-space: nowrap; }}
-    .sr-status {{ font-size: 0.8rem; }}
-    .sr-ok {{ color: #9effb4; }}
-    .sr-error {{ color: #ffaaaa; }}
-    .sr-warn {{ color: #ffd87a; }}
-    .sr-errmsg {{
-      font-size: 0.73rem;
-      color: rgba(255,200,200,0.85);
-      margin-left: 4px;
-      font-style: italic;
-      font-weight: 400;
+    
+    // Cards and sections are indexed on first use, so filter clicks don't
+    // re-query the DOM or re-read titles and timestamps
+    let filterIndex = null;
+    function getFilterIndex() {{
+        if (!filterIndex) {{
+            const sections = [...document.querySelectorAll('.company-section')].map(el => ({{
+                el,
+                comp: el.dataset.comp,
+                badge: el.querySelector('.company-name .badge'),
+                visible: 0,
+            }}));
+            const sectionByEl = new Map(sections.map(s => [s.el, s]));
+            const cards = [...document.querySelectorAll('.job-card')].map(el => {{
+                const titleEl = el.querySelector('.job-title');
+                return {{
+                    el,
+                    ts: parseFloat(el.dataset.ts),
+                    isNew: el.dataset.new === '1',
+                    title: titleEl ? titleEl.textContent.toLowerCase() : '',
+                    section: sectionByEl.get(el.closest('.company-section')),
+                }};
+            }});
+            filterIndex = {{ cards, sections }};
+        }}
+        return filterIndex;
     }}
 
-    /* NEW badge on job cards */
-    .new-badge {{
-      display: inline-block;
-      background: var(--accent);
-      color: #fff;
-      font-size: 0.6rem;
-      font-weight: 800;
-      letter-spacing: 0.08em;
-      padding: 2px 6px;
-      border-radius: 4px;
-      vertical-align: middle;
-      text-transform: uppercase;
-      margin-left: 4px;
-      flex-shrink: 0;
-    }}
+    function applyFilters() {{
+        const {{ cards, sections }} = getFilterIndex();
+        const nowTs = Math.floor(Date.now() / 1000);
+        const maxAge = currentState.hours * 3600;
+        const query = currentState.searchQuery;
+        let visibleCount = 0;
+        let visibleSections = 0;
 
-    /* New tab button in sidebar */
-    .new-badgish {{
-      background: var(--accent) !important;
-      color: #fff !important;
-    }}
-    .new-tab-btn {{
-      border: 1px solid rgba(249,115,22,0.3);
-      color: var(--accent) !important;
-      font-weight: 600;
-    }}
-    .new-tab-btn:hover {{
-      background: rgba(249,115,22,0.12) !important;
-      border-color: var(--accent) !important;
-    }}
-    .new-tab-btn.active {{
-      background: rgba(249,115,22,0.18) !important;
-      border-color: var(--accent) !important;
-      box-shadow: 0 0 12px rgba(249,115,22,0.25);
-    }}
+        sections.forEach(section => {{ section.visible = 0; }});
 
-    /* Disabled state for time filters when New mode is active */
-    .new-mode-active .time-filter {{
-      opacity: 0.3;
-      pointer-events: none;
-      cursor: not-allowed;
-    }}
-    .new-mode-active .toolbar-label {{
-      opacity: 0.3;
-    }}
+        // Loop all cards once, counting visible cards per section
+        cards.forEach(card => {{
+            let visible;
+            if (currentState.newOnly) {{
+                // New-only mode: show only new jobs, skip all other filters
+                visible = card.isNew;
+            }} else {{
+                // Time filter, then search filter (matched against job title)
+                visible = !(currentState.hours > 0 && nowTs - card.ts > maxAge)
+                    && (!query || card.title.includes(query));
+            }}
 
-    
-    /* Toolbar (Horizontal Date Filters) */
-    .toolbar {{
-      background: var(--bg-panel);
-      border-top: 1px solid var(--border);
-      border-bottom: 1px solid var(--border);
-      padding: 0.8rem 2rem;
-      display: flex;
-      gap: 0.8rem;
-      overflow-x: auto;
-      align-items: center;
-      flex-shrink: 0;
-    }}
+            card.el.style.display = visible ? 'flex' : 'none';
+            if (visible && card.section) card.section.visible++;
+        }});
 
-    .toolbar-label {{
-      font-size: 0.75rem;
-      text-transform: uppercase;
-      color: var(--text-muted);
-      letter-spacing: 0.05em;
-      font-weight: 600;
-      margin-right: 0.5rem;
-    }}
-    
-    .toolbar-btn {{
-      background: var(--filter-btn-bg);
-      border: 1px solid transparent;
-      color: var(--text-muted);
-      padding: 0.4rem 0.8rem;
-      border-radius: 6px;
-      cursor: pointer;
-      font-size: 0.85rem;
-      transition: all 0.2s;
-      white-space: nowrap;
-      display: flex;
-      align-items: center;
-      gap: 6px;
-    }}
-    .toolbar-btn:hover {{ background: var(--toolbar-btn-hover); color: var(--text-main); }}
-    .toolbar-btn.active {{
-      background: rgba(99, 102, 241, 0.1);
-      color: var(--accent);
-      border-color: rgba(99, 102, 241, 0.2);
-      font-weight: 600;
-      box-shadow: 0 0 10px rgba(99, 102, 241, 0.1);
-    }}
-    
-    .toolbar-spacer {{ flex: 1; }}
-    .toolbar-info {{ color: var(--text-muted); font-size: 0.8rem; }}
+        // Hide empty sections / update badge counts
+        sections.forEach(section => {{
+            // Apply company filter (works in both normal and newOnly mode)
+            if (currentState.company !== 'all' && section.comp !== currentState.company) {{
+                section.el.style.display = 'none';
+                return;
+            }}
 
-    /* Search Box */
-    .search-box {{
-      background: var(--filter-btn-bg);
-      border: 1px solid var(--border);
-      color: var(--text-main);
-      padding: 0.4rem 0.8rem;
-      padding-right: 2rem;
-      border-radius: 6px;
-      font-size: 0.85rem;
-      outline: none;
-      transition: all 0.2s;
-      min-width: 200px;
-      font-family: inherit;
-    }}
-    .search-box::placeholder {{ color: var(--text-muted); opacity: 0.6; }}
-    .search-box:focus {{
-      border-color: var(--accent);
-      box-shadow: 0 0 0 2px var(--accent-glow);
-    }}
-    .search-wrapper {{
-      position: relative;
-      display: flex;
-      align-items: center;
-    }}
-    .search-clear {{
-      position: absolute;
-      right: 6px;
-      background: none;
-      border: none;
-      color: var(--text-muted);
-      cursor: pointer;
-      font-size: 0.85rem;
-      padding: 2px 4px;
-      border-radius: 4px;
-      line-height: 1;
-      display: none;
-      transition: color 0.2s;
-    }}
-    .search-clear:hover {{ color: var(--text-main); }}
+            if (section.visible === 0) {{
+                section.el.style.display = 'none';
+            }} else {{
+                section.el.style.display = 'block';
+                visibleCount += section.visible;
+                visibleSections++;
+            }}
 
-    /* Layout */
-    .main-container {{
-      display: grid;
-      grid-template-columns: 260px 1fr;
-      flex: 1;
-      overflow: hidden;
-    }}
+            // Update the per-company badge count in the section header
+            if (section.badge) section.badge.textContent = section.visible;
+        }});
 
-    /* Sidebar */
-    .sidebar {{
-      background: var(--bg-panel);
-      border-right: 1px solid var(--border);
-      padding: 1.5rem;
-      overflow-y: auto;
-    }}
+        // Update "All Companies" sidebar badge to reflect total visible
+        const allCompBadge = document.querySelector('.comp-filter:first-of-type .badgish');
+        if (allCompBadge) allCompBadge.textContent = visibleCount;
 
-    .filter-group {{ margin-bottom: 2rem; }}
-    .filter-title {{
-      font-size: 0.75rem;
-      text-transform: uppercase;
-      color: var(--text-muted);
-      margin-bottom: 0.8rem;
-      letter-spacing: 0.05em;
-      border-bottom: 1px solid var(--border);
-      padding-bottom: 0.4rem;
-    }}
+        // Update visible count in toolbar and header
+        const countSpan = document.getElementById('visible-count');
+        if (countSpan) countSpan.textContent = visibleCount + ' jobs visible';
+        updateHeaderCount(visibleCount, visibleSections);
 
-    .filter-btn {{
-      display: flex;
-      justify-content: space-between;
-      align-items: center;
-      width: 100%;
-      background: transparent;
-      border: 1px solid transparent;
-      color: var(--text-muted);
-      padding: 0.5rem 0.8rem;
-      margin-bottom: 0.2rem;
-      border-radius: 6px;
-      cursor: pointer;
-      font-size: 0.85rem;
-      transition: all 0.2s;
-      text-align: left;
+        document.querySelector('.content-area').scrollTop = 0;
     }}
 
-    .filter-btn:hover {{ background: var(--filter-btn-hover); color: var(--text-main); }}
-    .filter-btn.active {{
-      background: rgba(99, 102, 241, 0.1);
-      color: var(--accent);
-      border-color: rgba(99, 102, 241, 0.2);
-      font-weight: 600;
+    function updateHeaderCount(count, companyCount) {{
+        const el = document.getElementById('header-job-count');
+        if (el) el.textContent = count;
+        // Also update visible company count
+        const compEl = document.getElementById('header-company-count');
+        if (compEl) compEl.textContent = companyCount;
     }}
 
-    .badgish {{
-      background: var(--tag-bg);
-      border-radius: 99px;
-      padding: 2px 8px;
-      font-size: 0.7rem;
-      color: var(--tag-color);
+    // ── Theme Toggle ────────────────────────────────────────
+    function toggleTheme() {{
+      const isDark = !document.body.hasAttribute('data-theme');
+      if (isDark) {{
+        document.body.setAttribute('data-theme', 'light');
+        document.getElementById('theme-toggle').textContent = '☀️';
+        localStorage.setItem('js-theme', 'light');
+      }} else {{
+        document.body.removeAttribute('data-theme');
+        document.getElementById('theme-toggle').textContent = '🌙';
+        localStorage.setItem('js-theme', 'dark');
+      }}
     }}
-    .filter-btn.active .badgish, .toolbar-btn.active .badgish {{ background: var(--accent); color: #fff; }}
 
-    /* Content Area */
-    .content-area {{
-      padding: 2rem;
-      overflow-y: auto;
-      scroll-behavior: smooth;
-    }}
+    // Restore saved theme and sync counts on load
+    (function restoreTheme() {{
+      const saved = localStorage.getItem('js-theme');
+      if (saved === 'light') {{
+        document.body.setAttribute('data-theme', 'light');
+        document.getElementById('theme-toggle').textContent = '☀️';
+      }}
 
-    .company-section {{ margin-bottom: 3rem; }}
-    .company-name {{
-      font-size: 1.1rem;
-      color: var(--text-main);
-      margin-bottom: 1rem;
-      padding-bottom: 0.5rem;
-      border-bottom: 2px solid;
-      border-image: linear-gradient(90deg, var(--accent), transparent) 1;
-      display: flex;
-      align-items: center;
-      gap: 0.8rem;
-    }}
+      // Format scrape timestamp in browser's local timezone
+      const scrapeEl = document.getElementById('scrape-time');
+      if (scrapeEl && scrapeEl.dataset.iso) {{
+        try {{
+          const d = new Date(scrapeEl.dataset.iso);
+          if (!isNaN(d)) {{
+            scrapeEl.textContent = 'Scraped on ' + d.toLocaleDateString('en-US', {{
+              year: 'numeric', month: 'long', day: 'numeric',
+              hour: 'numeric', minute: '2-digit'
+            }});
+          }}
+        }} catch(e) {{}}
+      }}
 
-    .job-grid {{
-      display: grid;
-      grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-      gap: 1rem;
+      // Format all job dates in browser's local timezone
+      document.querySelectorAll('.job-date[data-iso]').forEach(el => {{
+        const iso = el.dataset.iso;
+        if (!iso) return;
+        try {{
+          const d = new Date(iso);
+          if (isNaN(d)) return;
+          el.textContent = '📅 ' + d.toLocaleDateString('en-US', {{
+            month: 'short', day: 'numeric',
+            hour: 'numeric', minute: '2-digit'
+          }});
+        }} catch(e) {{}}
+      }});
+      // Sync header counts to match what's actually visible
+      applyFilters();
+    }})();
+
+    // ── Collapsible Banner ──────────────────────────────────
+    function toggleBannerDetails() {{
+      const details = document.getElementById('banner-details');
+      const btn = document.getElementById('banner-toggle-btn');
+      if (!details) return;
+      const isOpen = details.style.display === 'none' || details.style.display === '';
+      details.style.display = isOpen ? 'block' : 'none';
+      if (btn) btn.classList.toggle('open', isOpen);
     }}
 
-    .job-card {{
-      background: var(--card-bg);
-      border: 1px solid var(--border);
-      border-radius: 8px;
-      padding: 1.2rem;
-      transition: all 0.2s;
-      display: flex;
-      flex-direction: column;
-      position: relative;
-      text-decoration: none;
-      color: inherit;
-      cursor: pointer;
+    // ── Server-aware Refresh ────────────────────────────────
+    function showScrapingBanner(show) {{
+      const b = document.getElementById('scraping-banner');
+      if (b) b.style.display = show ? 'flex' : 'none';
     }}
 
-    .job-card:hover {{
-      background: var(--card-bg-hover);
-      border-color: var(--card-border-hover);
-      box-shadow: 0 4px 24px var(--accent-glow);
-      transform: translateY(-2px);
+    (function detectServer() {{
+      fetch('/api/status')
+        .then(r => r.json())
+        .then(data => {{
+          const btn = document.getElementById('refresh-btn');
+          if (btn) {{
+            btn.style.display = 'flex';
+            if (data.running) {{
+              btn.disabled = true;
+              btn.innerHTML = '<span class="spinner"></span> Scraping...';
+              showScrapingBanner(true);
+              pollStatus();
+            }}
+          }}
+        }})
+        .catch(() => {{}});  // Not served from server — hide button
+    }})();
+
+    // ── Mobile Sidebar ──────────────────────────────────────
+    function toggleSidebar() {{
+      const sidebar = document.getElementById('main-sidebar');
+      const backdrop = document.getElementById('sidebar-backdrop');
+      if (!sidebar) return;
+      const isOpen = sidebar.classList.toggle('open');
+      backdrop.classList.toggle('open', isOpen);
+      document.body.style.overflow = isOpen ? 'hidden' : '';
     }}
 
-    .job-title {{
-      font-size: 1rem;
-      color: var(--text-main);
-      font-weight: 600;
-      margin-bottom: 0.5rem;
-      line-height: 1.35;
-      letter-spacing: 0.018em;
-      display: flex;
-      align-items: center;
-      gap: 8px;
+    function startRefresh() {{
+      const btn = document.getElementById('refresh-btn');
+      btn.disabled = true;
+      btn.innerHTML = '<span class="spinner"></span> Scraping...';
+      showScrapingBanner(true);
+
+      fetch('/api/refresh', {{ method: 'POST' }})
+        .then(r => r.json())
+        .then(data => {{
+          if (data.status === 'already_running') {{
+            // Already in progress, just poll
+          }}
+          pollStatus();
+        }})
+        .catch(err => {{
+          btn.innerHTML = '❌ Error';
+          setTimeout(() => {{
+            btn.innerHTML = '🔄 Refresh';
+            btn.disabled = false;
+          }}, 3000);
+        }});
     }}
 
-    .job-meta {{
-      font-size: 0.85rem;
-      color: var(--text-muted);
-      margin-bottom: 1rem;
-      display: flex;
-      gap: 1rem;
+    function pollStatus() {{
+      const poll = setInterval(() => {{
+        fetch('/api/status')
+          .then(r => r.json())
+          .then(data => {{
+            if (!data.running) {{
+              clearInterval(poll);
+              showScrapingBanner(false);
+              const btn = document.getElementById('refresh-btn');
+              if (data.last_error) {{
+                btn.innerHTML = '❌ Failed';
+                setTimeout(() => {{
+                  btn.innerHTML = '🔄 Refresh';
+                  btn.disabled = false;
+                }}, 3000);
+              }} else {{
+                btn.innerHTML = '✅ Done!';
+                setTimeout(() => window.location.reload(), 800);
+              }}
+            }}
+          }});
+      }}, 2000);
     }}
+  </script>
+</body>
+</html>"""
+
+    # Written piece by piece through a 1 MB buffer, so the full page is never
+    # held as one string
+    with open(output_path, "w", encoding="utf-8", buffering=HTML_BUFFER_SIZE) as f:
+        f.write(page_head)
+        f.write(_REPORT_CSS)
+        f.write(page_body)
+        f.writelines(card_parts)
+        f.write(page_tail)
+
+    return output_path
+
+
+def _esc(text: str) -> str:
+    """HTML-escape a string."""
+    return (
+        text.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+    )
+
+
+def _esc_attr(text: str) -> str:
+    """Escape a string for a double-quoted attribute value (< and > are harmless there)."""
+    return text.replace("&", "&amp;").replace('"', "&quot;")
+
+
+# Static stylesheet for the report page (kept out of the page f-string, so
+# it needs no brace doubling and is written as-is)
+_REPORT_CSS = """\
+    :root {
+      --bg-dark: #111111;
+      --bg-panel: #1a1a1a;
+      --bg-panel2: #1f1f1f;
+      --border: #2e2e2e;
+      --accent: #f97316;
+      --accent-2: #fb923c;
+      --accent-hover: #ea580c;
+      --accent-glow: rgba(249, 115, 22, 0.22);
+      --text-main: #ffffff;
+      --text-muted: #c0c0cc;
+      --card-bg: rgba(255,255,255,0.035);
+      --card-bg-hover: rgba(249, 115, 22, 0.07);
+      --card-border-hover: rgba(249, 115, 22, 0.45);
+      --tag-bg: rgba(249, 115, 22, 0.12);
+      --tag-color: #fdba74;
+      --filter-btn-bg: rgba(255,255,255,0.05);
+      --filter-btn-hover: rgba(249, 115, 22, 0.1);
+      --toolbar-btn-hover: rgba(249, 115, 22, 0.1);
+      --source-tag-bg: rgba(249, 115, 22, 0.13);
+      --source-tag-color: #fb923c;
+    }
+
+    [data-theme="light"] {
+      --bg-dark: #f5f5f5;
+      --bg-panel: #ffffff;
+      --bg-panel2: #fafafa;
+      --border: #e5e5e5;
+      --accent: #ea580c;
+      --accent-2: #f97316;
+      --accent-hover: #c2410c;
+      --accent-glow: rgba(234, 88, 12, 0.15);
+      --text-main: #111111;
+      --text-muted: #555555;
+      --card-bg: #ffffff;
+      --card-bg-hover: #fff7ed;
+      --card-border-hover: #fdba74;
+      --tag-bg: #fff7ed;
+      --tag-color: #c2410c;
+      --filter-btn-bg: #f5f5f5;
+      --filter-btn-hover: #fff7ed;
+      --toolbar-btn-hover: #fff7ed;
+      --source-tag-bg: rgba(249,115,22,0.1);
+      --source-tag-color: #ea580c;
+    }
 
-    .job-tags {{
+    * { margin: 0; padding: 0; box-sizing: border-box; }
+
+    body {
+      font-family: -apple-system, BlinkMacSystemFont, 'Inter', 'Segoe UI', Roboto, sans-serif;
+      background: var(--bg-dark);
+      color: var(--text-main);
+      height: 100vh;
       display: flex;
-      gap: 0.5rem;
-      margin-bottom: 1rem;
-      flex-wrap: wrap;
-    }}
+      flex-direction: column;
+      overflow: hidden;
+    }
 
-    .tag {{
-      font-size: 0.7rem;
-      background: var(--tag-bg);
-      padding: 2px 8px;
-      border-radius: 4px;
-      color: var(--tag-color);
-    }}
-    .source-tag {{ background: var(--source-tag-bg); color: var(--source-tag-color); }}
+    /* Header */
+    .header {
+      background: var(--bg-panel);
+      padding: 1rem 2rem;
+      display: flex;
+      justify-content: space-between;
+      align-items: center;
+      flex-shrink: 0;
+      z-index: 10;
+    }
 
-    .apply-link {{
-      margin-top: auto;
-      font-size: 0.85rem;
-      color: var(--accent);
-      text-decoration: none;
-      font-weight: 500;
+    .brand {
       display: flex;
       align-items: center;
-    }}
-    .apply-link:hover {{ color: var(--accent-hover); }}
+      gap: 0.8rem;
+    }
 
-    /* ── Mobile / Responsive ─────────────────────────────── */
-    .hamburger {{
-      display: none;
+    .brand h1 { font-size: 1.25rem; font-weight: 700; color: #fff; }
+    .brand span { color: var(--accent); }
+    .subtitle { color: var(--text-muted); font-size: 0.85rem; margin-top: 2px; }
+
+    .stats { display: flex; gap: 1.5rem; align-items: center; }
+    .stat { display: flex; flex-direction: column; align-items: flex-end; }
+    .stat-val { font-size: 1.1rem; font-weight: 700; color: var(--text-main); line-height: 1; }
+    .stat-lbl { font-size: 0.7rem; color: var(--text-muted); text-transform: uppercase; margin-top: 4px; }
+
+    /* Theme Toggle */
+    .theme-toggle {
       background: var(--filter-btn-bg);
       border: 1px solid var(--border);
-      color: var(--text-main);
+      color: var(--text-muted);
       width: 36px; height: 36px;
       border-radius: 8px;
       cursor: pointer;
       font-size: 1.1rem;
-      align-items: center; justify-content: center;
+      display: flex; align-items: center; justify-content: center;
       transition: all 0.2s;
-      flex-shrink: 0;
-    }}
-    .hamburger:hover {{ background: var(--filter-btn-hover); }}
+    }
+    .theme-toggle:hover { background: var(--filter-btn-hover); color: var(--text-main); }
 
-    .sidebar-close {{
-      display: none;
-      width: 100%;
-      background: transparent;
-      border: 1px solid var(--border);
-      color: var(--text-muted);
-      padding: 0.6rem;
-      border-radius: 6px;
-      cursor: pointer;
-      font-size: 0.85rem;
-      margin-bottom: 1rem;
-      transition: all 0.2s;
-    }}
-    .sidebar-close:hover {{ background: var(--filter-btn-hover); color: var(--text-main); }}
-
-    .sidebar-backdrop {{
-      display: none;
-      position: fixed;
-      inset: 0;
-      background: rgba(0,0,0,0.6);
-      z-index: 40;
-    }}
-
-    @media (max-width: 800px) {{
-      .hamburger {{ display: flex; }}
-      .sidebar-close {{ display: block; }}
-
-      .main-container {{ grid-template-columns: 1fr; }}
-
-      .sidebar {{
-        position: fixed;
-        top: 0; left: -280px;
-        width: 280px;
-        height: 100%;
-        z-index: 50;
-        transition: left 0.28s ease;
-        box-shadow: 4px 0 32px rgba(0,0,0,0.4);
-      }}
-      .sidebar.open {{
-        left: 0;
-      }}
-      .sidebar-backdrop.open {{
-        display: block;
-      }}
-
-      .toolbar {{
-        flex-wrap: wrap;
-        gap: 0.5rem;
-        padding: 0.6rem 1rem;
-      }}
-      .toolbar-label {{ display: none; }}
-      .toolbar-spacer {{ display: none; }}
-      .search-box {{ min-width: 0; width: 100%; }}
-      .search-wrapper {{ width: 100%; }}
-      .toolbar-info {{ width: 100%; text-align: right; font-size: 0.75rem; }}
-
-      .header {{ padding: 0.8rem 1rem; }}
-      .brand h1 {{ font-size: 1rem; }}
-      .subtitle {{ display: none; }}
-      .stats {{ gap: 0.8rem; }}
-      .stat-val {{ font-size: 0.95rem; }}
-
-      .content-area {{ padding: 1rem; }}
-      .job-grid {{ grid-template-columns: 1fr; }}
-    }}
-  </style>
-</head>
-<body>
-
-  <header class="header">
-    <div class="brand">
-      <button class="hamburger" id="hamburger-btn" onclick="toggleSidebar()" title="Filters">☰</button>
-      <h1>🔍 <span>Job Scout</span></h1>
-      <div class="subtitle" id="scrape-time" data-iso="{timestamp_iso}">Scraped on {timestamp_str}</div>
-    </div>
-    <div class="stats">
-      <div class="stat">
-        <span class="stat-val" id="header-job-count">{total_jobs}</span>
-        <span class="stat-lbl">Jobs</span>
-      </div>
-      <div class="stat">
-        <span class="stat-val" id="header-company-count">{companies_count}</span>
-        <span class="stat-lbl">Companies</span>
-      </div>
-      <button class="theme-toggle" id="theme-toggle" onclick="toggleTheme()" title="Toggle theme">🌙</button>
-      <button class="refresh-btn" id="refresh-btn" onclick="startRefresh()">
-        🔄 Refresh
-      </button>
-    </div>
-  </header>
-  
-  {new_banner_html}
-  {toolbar_html}
-
-  <div class="sidebar-backdrop" id="sidebar-backdrop" onclick="toggleSidebar()"></div>
-
-  <div id="scraping-banner" style="display:none; background:linear-gradient(135deg,#f97316,#ea580c); color:#fff; padding:0.55rem 2rem; font-size:0.88rem; font-weight:600; display:none; align-items:center; gap:0.6rem; flex-shrink:0;">
-    <span style="display:inline-block;width:12px;height:12px;border:2px solid rgba(255,255,255,0.4);border-top-color:#fff;border-radius:50%;animation:spin 0.7s linear infinite;"></span>
-    Scraping in progress — new jobs will appear when complete.
-  </div>
-
-  <div class="main-container">
-    {sidebar_html}
-    {job_cards_html}
-  </div>
-
-  <script>
-    // State
-    let currentState = {{
-        company: 'all',
-        hours: 0, // 0 = all time
-        searchQuery: '',
-        newOnly: false,
-    }};
+    /* Refresh Button */
+    .refresh-btn {
+      background: linear-gradient(135deg, var(--accent), var(--accent-hover));
+      color: #fff; border: none;
+      padding: 0.5rem 1.2rem;
+      border-radius: 8px; font-size: 0.85rem;
+      cursor: pointer; font-weight: 600;
+      transition: all 0.25s;
+      display: none; /* Hidden until server detected */
+      align-items: center; gap: 6px;
+    }
+    .refresh-btn:hover { transform: translateY(-1px); box-shadow: 0 4px 15px var(--accent-glow); }
+    .refresh-btn:disabled { opacity: 0.6; cursor: not-allowed; transform: none; box-shadow: none; }
+    .refresh-btn .spinner {
+      display: inline-block; width: 14px; height: 14px;
+      border: 2px solid rgba(255,255,255,0.3);
+      border-top-color: #fff; border-radius: 50%;
+      animation: spin 0.7s linear infinite;
+    }
+    @keyframes spin { to { transform: rotate(360deg); } }
 
-    let searchTimer = null;
-    function handleSearch(value) {{
-        clearTimeout(searchTimer);
-        searchTimer = setTimeout(() => {{
-            currentState.searchQuery = value.toLowerCase().trim();
-            const clearBtn = document.getElementById('search-clear');
-            if (clearBtn) clearBtn.style.display = value.length > 0 ? 'block' : 'none';
-            applyFilters();
-        }}, 150);
-    }}
+    /* New-jobs Banner */
+    .new-banner {
+      background: linear-gradient(135deg, var(--accent), var(--accent-hover));
+      color: #fff;
+      padding: 0 2rem;
+      display: flex;
+      flex-direction: column;
+      font-size: 0.9rem;
+      font-weight: 600;
+      letter-spacing: 0.01em;
+      flex-shrink: 0;
+      animation: slideDown 0.4s ease;
+    }
+    .banner-top {
+      display: flex;
+      align-items: center;
+      justify-content: space-between;
+      padding: 0.65rem 0;
+    }
+    .banner-left {
+      display: flex;
+      align-items: center;
+      gap: 0.6rem;
+    }
+    @keyframes slideDown {
+      from { transform: translateY(-100%); opacity: 0; }
+      to   { transform: translateY(0);    opacity: 1; }
+    }
+    .banner-toggle {
+      background: rgba(255,255,255,0.2);
+      border: none; color: #fff;
+      width: 22px; height: 22px;
+      border-radius: 50%; cursor: pointer;
+      font-size: 0.65rem; font-weight: 700;
+      display: flex; align-items: center; justify-content: center;
+      transition: background 0.2s, transform 0.25s;
+      flex-shrink: 0;
+    }
+    .banner-toggle:hover { background: rgba(255,255,255,0.35); }
+    .banner-toggle.open { transform: rotate(90deg); }
+    .banner-close {
+      background: rgba(255,255,255,0.2);
+      border: none; color: #fff;
+      width: 24px; height: 24px;
+      border-radius: 50%; cursor: pointer;
+      font-size: 0.8rem; font-weight: 700;
+      display: flex; align-items: center; justify-content: center;
+      transition: background 0.2s;
+      flex-shrink: 0;
+    }
+    .banner-close:hover { background: rgba(255,255,255,0.35); }
+    .banner-error-pill {
+      background: rgba(0,0,0,0.25);
+      color: #ffd4d4;
+      font-size: 0.75rem;
+      padding: 2px 8px;
+      border-radius: 99px;
+      font-weight: 700;
+      margin-left: 4px;
+    }
 
-    function clearSearch() {{
-        const input = document.getElementById('search-box');
-        if (input) input.value = '';
-        currentState.searchQuery = '';
-        const clearBtn = document.getElementById('search-clear');
-        if (clearBtn) clearBtn.style.display = 'none';
-        applyFilters();
-    }}
+    /* Banner details (collapsible table) */
+    .banner-details {
+      border-top: 1px solid rgba(255,255,255,0.15);
+      padding: 0.75rem 0 0.85rem;
+      overflow-x: auto;
+    }
+    .scrape-results-table {
+      border-collapse: collapse;
+      width: 100%;
+      font-size: 0.8rem;
+      font-weight: 400;
+    }
+    .scrape-results-table th {
+      text-align: left;
+      color: rgba(255,255,255,0.65);
+      font-size: 0.7rem;
+      text-transform: uppercase;
+      letter-spacing: 0.05em;
+      padding: 0 0.6rem 0.4rem;
+    }
+    .sr-row td { padding: 0.25rem 0.6rem; }
+    .sr-row-error td { background: rgba(0,0,0,0.15); border-radius: 4px; }
+    .sr-name { color: rgba(255,255,255,0.9); font-weight: 500; white-space: nowrap; }
+    .sr-type {
+      font-size: 0.68rem; font-weight: 700;
+      padding: 1px 5px; border-radius: 3px;
+      background: rgba(255,255,255,0.18);
+      color: #fff;
+    }
+    .sr-type-browser { background: rgba(200,150,255,0.3); color: #e0b0ff; }
+    .sr-type-html { background: rgba(255,220,100,0.3); color: #ffe080; }
+    .sr-status-cell { white-space: nowrap; }
+    .sr-status { font-size: 0.8rem; }
+    .sr-ok { color: #9effb4; }
+    .sr-error { color: #ffaaaa; }
+    .sr-warn { color: #ffd87a; }
+    .sr-errmsg {
+      font-size: 0.73rem;
+      color: rgba(255,200,200,0.85);
+      margin-left: 4px;
+      font-style: italic;
+      font-weight: 400;
+    }
 
-    function filterNew(btn) {{
-        const isActive = !btn.classList.contains('active');
-        btn.classList.toggle('active', isActive);
-        currentState.newOnly = isActive;
+    /* NEW badge on job cards */
+    .new-badge {
+      display: inline-block;
+      background: var(--accent);
+      color: #fff;
+      font-size: 0.6rem;
+      font-weight: 800;
+      letter-spacing: 0.08em;
+      padding: 2px 6px;
+      border-radius: 4px;
+      vertical-align: middle;
+      text-transform: uppercase;
+      margin-left: 4px;
+      flex-shrink: 0;
+    }
 
-        // Apply/remove the disabled-filters class to body
-        document.body.classList.toggle('new-mode-active', isActive);
+    /* New tab button in sidebar */
+    .new-badgish {
+      background: var(--accent) !important;
+      color: #fff !important;
+    }
+    .new-tab-btn {
+      border: 1px solid rgba(249,115,22,0.3);
+      color: var(--accent) !important;
+      font-weight: 600;
+    }
+    .new-tab-btn:hover {
+      background: rgba(249,115,22,0.12) !important;
+      border-color: var(--accent) !important;
+    }
+    .new-tab-btn.active {
+      background: rgba(249,115,22,0.18) !important;
+      border-color: var(--accent) !important;
+      box-shadow: 0 0 12px rgba(249,115,22,0.25);
+    }
 
-        if (isActive) {{
-            // Reset company & time filter visuals
-            currentState.company = 'all';
-            currentState.hours = 0;
-            currentState.searchQuery = '';
-            document.querySelectorAll('.comp-filter').forEach(b => b.classList.remove('active'));
-            const allCompBtn = document.querySelector('.comp-filter');
-            if (allCompBtn) allCompBtn.classList.add('active');
-            document.querySelectorAll('.time-filter').forEach(b => b.classList.remove('active'));
-            const allTimeBtn = document.querySelector('.time-filter');
-            if (allTimeBtn) allTimeBtn.classList.add('active');
-            const searchBox = document.getElementById('search-box');
-            if (searchBox) searchBox.value = '';
-            const clearBtn = document.getElementById('search-clear');
-            if (clearBtn) clearBtn.style.display = 'none';
-        }}
-        applyFilters();
-    }}
+    /* Disabled state for time filters when New mode is active */
+    .new-mode-active .time-filter {
+      opacity: 0.3;
+      pointer-events: none;
+      cursor: not-allowed;
+    }
+    .new-mode-active .toolbar-label {
+      opacity: 0.3;
+    }
 
-    function _deactivateNewTab() {{
-        const newBtn = document.getElementById('new-tab-btn');
-        if (newBtn && newBtn.classList.contains('active')) {{
-            newBtn.classList.remove('active');
-            currentState.newOnly = false;
-            document.body.classList.remove('new-mode-active');
-        }}
-    }}
+    
+    /* Toolbar (Horizontal Date Filters) */
+    .toolbar {
+      background: var(--bg-panel);
+      border-top: 1px solid var(--border);
+      border-bottom: 1px solid var(--border);
+      padding: 0.8rem 2rem;
+      display: flex;
+      gap: 0.8rem;
+      overflow-x: auto;
+      align-items: center;
+      flex-shrink: 0;
+    }
 
-    function filterCompany(companyId, btn) {{
-        _deactivateNewTab();
-        // Update active class
-        document.querySelectorAll('.comp-filter').forEach(b => b.classList.remove('active'));
-        btn.classList.add('active');
-        
-        currentState.company = companyId;
-        applyFilters();
-    }}
+    .toolbar-label {
+      font-size: 0.75rem;
+      text-transform: uppercase;
+      color: var(--text-muted);
+      letter-spacing: 0.05em;
+      font-weight: 600;
+      margin-right: 0.5rem;
+    }
     
-    function filterTime(hours, btn) {{
-        _deactivateNewTab();
-        document.querySelectorAll('.time-filter').forEach(b => b.classList.remove('active'));
-        btn.classList.add('active');
-        
-        currentState.hours = hours;
-        applyFilters();
-    }}
+    .toolbar-btn {
+      background: var(--filter-btn-bg);
+      border: 1px solid transparent;
+      color: var(--text-muted);
+      padding: 0.4rem 0.8rem;
+      border-radius: 6px;
+      cursor: pointer;
+      font-size: 0.85rem;
+      transition: all 0.2s;
+      white-space: nowrap;
+      display: flex;
+      align-items: center;
+      gap: 6px;
+    }
+    .toolbar-btn:hover { background: var(--toolbar-btn-hover); color: var(--text-main); }
+    .toolbar-btn.active {
+      background: rgba(99, 102, 241, 0.1);
+      color: var(--accent);
+      border-color: rgba(99, 102, 241, 0.2);
+      font-weight: 600;
+      box-shadow: 0 0 10px rgba(99, 102, 241, 0.1);
+    }
     
-    function applyFilters() {{
-        const allCards = document.querySelectorAll('.job-card');
-        const sections = document.querySelectorAll('.company-section');
-        const nowTs = Math.floor(Date.now() / 1000);
-        let visibleCount = 0;
-        
-        // Loop all cards and determine visibility
-        allCards.forEach(card => {{
-            let visible = true;
+    .toolbar-spacer { flex: 1; }
+    .toolbar-info { color: var(--text-muted); font-size: 0.8rem; }
 
-            // New-only mode: show only new jobs, skip all other filters
-            if (currentState.newOnly) {{
-                visible = card.dataset.new === '1';
-                card.style.display = visible ? 'flex' : 'none';
-                return;
-            }}
-            
-            // Time Filter
-            if (currentState.hours > 0) {{
-                const ts = parseFloat(card.dataset.ts);
-                const age = nowTs - ts;
-                if (age > (currentState.hours * 3600)) {{
-                    visible = false;
-                }}
-            }}
+    /* Search Box */
+    .search-box {
+      background: var(--filter-btn-bg);
+      border: 1px solid var(--border);
+      color: var(--text-main);
+      padding: 0.4rem 0.8rem;
+      padding-right: 2rem;
+      border-radius: 6px;
+      font-size: 0.85rem;
+      outline: none;
+      transition: all 0.2s;
+      min-width: 200px;
+      font-family: inherit;
+    }
+    .search-box::placeholder { color: var(--text-muted); opacity: 0.6; }
+    .search-box:focus {
+      border-color: var(--accent);
+      box-shadow: 0 0 0 2px var(--accent-glow);
+    }
+    .search-wrapper {
+      position: relative;
+      display: flex;
+      align-items: center;
+    }
+    .search-clear {
+      position: absolute;
+      right: 6px;
+      background: none;
+      border: none;
+      color: var(--text-muted);
+      cursor: pointer;
+      font-size: 0.85rem;
+      padding: 2px 4px;
+      border-radius: 4px;
+      line-height: 1;
+      display: none;
+      transition: color 0.2s;
+    }
+    .search-clear:hover { color: var(--text-main); }
 
-            // Search Filter — match against job title
-            if (visible && currentState.searchQuery) {{
-                const titleEl = card.querySelector('.job-title');
-                const title = titleEl ? titleEl.textContent.toLowerCase() : '';
-                if (!title.includes(currentState.searchQuery)) {{
-                    visible = false;
-                }}
-            }}
-            
-            card.style.display = visible ? 'flex' : 'none';
-        }});
-        
-        // Hide empty sections / update badge counts
-        sections.forEach(section => {{
-            // Apply company filter (works in both normal and newOnly mode)
-            if (currentState.company !== 'all' && section.dataset.comp !== currentState.company) {{
-                section.style.display = 'none';
-                return;
-            }}
+    /* Layout */
+    .main-container {
+      display: grid;
+      grid-template-columns: 260px 1fr;
+      flex: 1;
+      overflow: hidden;
+    }
 
-            section.style.display = 'block';
+    /* Sidebar */
+    .sidebar {
+      background: var(--bg-panel);
+      border-right: 1px solid var(--border);
+      padding: 1.5rem;
+      overflow-y: auto;
+    }
 
-            // Count visible cards in this section
-            const visibleCards = section.querySelectorAll('.job-card[style="display: flex;"]');
-            if (visibleCards.length === 0) {{
-                section.style.display = 'none';
-            }} else {{
-                visibleCount += visibleCards.length;
-            }}
+    .filter-group { margin-bottom: 2rem; }
+    .filter-title {
+      font-size: 0.75rem;
+      text-transform: uppercase;
+      color: var(--text-muted);
+      margin-bottom: 0.8rem;
+      letter-spacing: 0.05em;
+      border-bottom: 1px solid var(--border);
+      padding-bottom: 0.4rem;
+    }
 
-            // Update the per-company badge count in the section header
-            const badge = section.querySelector('.company-name .badge');
-            if (badge) badge.textContent = visibleCards.length;
-        }});
+    .filter-btn {
+      display: flex;
+      justify-content: space-between;
+      align-items: center;
+      width: 100%;
+      background: transparent;
+      border: 1px solid transparent;
+      color: var(--text-muted);
+      padding: 0.5rem 0.8rem;
+      margin-bottom: 0.2rem;
+      border-radius: 6px;
+      cursor: pointer;
+      font-size: 0.85rem;
+      transition: all 0.2s;
+      text-align: left;
+    }
 
-        // Update "All Companies" sidebar badge to reflect total visible
-        const allCompBadge = document.querySelector('.comp-filter:first-of-type .badgish');
-        if (allCompBadge) allCompBadge.textContent = visibleCount;
+    .filter-btn:hover { background: var(--filter-btn-hover); color: var(--text-main); }
+    .filter-btn.active {
+      background: rgba(99, 102, 241, 0.1);
+      color: var(--accent);
+      border-color: rgba(99, 102, 241, 0.2);
+      font-weight: 600;
+    }
 
-        // Update visible count in toolbar and header
-        const countSpan = document.getElementById('visible-count');
-        if (countSpan) countSpan.textContent = visibleCount + ' jobs visible';
-        updateHeaderCount(visibleCount);
+    .badgish {
+      background: var(--tag-bg);
+      border-radius: 99px;
+      padding: 2px 8px;
+      font-size: 0.7rem;
+      color: var(--tag-color);
+    }
+    .filter-btn.active .badgish, .toolbar-btn.active .badgish { background: var(--accent); color: #fff; }
 
-        document.querySelector('.content-area').scrollTop = 0;
-    }}
+    /* Content Area */
+    .content-area {
+      padding: 2rem;
+      overflow-y: auto;
+      scroll-behavior: smooth;
+    }
 
-    function updateHeaderCount(count) {{
-        const el = document.getElementById('header-job-count');
-        if (el) el.textContent = count;
-        // Also update visible company count
-        const compEl = document.getElementById('header-company-count');
-        if (compEl) {{
-            const visibleSections = document.querySelectorAll('.company-section:not([style*="display: none"])');
-            compEl.textContent = visibleSections.length;
-        }}
-    }}
+    .company-section { margin-bottom: 3rem; }
+    .company-name {
+      font-size: 1.1rem;
+      color: var(--text-main);
+      margin-bottom: 1rem;
+      padding-bottom: 0.5rem;
+      border-bottom: 2px solid;
+      border-image: linear-gradient(90deg, var(--accent), transparent) 1;
+      display: flex;
+      align-items: center;
+      gap: 0.8rem;
+    }
 
-    // ── Theme Toggle ────────────────────────────────────────
-    function toggleTheme() {{
-      const isDark = !document.body.hasAttribute('data-theme');
-      if (isDark) {{
-        document.body.setAttribute('data-theme', 'light');
-        document.getElementById('theme-toggle').textContent = '☀️';
-        localStorage.setItem('js-theme', 'light');
-      }} else {{
-        document.body.removeAttribute('data-theme');
-        document.getElementById('theme-toggle').textContent = '🌙';
-        localStorage.setItem('js-theme', 'dark');
-      }}
-    }}
+    .job-grid {
+      display: grid;
+      grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
+      gap: 1rem;
+    }
 
-    // Restore saved theme and sync counts on load
-    (function restoreTheme() {{
-      const saved = localStorage.getItem('js-theme');
-      if (saved === 'light') {{
-        document.body.setAttribute('data-theme', 'light');
-        document.getElementById('theme-toggle').textContent = '☀️';
-      }}
+    .job-card {
+      background: var(--card-bg);
+      border: 1px solid var(--border);
+      border-radius: 8px;
+      padding: 1.2rem;
+      transition: all 0.2s;
+      display: flex;
+      flex-direction: column;
+      position: relative;
+      text-decoration: none;
+      color: inherit;
+      cursor: pointer;
+    }
 
-      // Format scrape timestamp in browser's local timezone
-      const scrapeEl = document.getElementById('scrape-time');
-      if (scrapeEl && scrapeEl.dataset.iso) {{
-        try {{
-          const d = new Date(scrapeEl.dataset.iso);
-          if (!isNaN(d)) {{
-            scrapeEl.textContent = 'Scraped on ' + d.toLocaleDateString('en-US', {{
-              year: 'numeric', month: 'long', day: 'numeric',
-              hour: 'numeric', minute: '2-digit'
-            }});
-          }}
-        }} catch(e) {{}}
-      }}
+    .job-card:hover {
+      background: var(--card-bg-hover);
+      border-color: var(--card-border-hover);
+      box-shadow: 0 4px 24px var(--accent-glow);
+      transform: translateY(-2px);
+    }
 
-      // Format all job dates in browser's local timezone
-      document.querySelectorAll('.job-date[data-iso]').forEach(el => {{
-        const iso = el.dataset.iso;
-        if (!iso) return;
-        try {{
-          const d = new Date(iso);
-          if (isNaN(d)) return;
-          el.textContent = '📅 ' + d.toLocaleDateString('en-US', {{
-            month: 'short', day: 'numeric',
-            hour: 'numeric', minute: '2-digit'
-          }});
-        }} catch(e) {{}}
-      }});
-      // Sync header counts to match what's actually visible
-      applyFilters();
-    }})();
+    .job-title {
+      font-size: 1rem;
+      color: var(--text-main);
+      font-weight: 600;
+      margin-bottom: 0.5rem;
+      line-height: 1.35;
+      letter-spacing: 0.018em;
+      display: flex;
+      align-items: center;
+      gap: 8px;
+    }
 
-    // ── Collapsible Banner ──────────────────────────────────
-    function toggleBannerDetails() {{
-      const details = document.getElementById('banner-details');
-      const btn = document.getElementById('banner-toggle-btn');
-      if (!details) return;
-      const isOpen = details.style.display === 'none' || details.style.display === '';
-      details.style.display = isOpen ? 'block' : 'none';
-      if (btn) btn.classList.toggle('open', isOpen);
-    }}
+    .job-meta {
+      font-size: 0.85rem;
+      color: var(--text-muted);
+      margin-bottom: 1rem;
+      display: flex;
+      gap: 1rem;
+    }
 
-    // ── Server-aware Refresh ────────────────────────────────
-    function showScrapingBanner(show) {{
-      const b = document.getElementById('scraping-banner');
-      if (b) b.style.display = show ? 'flex' : 'none';
-    }}
+    .job-tags {
+      display: flex;
+      gap: 0.5rem;
+      margin-bottom: 1rem;
+      flex-wrap: wrap;
+    }
 
-    (function detectServer() {{
-      fetch('/api/status')
-        .then(r => r.json())
-        .then(data => {{
-          const btn = document.getElementById('refresh-btn');
-          if (btn) {{
-            btn.style.display = 'flex';
-            if (data.running) {{
-              btn.disabled = true;
-              btn.innerHTML = '<span class="spinner"></span> Scraping...';
-              showScrapingBanner(true);
-              pollStatus();
-            }}
-          }}
-        }})
-        .catch(() => {{}});  // Not served from server — hide button
-    }})();
+    .tag {
+      font-size: 0.7rem;
+      background: var(--tag-bg);
+      padding: 2px 8px;
+      border-radius: 4px;
+      color: var(--tag-color);
+    }
+    .source-tag { background: var(--source-tag-bg); color: var(--source-tag-color); }
 
-    // ── Mobile Sidebar ──────────────────────────────────────
-    function toggleSidebar() {{
-      const sidebar = document.getElementById('main-sidebar');
-      const backdrop = document.getElementById('sidebar-backdrop');
-      if (!sidebar) return;
-      const isOpen = sidebar.classList.toggle('open');
-      backdrop.classList.toggle('open', isOpen);
-      document.body.style.overflow = isOpen ? 'hidden' : '';
-    }}
+    .apply-link {
+      margin-top: auto;
+      font-size: 0.85rem;
+      color: var(--accent);
+      text-decoration: none;
+      font-weight: 500;
+      display: flex;
+      align-items: center;
+    }
+    .apply-link:hover { color: var(--accent-hover); }
 
-    function startRefresh() {{
-      const btn = document.getElementById('refresh-btn');
-      btn.disabled = true;
-      btn.innerHTML = '<span class="spinner"></span> Scraping...';
-      showScrapingBanner(true);
+    /* ── Mobile / Responsive ─────────────────────────────── */
+    .hamburger {
+      display: none;
+      background: var(--filter-btn-bg);
+      border: 1px solid var(--border);
+      color: var(--text-main);
+      width: 36px; height: 36px;
+      border-radius: 8px;
+      cursor: pointer;
+      font-size: 1.1rem;
+      align-items: center; justify-content: center;
+      transition: all 0.2s;
+      flex-shrink: 0;
+    }
+    .hamburger:hover { background: var(--filter-btn-hover); }
 
-      fetch('/api/refresh', {{ method: 'POST' }})
-        .then(r => r.json())
-        .then(data => {{
-          if (data.status === 'already_running') {{
-            // Already in progress, just poll
-          }}
-          pollStatus();
-        }})
-        .catch(err => {{
-          btn.innerHTML = '❌ Error';
-          setTimeout(() => {{
-            btn.innerHTML = '🔄 Refresh';
-            btn.disabled = false;
-          }}, 3000);
-        }});
-    }}
+    .sidebar-close {
+      display: none;
+      width: 100%;
+      background: transparent;
+      border: 1px solid var(--border);
+      color: var(--text-muted);
+      padding: 0.6rem;
+      border-radius: 6px;
+      cursor: pointer;
+      font-size: 0.85rem;
+      margin-bottom: 1rem;
+      transition: all 0.2s;
+    }
+    .sidebar-close:hover { background: var(--filter-btn-hover); color: var(--text-main); }
 
-    function pollStatus() {{
-      const poll = setInterval(() => {{
-        fetch('/api/status')
-          .then(r => r.json())
-          .then(data => {{
-            if (!data.running) {{
-              clearInterval(poll);
-              showScrapingBanner(false);
-              const btn = document.getElementById('refresh-btn');
-              if (data.last_error) {{
-                btn.innerHTML = '❌ Failed';
-                setTimeout(() => {{
-                  btn.innerHTML = '🔄 Refresh';
-                  btn.disabled = false;
-                }}, 3000);
-              }} else {{
-                btn.innerHTML = '✅ Done!';
-                setTimeout(() => window.location.reload(), 800);
-              }}
-            }}
-          }});
-      }}, 2000);
-    }}
-  </script>
-</body>
-</html>"""
+    .sidebar-backdrop {
+      display: none;
+      position: fixed;
+      inset: 0;
+      background: rgba(0,0,0,0.6);
+      z-index: 40;
+    }
 
-    with open(output_path, "w") as f:
-        f.write(html)
+    @media (max-width: 800px) {
+      .hamburger { display: flex; }
+      .sidebar-close { display: block; }
 
-    return output_path
+      .main-container { grid-template-columns: 1fr; }
 
+      .sidebar {
+        position: fixed;
+        top: 0; left: -280px;
+        width: 280px;
+        height: 100%;
+        z-index: 50;
+        transition: left 0.28s ease;
+        box-shadow: 4px 0 32px rgba(0,0,0,0.4);
+      }
+      .sidebar.open {
+        left: 0;
+      }
+      .sidebar-backdrop.open {
+        display: block;
+      }
 
-def _esc(text: str) -> str:
-    """HTML-escape a string."""
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-    )
+      .toolbar {
+        flex-wrap: wrap;
+        gap: 0.5rem;
+        padding: 0.6rem 1rem;
+      }
+      .toolbar-label { display: none; }
+      .toolbar-spacer { display: none; }
+      .search-box { min-width: 0; width: 100%; }
+      .search-wrapper { width: 100%; }
+      .toolbar-info { width: 100%; text-align: right; font-size: 0.75rem; }
+
+      .header { padding: 0.8rem 1rem; }
+      .brand h1 { font-size: 1rem; }
+      .subtitle { display: none; }
+      .stats { gap: 0.8rem; }
+      .stat-val { font-size: 0.95rem; }
+
+      .content-area { padding: 1rem; }
+      .job-grid { grid-template-columns: 1fr; }
+    }
+"""
@@ -3,8 +3,10 @@ Job Store — SQLite-based persistence for tracking seen jobs.
 Used by the scheduler to only surface new postings each scrape session.
 """
 
+import atexit
 import os
 import sqlite3
+import threading
 from datetime import datetime, timezone
 
 
@@ -14,44 +16,183 @@ DEFAULT_DB_PATH = os.path.join(
     "job_scout.db",
 )
 
+# Keys per "IN (...)" lookup — stays under SQLite's host-parameter limit
+# (999 on older builds)
+LOOKUP_CHUNK_SIZE = 900
+
+# Page cache limit (64 MB, in KiB as SQLite expects for a negative cache_size)
+# and the memory-mapped I/O window (256 MB). Both are upper bounds — SQLite
+# only uses as much as the database needs.
+CACHE_SIZE_KB = 64 * 1024
+MMAP_SIZE = 256 * 1024 * 1024
+
+
+# dedup_key is the primary key of a WITHOUT ROWID table: lookups and inserts
+# go straight to one B-tree, with no rowid table or separate index to update
+_CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        dedup_key TEXT PRIMARY KEY,
+        title TEXT,
+        company TEXT,
+        url TEXT,
+        first_seen_at TEXT NOT NULL
+    ) WITHOUT ROWID
+"""
+
 
 def _get_connection(db_path: str = None) -> sqlite3.Connection:
     """Get a SQLite connection, creating the database and directory if needed."""
     db_path = db_path or DEFAULT_DB_PATH
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
-    conn = sqlite3.connect(db_path)
+    # check_same_thread=False: a long-lived JobStore may be used from the
+    # server's background scrape thread
+    conn = sqlite3.connect(db_path, check_same_thread=False)
     conn.execute("PRAGMA journal_mode=WAL")  # Better concurrent access
+    conn.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; skips an fsync per commit
+    # Connections are long-lived, so a larger page cache and memory-mapped
+    # reads keep the dedup_key B-tree in memory between scrape cycles
+    conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KB}")
+    conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store=MEMORY")
     return conn
 
 
-def init_db(db_path: str = None) -> None:
-    """Create the seen_jobs table if it doesn't exist."""
-    conn = _get_connection(db_path)
-    try:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS seen_jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                dedup_key TEXT UNIQUE NOT NULL,
-                title TEXT,
-                company TEXT,
-                url TEXT,
-                first_seen_at TEXT NOT NULL
+def _make_dedup_key(job: dict) -> str:
+    """Build a unique key for a job (same logic as dedup agent)."""
+    # Strip each field, lowercase the joined key once — fewer temporary strings
+    # than lowercasing every field (strip() returns clean fields unchanged)
+    get = job.get
+    return f'{get("title", "").strip()}|{get("company", "").strip()}|{get("location", "").strip()}'.lower()
+
+
+class JobStore:
+    """
+    One open connection to the seen-jobs database.
+
+    The scheduler keeps a JobStore for its whole run so each cycle reuses the
+    connection; the module-level functions below share one per database path.
+    """
+
+    def __init__(self, db_path: str = None):
+        self.conn = _get_connection(db_path)
+
+    def __enter__(self) -> "JobStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def init(self) -> None:
+        """Create the seen_jobs table if it doesn't exist (migrating the old rowid schema)."""
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(seen_jobs)")]
+        with self.conn:
+            if "id" in columns:
+                # Pre-WITHOUT ROWID schema: an id primary key plus a UNIQUE
+                # dedup_key and a second, redundant index on it. Copied over in
+                # one explicit transaction (sqlite3 doesn't open one for DDL)
+                if not self.conn.in_transaction:
+                    self.conn.execute("BEGIN")
+                self.conn.execute(_CREATE_TABLE_SQL.format(table="seen_jobs_new"))
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO seen_jobs_new (dedup_key, title, company, url, first_seen_at) "
+                    "SELECT dedup_key, title, company, url, first_seen_at FROM seen_jobs ORDER BY id"
+                )
+                self.conn.execute("DROP TABLE seen_jobs")  # Drops idx_dedup_key with it
+                self.conn.execute("ALTER TABLE seen_jobs_new RENAME TO seen_jobs")
+            else:
+                self.conn.execute(_CREATE_TABLE_SQL.format(table="seen_jobs"))
+
+    def mark_seen(self, jobs: list[dict]) -> set[str]:
+        """Insert jobs into seen_jobs and return the keys that were newly inserted (see mark_seen())."""
+        if not jobs:
+            return set()
+
+        now = datetime.now(timezone.utc).isoformat()
+
+        # First job per key, in order — a later duplicate in the batch isn't new
+        by_key: dict[str, dict] = {}
+        for job in jobs:
+            by_key.setdefault(_make_dedup_key(job), job)
+
+        with self.conn:
+            # Take the write lock before the lookup, so no other writer can
+            # insert one of these keys between the SELECT and the INSERT
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN IMMEDIATE")
+            seen = self._seen_keys(list(by_key))
+            rows = [
+                (key, job.get("title", ""), job.get("company", ""), job.get("url", ""), now)
+                for key, job in by_key.items()
+                if key not in seen
+            ]
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO seen_jobs (dedup_key, title, company, url, first_seen_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
             )
-        """)
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_dedup_key ON seen_jobs(dedup_key)
-        """)
-        conn.commit()
-    finally:
-        conn.close()
 
+        return {row[0] for row in rows}
+
+    def get_new(self, jobs: list[dict]) -> list[dict]:
+        """Return the jobs not previously seen (see get_new_jobs())."""
+        if not jobs:
+            return []
+
+        keys = [_make_dedup_key(job) for job in jobs]
+        seen = self._seen_keys(list(dict.fromkeys(keys)))
+        return [job for job, key in zip(jobs, keys) if key not in seen]
+
+    def _seen_keys(self, keys: list[str]) -> set[str]:
+        """Return which of the (unique) keys are already in seen_jobs."""
+        # One query per chunk of keys instead of one per job
+        seen: set[str] = set()
+        for i in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+            chunk = keys[i : i + LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT dedup_key FROM seen_jobs WHERE dedup_key IN ({placeholders})", chunk
+            )
+            seen.update(row[0] for row in rows)
+        return seen
 
-def _make_dedup_key(job: dict) -> str:
-    """Build a unique key for a job (same logic as dedup agent)."""
-    title = job.get("title", "").lower().strip()
-    company = job.get("company", "").lower().strip()
-    location = job.get("location", "").lower().strip()
-    return f"{title}|{company}|{location}"
+    def seen_count(self) -> int:
+        """Return total number of seen jobs in the database."""
+        return self.conn.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0]
+
+
+# Stores behind the module-level functions, kept open per database path (the
+# server asks for the seen count on every status poll). The lock serializes
+# use of a shared connection across server threads.
+_shared_stores: dict[str, JobStore] = {}
+_shared_lock = threading.RLock()
+
+
+def _shared_store(db_path: str = None) -> JobStore:
+    """Return the long-lived store for db_path, opening it on first use (hold _shared_lock)."""
+    db_path = db_path or DEFAULT_DB_PATH
+    store = _shared_stores.get(db_path)
+    if store is None:
+        store = _shared_stores[db_path] = JobStore(db_path)
+    return store
+
+
+def close_shared_stores() -> None:
+    """Close the module-level functions' connections (registered to run at exit)."""
+    with _shared_lock:
+        for store in _shared_stores.values():
+            store.close()
+        _shared_stores.clear()
+
+
+atexit.register(close_shared_stores)
+
+
+def init_db(db_path: str = None) -> None:
+    """Create the seen_jobs table if it doesn't exist."""
+    with _shared_lock:
+        _shared_store(db_path).init()
 
 
 def mark_seen(jobs: list[dict], db_path: str = None) -> set[str]:
@@ -72,26 +213,8 @@ def mark_seen(jobs: list[dict], db_path: str = None) -> set[str]:
     if not jobs:
         return set()
 
-    conn = _get_connection(db_path)
-    now = datetime.now(timezone.utc).isoformat()
-    new_keys: set[str] = set()
-
-    try:
-        for job in jobs:
-            key = _make_dedup_key(job)
-            try:
-                conn.execute(
-                    "INSERT INTO seen_jobs (dedup_key, title, company, url, first_seen_at) VALUES (?, ?, ?, ?, ?)",
-                    (key, job.get("title", ""), job.get("company", ""), job.get("url", ""), now),
-                )
-                new_keys.add(key)  # Only added if INSERT succeeded (not a duplicate)
-            except sqlite3.IntegrityError:
-                pass  # Already existed in DB — not new
-
-        conn.commit()
-        return new_keys
-    finally:
-        conn.close()
+    with _shared_lock:
+        return _shared_store(db_path).mark_seen(jobs)
 
 
 def get_new_jobs(jobs: list[dict], db_path: str = None) -> list[dict]:
@@ -110,25 +233,11 @@ def get_new_jobs(jobs: list[dict], db_path: str = None) -> list[dict]:
     if not jobs:
         return []
 
-    conn = _get_connection(db_path)
-    try:
-        cursor = conn.cursor()
-        new_jobs = []
-        for job in jobs:
-            key = _make_dedup_key(job)
-            cursor.execute("SELECT 1 FROM seen_jobs WHERE dedup_key = ?", (key,))
-            if cursor.fetchone() is None:
-                new_jobs.append(job)
-        return new_jobs
-    finally:
-        conn.close()
+    with _shared_lock:
+        return _shared_store(db_path).get_new(jobs)
 
 
 def get_seen_count(db_path: str = None) -> int:
     """Return total number of seen jobs in the database."""
-    conn = _get_connection(db_path)
-    try:
-        cursor = conn.execute("SELECT COUNT(*) FROM seen_jobs")
-        return cursor.fetchone()[0]
-    finally:
-        conn.close()
+    with _shared_lock:
+        return _shared_store(db_path).seen_count()
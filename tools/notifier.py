@@ -4,45 +4,93 @@ Uses stdlib smtplib (no extra dependencies).
 """
 
 import smtplib
+from collections import defaultdict
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timezone
+from tools.html_report import _esc, _esc_attr
 
 
-def _build_html_email(new_jobs: list[dict]) -> str:
-    """Build a nicely formatted HTML email body for new job postings."""
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+# Recycle a pooled connection after this many messages (providers cap
+# messages per session)
+MAX_MESSAGES_PER_CONNECTION = 100
 
-    # Group jobs by company
-    by_company: dict[str, list[dict]] = {}
-    for job in new_jobs:
-        company = job.get("company", "Unknown")
-        by_company.setdefault(company, []).append(job)
 
-    rows = ""
-    for company, jobs in sorted(by_company.items()):
-        for job in jobs:
-            title = job.get("title", "Unknown")
-            location = job.get("location", "—")
-            url = job.get("url", "#")
-            source = job.get("source", "—")
-            link = f'<a href="{url}" style="color:#2563eb;text-decoration:none;">{title}</a>' if url else title
+class SMTPPool:
+    """
+    Keeps one logged-in SMTP connection open between sends, so scheduled runs
+    skip the TCP + TLS + AUTH handshake when the server is still connected.
 
-            rows += f"""
-            <tr style="border-bottom:1px solid #e5e7eb;">
-                <td style="padding:10px 12px;">{link}</td>
-                <td style="padding:10px 12px;">{company}</td>
-                <td style="padding:10px 12px;">{location}</td>
-                <td style="padding:10px 12px;color:#6b7280;font-size:13px;">{source}</td>
-            </tr>"""
+    The connection is checked with NOOP before reuse and redialled if the
+    server has dropped it (idle timeouts between cycles are common). Usable
+    as a context manager to close the connection after a batch of sends.
+    """
 
-    html = f"""
+    def __init__(self, host: str, port: int, user: str, password: str):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self._server: smtplib.SMTP | None = None
+        self._sent = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        print(f"[Notifier] Connecting to {self.host}:{self.port}...")
+        if self.port == 465:
+            server = smtplib.SMTP_SSL(self.host, self.port, timeout=30)
+        else:
+            server = smtplib.SMTP(self.host, self.port, timeout=30)
+            server.starttls()
+        server.login(self.user, self.password)
+        return server
+
+    def get_connection(self) -> smtplib.SMTP:
+        """Return a live, authenticated connection (reusing the open one if it still answers)."""
+        if self._server is not None and self._sent < MAX_MESSAGES_PER_CONNECTION:
+            try:
+                if self._server.noop()[0] == 250:
+                    return self._server
+            except smtplib.SMTPException:
+                pass
+        self.close()
+        self._server = self._connect()
+        self._sent = 0
+        return self._server
+
+    def sendmail(self, sender: str, recipients: list[str], message: str) -> None:
+        """Send one message, redialling once if the connection drops mid-send."""
+        try:
+            self.get_connection().sendmail(sender, recipients, message)
+        except smtplib.SMTPServerDisconnected:
+            self.close()
+            self.get_connection().sendmail(sender, recipients, message)
+        self._sent += 1
+
+    def close(self) -> None:
+        """Close the open connection, if any."""
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            pass  # Already gone
+        self._server = None
+
+    def __enter__(self) -> "SMTPPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# Email body; {rows} is filled with one <tr> per job
+_EMAIL_TEMPLATE = """
     <html>
     <body style="font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,sans-serif;background:#f9fafb;padding:20px;">
         <div style="max-width:700px;margin:0 auto;background:#fff;border-radius:10px;box-shadow:0 1px 3px rgba(0,0,0,0.1);overflow:hidden;">
             <div style="background:linear-gradient(135deg,#1e40af,#7c3aed);padding:24px 28px;">
                 <h1 style="color:#fff;margin:0;font-size:22px;">🔍 Job Scout — New Postings</h1>
-                <p style="color:#c7d2fe;margin:6px 0 0;font-size:14px;">{len(new_jobs)} new job(s) found • {now}</p>
+                <p style="color:#c7d2fe;margin:6px 0 0;font-size:14px;">{count} new job(s) found • {now}</p>
             </div>
             <table style="width:100%;border-collapse:collapse;font-size:14px;">
                 <thead>
@@ -64,17 +112,48 @@ def _build_html_email(new_jobs: list[dict]) -> str:
     </body>
     </html>
     """
-    return html
+
+
+def _build_html_email(new_jobs: list[dict]) -> str:
+    """Build a nicely formatted HTML email body for new job postings."""
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+
+    # Group jobs by company
+    by_company: defaultdict[str, list[dict]] = defaultdict(list)
+    for job in new_jobs:
+        by_company[job.get("company", "Unknown")].append(job)
+
+    rows = []
+    for company, jobs in sorted(by_company.items()):
+        # Scraped fields can contain markup characters — escape everything
+        company = _esc(company)
+        for job in jobs:
+            title = _esc(job.get("title", "Unknown"))
+            location = _esc(job.get("location", "—"))
+            url = _esc_attr(job.get("url", "#"))
+            source = _esc(job.get("source", "—"))
+            link = f'<a href="{url}" style="color:#2563eb;text-decoration:none;">{title}</a>' if url else title
+
+            rows.append(f"""
+            <tr style="border-bottom:1px solid #e5e7eb;">
+                <td style="padding:10px 12px;">{link}</td>
+                <td style="padding:10px 12px;">{company}</td>
+                <td style="padding:10px 12px;">{location}</td>
+                <td style="padding:10px 12px;color:#6b7280;font-size:13px;">{source}</td>
+            </tr>""")
+
+    return _EMAIL_TEMPLATE.format(count=len(new_jobs), now=now, rows="".join(rows))
 
 
 def send_email_notification(
     new_jobs: list[dict],
     recipient: str,
-    smtp_host: str,
-    smtp_port: int,
-    smtp_user: str,
-    smtp_password: str,
+    smtp_host: str = None,
+    smtp_port: int = None,
+    smtp_user: str = None,
+    smtp_password: str = None,
     sender: str = None,
+    pool: SMTPPool = None,
 ) -> bool:
     """
     Send an HTML email with new job postings.
@@ -86,7 +165,9 @@ def send_email_notification(
         smtp_port: SMTP port (587 for TLS, 465 for SSL).
         smtp_user: SMTP username.
         smtp_password: SMTP password or app-specific password.
-        sender: Sender email address (defaults to smtp_user).
+        sender: Sender email address (defaults to the SMTP user).
+        pool: Reuse this pool's connection instead of the smtp_* arguments
+            (the connection is left open for the next send).
 
     Returns:
         True if email was sent successfully, False otherwise.
@@ -95,7 +176,10 @@ def send_email_notification(
         print("[Notifier] No new jobs to email.")
         return False
 
-    sender = sender or smtp_user
+    owns_pool = pool is None
+    if owns_pool:
+        pool = SMTPPool(smtp_host, smtp_port, smtp_user, smtp_password)
+    sender = sender or pool.user
 
     try:
         msg = MIMEMultipart("alternative")
@@ -114,22 +198,16 @@ def send_email_notification(
         msg.attach(MIMEText(plain_text, "plain"))
         msg.attach(MIMEText(_build_html_email(new_jobs), "html"))
 
-        # Connect and send
-        print(f"[Notifier] Connecting to {smtp_host}:{smtp_port}...")
-
-        if smtp_port == 465:
-            server = smtplib.SMTP_SSL(smtp_host, smtp_port, timeout=30)
-        else:
-            server = smtplib.SMTP(smtp_host, smtp_port, timeout=30)
-            server.starttls()
-
-        server.login(smtp_user, smtp_password)
-        server.sendmail(sender, [recipient], msg.as_string())
-        server.quit()
+        pool.sendmail(sender, [recipient], msg.as_string())
 
         print(f"[Notifier] ✅ Email sent to {recipient} ({len(new_jobs)} jobs)")
         return True
 
     except Exception as e:
         print(f"[Notifier] ❌ Failed to send email: {e}")
+        pool.close()
         return False
+
+    finally:
+        if owns_pool:
+            pool.close()
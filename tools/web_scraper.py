@@ -3,8 +3,12 @@ Web Scraper Tool — fetches raw HTML from URLs.
 Uses httpx with proper headers, timeouts, and retry logic.
 """
 
+import atexit
+import random
+import threading
 import httpx
 import time
+from concurrent.futures import ThreadPoolExecutor
 from config.settings import settings
 
 
@@ -22,6 +26,89 @@ DEFAULT_HEADERS = {
 }
 
 
+# Max page fetches in flight at once in fetch_pages()
+MAX_FETCH_WORKERS = 16
+
+
+# Shared keep-alive connection pool for page fetches (created on first use)
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared page-fetching client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    headers=DEFAULT_HEADERS,
+                    follow_redirects=True,
+                    verify=False,  # Skip SSL verification (common macOS Python issue)
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60),
+                )
+    return _client
+
+
+def close_client() -> None:
+    """Close the shared page-fetching client (registered to run at interpreter exit)."""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+atexit.register(close_client)
+
+
+# Successful page fetches keyed by URL: url -> (fetched_at, result). Only
+# used when settings.page_cache_ttl > 0; eviction is least-recently-used.
+_page_cache: dict[str, tuple[float, dict]] = {}
+_page_cache_lock = threading.Lock()
+MAX_CACHED_PAGES = 256
+
+
+def _get_cached_page(url: str) -> dict | None:
+    """Return a copy of url's cached result if it is still fresh, else None."""
+    with _page_cache_lock:
+        entry = _page_cache.pop(url, None)
+        if entry is None or time.monotonic() - entry[0] > settings.page_cache_ttl:
+            return None
+        _page_cache[url] = entry  # Mark most recently used
+        return dict(entry[1])
+
+
+def _store_page(url: str, result: dict) -> None:
+    """Cache a successful fetch result, evicting the least recently used page if full."""
+    with _page_cache_lock:
+        _page_cache.pop(url, None)
+        if len(_page_cache) >= MAX_CACHED_PAGES:
+            del _page_cache[next(iter(_page_cache))]
+        _page_cache[url] = (time.monotonic(), dict(result))
+
+
+def clear_page_cache() -> None:
+    """Forget all cached pages."""
+    with _page_cache_lock:
+        _page_cache.clear()
+
+
+def _backoff(attempt: int, max_retries: int, deadline: float) -> bool:
+    """
+    Sleep before the next attempt and return True, or return False if there
+    are no attempts left or the fetch's deadline has passed.
+    """
+    if attempt >= max_retries - 1:
+        return False
+    # Jittered so pages that failed together don't all retry in the same instant
+    delay = min(2 ** attempt * random.uniform(0.5, 1.5), deadline - time.monotonic())
+    if delay <= 0:
+        return False
+    time.sleep(delay)
+    return True
+
+
 def fetch_page(url: str, timeout: int = None, max_retries: int = None) -> dict:
     """
     Fetch a web page and return its HTML content.
@@ -38,45 +125,54 @@ def fetch_page(url: str, timeout: int = None, max_retries: int = None) -> dict:
             - status_code (int): HTTP status code (0 on connection error).
             - error (str): Error message if failed (empty string on success).
             - url (str): The URL that was fetched.
+
+    Successful results are reused for settings.page_cache_ttl seconds.
     """
+    if settings.page_cache_ttl > 0:
+        cached = _get_cached_page(url)
+        if cached is not None:
+            return cached
+        result = _fetch(url, timeout, max_retries)
+        if result["success"]:
+            _store_page(url, result)
+        return result
+    return _fetch(url, timeout, max_retries)
+
+
+def _fetch(url: str, timeout: int | None, max_retries: int | None) -> dict:
+    """fetch_page without the page cache."""
     timeout = timeout or settings.request_timeout
     max_retries = max_retries or settings.max_retries
+    # Bound the whole fetch (requests + backoff), not just each request
+    deadline = time.monotonic() + timeout * max_retries
 
     for attempt in range(max_retries):
         try:
-            with httpx.Client(
-                headers=DEFAULT_HEADERS,
-                timeout=timeout,
-                follow_redirects=True,
-                verify=False,  # Skip SSL verification (common macOS Python issue)
-            ) as client:
-                response = client.get(url)
-
-                if response.status_code == 200:
-                    return {
-                        "success": True,
-                        "html": response.text,
-                        "status_code": response.status_code,
-                        "error": "",
-                        "url": url,
-                    }
-                else:
-                    error_msg = f"HTTP {response.status_code} for {url}"
-                    if attempt < max_retries - 1:
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    return {
-                        "success": False,
-                        "html": "",
-                        "status_code": response.status_code,
-                        "error": error_msg,
-                        "url": url,
-                    }
+            response = _get_client().get(url, timeout=timeout)
+
+            if response.status_code == 200:
+                return {
+                    "success": True,
+                    "html": response.text,
+                    "status_code": response.status_code,
+                    "error": "",
+                    "url": url,
+                }
+            else:
+                error_msg = f"HTTP {response.status_code} for {url}"
+                if _backoff(attempt, max_retries, deadline):
+                    continue
+                return {
+                    "success": False,
+                    "html": "",
+                    "status_code": response.status_code,
+                    "error": error_msg,
+                    "url": url,
+                }
 
         except httpx.TimeoutException:
             error_msg = f"Timeout after {timeout}s for {url}"
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
+            if _backoff(attempt, max_retries, deadline):
                 continue
             return {
                 "success": False,
@@ -88,8 +184,7 @@ def fetch_page(url: str, timeout: int = None, max_retries: int = None) -> dict:
 
         except httpx.HTTPError as e:
             error_msg = f"HTTP error for {url}: {str(e)}"
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
+            if _backoff(attempt, max_retries, deadline):
                 continue
             return {
                 "success": False,
@@ -107,3 +202,22 @@ def fetch_page(url: str, timeout: int = None, max_retries: int = None) -> dict:
         "error": f"All {max_retries} retries exhausted for {url}",
         "url": url,
     }
+
+
+def fetch_pages(urls: list[str], timeout: int = None, max_retries: int = None) -> list[dict]:
+    """
+    Fetch several pages concurrently over the shared client.
+
+    Each URL goes through fetch_page() (same retry/backoff), so a slow or
+    failing page only delays its own result. Results are returned in the
+    same order as urls.
+    """
+    if not urls:
+        return []
+
+    def fetch(url: str) -> dict:
+        return fetch_page(url, timeout=timeout, max_retries=max_retries)
+
+    workers = min(MAX_FETCH_WORKERS, len(urls))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fetch, urls))